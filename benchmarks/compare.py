@@ -0,0 +1,56 @@
+"""
+Compares two benchmark result files (see benchmarks/conftest.py).
+
+    poetry run python -m benchmarks.compare benchmarks/results/abc123.json benchmarks/results/def456.json
+"""
+import argparse
+import json
+import sys
+
+# Metric per result kind and whether higher is better
+METRICS = {
+    "micro": (("median_us", False), ("alloc_peak_bytes", False)),
+    "e2e": (("fps", True), ("latency_p95_ms", False), ("alloc_bytes_per_frame", False)),
+}
+
+
+def compare(before, after, threshold):
+    """Yields (name, metric, before, after, change, regressed)."""
+    for name, new in sorted(after["results"].items()):
+        old = before["results"].get(name)
+        if old is None or old.get("kind") != new.get("kind"):
+            continue
+        for metric, higher_is_better in METRICS.get(new["kind"], ()):
+            a, b = old.get(metric), new.get(metric)
+            if a is None or b is None:
+                continue
+            change = (b - a) / a if a else 0.0
+            worse = -change if higher_is_better else change
+            yield name, metric, a, b, change, worse > threshold
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression.")
+    parser.add_argument("--fail", action="store_true", help="Exit with status 1 when something regressed.")
+    args = parser.parse_args(argv)
+
+    with open(args.before, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(args.after, encoding="utf-8") as f:
+        after = json.load(f)
+
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    regressions = 0
+    for name, metric, a, b, change, regressed in compare(before, after, args.threshold):
+        regressions += regressed
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<40} {metric:<22} {a:>12.1f} {b:>12.1f} {change:>+8.1%}{flag}")
+    if args.fail and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Minimal benchmark harness for pytest (no plugin needed).
+
+    poetry run pytest benchmarks -q
+    poetry run pytest benchmarks -q --bench-json before.json
+    poetry run python -m benchmarks.compare before.json after.json
+
+Every benchmark adds one entry to the JSON written at the end of the run
+(default: benchmarks/results/<commit>.json).
+"""
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+_RESULTS = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-json", default=None, help="Where to write the results (JSON).")
+    group.addoption("--bench-seconds", type=float, default=0.5, help="Minimum timed run per micro-benchmark.")
+    group.addoption("--bench-e2e-seconds", type=float, default=3.0, help="Duration of each end-to-end run.")
+
+
+def _commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(__file__),
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+class Bench:
+    """
+    `bench(name, fn)` calls fn() repeatedly for at least --bench-seconds
+    and records per-call time (mean/median/p95, ns) and the peak memory
+    allocated during one call (tracemalloc, measured separately so it does
+    not slow down the timed calls; it sees Python and numpy buffers, not
+    Qt's own, e.g. QImage pixels).
+    """
+
+    def __init__(self, min_seconds):
+        self.min_seconds = min_seconds
+
+    def __call__(self, name, fn, warmup=3, **extra):
+        for _ in range(warmup):
+            fn()
+
+        samples = []
+        deadline = time.perf_counter() + self.min_seconds
+        while time.perf_counter() < deadline or len(samples) < 5:
+            t0 = time.perf_counter_ns()
+            fn()
+            samples.append(time.perf_counter_ns() - t0)
+
+        tracemalloc.start()
+        try:
+            fn()  # first traced call may allocate caches
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn()
+            alloc_peak = tracemalloc.get_traced_memory()[1] - base
+        finally:
+            tracemalloc.stop()
+
+        samples.sort()
+        result = {
+            "kind": "micro",
+            "calls": len(samples),
+            "mean_us": statistics.fmean(samples) / 1000.0,
+            "median_us": _percentile(samples, 0.50) / 1000.0,
+            "p95_us": _percentile(samples, 0.95) / 1000.0,
+            "alloc_peak_bytes": alloc_peak,
+            **extra,
+        }
+        record(name, result)
+        return result
+
+
+def record(name, result):
+    _RESULTS[name] = result
+
+
+@pytest.fixture
+def bench(request):
+    return Bench(request.config.getoption("--bench-seconds"))
+
+
+@pytest.fixture
+def e2e_seconds(request):
+    return request.config.getoption("--bench-e2e-seconds")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _RESULTS:
+        return
+    commit = _commit()
+    path = session.config.getoption("--bench-json")
+    if path is None:
+        directory = os.path.join(os.path.dirname(__file__), "results")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{commit or 'local'}.json")
+
+    import cv2
+    import numpy
+
+    data = {
+        "commit": commit,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "opencv": cv2.__version__,
+        "results": dict(sorted(_RESULTS.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    session.config._bench_json_path = path
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+    tr = terminalreporter
+    tr.section("benchmarks")
+    for name, r in sorted(_RESULTS.items()):
+        if r["kind"] == "micro":
+            tr.write_line(f"{name:<40} {r['median_us']:>10.1f} us  p95 {r['p95_us']:>9.1f} us"
+                          f"  alloc {r['alloc_peak_bytes'] / 1024:>8.1f} KiB")
+        else:
+            tr.write_line(f"{name:<40} {r['fps']:>8.1f} fps  p50 {r['latency_p50_ms']:>6.1f} ms"
+                          f"  p95 {r['latency_p95_ms']:>6.1f} ms  alloc/frame {r['alloc_bytes_per_frame'] / 1024:>7.1f} KiB")
+    path = getattr(tr.config, "_bench_json_path", None)
+    if path:
+        tr.write_line(f"results: {path}")
@@ -0,0 +1,106 @@
+"""
+Load test: N capture + inference sessions at once, no camera and no model.
+
+Each session opens its own source through the capture broker (default: a
+paced synthetic camera) and runs core.inference.InferenceLoop with a
+StubDetector, the same wiring InferenceSession uses.
+
+    poetry run python -m benchmarks.load_sessions --sessions 8 --seconds 20
+    poetry run python -m benchmarks.load_sessions --source "replay:///data/clip.mp4?loop=1" --sessions 4
+"""
+import argparse
+import json
+import threading
+import time
+
+from jmodel_desktop.src.core.broker import capture_broker
+from jmodel_desktop.src.core.frames import FrameRing, SharedFrame
+from jmodel_desktop.src.core.inference import InferenceLoop
+from jmodel_desktop.src.core.process_stats import ProcessSampler
+from jmodel_desktop.src.core.stats import StatsAggregator
+
+from .synthetic import StubDetector
+
+
+class _Session:
+    def __init__(self, source, latency_s, infer_fps):
+        self.source = source
+        self.shared = SharedFrame()
+        self.stats = StatsAggregator()
+        self.captured = FrameRing(256)  # (seq, t) of frames handed to inference
+        self.loop = InferenceLoop(
+            [("stub", "detect")], self.shared,
+            infer_fps=infer_fps,
+            on_result=self._on_result,
+            stats=self.stats,
+            group=StubDetector(latency_s),
+        )
+        self.thread = threading.Thread(target=self.loop.run, name=f"inference {source}", daemon=True)
+        self.sub = None
+
+    def _on_frame(self, seq, frame):
+        now = time.monotonic()
+        self.captured.push(seq, None, now)
+        self.stats.stage("capture").record(t=now)
+        self.shared.set(frame, seq)
+
+    def _on_result(self, frame, overlay):
+        entry = self.captured.find(overlay.seq)
+        if entry is not None:
+            self.stats.stage("result").record(time.monotonic() - entry[1])
+
+    def start(self, width, height, fps):
+        self.thread.start()
+        self.sub = capture_broker().subscribe(
+            self.source, name="load", on_frame=self._on_frame, width=width, height=height, fps=fps,
+        )
+
+    def stop(self):
+        capture_broker().unsubscribe(self.sub)
+        self.loop.stop()
+        self.thread.join(2.0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--source", default="synthetic://", help="core.sources URI; '?id=N' is added per session")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--infer-fps", type=float, default=15.0)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub detector latency")
+    parser.add_argument("--json", default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    sep = "&" if "?" in args.source else "?"
+    sessions = [
+        _Session(f"{args.source}{sep}id={i}", args.latency_ms / 1000.0, args.infer_fps)
+        for i in range(args.sessions)
+    ]
+    process = ProcessSampler()
+    for s in sessions:
+        s.start(args.width, args.height, args.fps)
+    time.sleep(args.seconds)
+    proc = process.sample()
+    snapshots = [(s.source, s.stats.snapshot()) for s in sessions]
+    for s in sessions:
+        s.stop()
+
+    print(f"{'session':<40} {'capture':>8} {'infer':>8} {'p50 ms':>8} {'p95 ms':>8} {'drops':>6}")
+    for source, snap in snapshots:
+        result = snap.get("result", {})
+        p50 = result.get("p50_ms")
+        p95 = result.get("p95_ms")
+        print(f"{source:<40} {snap['capture']['fps']:>8.1f} {snap['infer']['fps']:>8.1f} "
+              f"{p50 or 0:>8.1f} {p95 or 0:>8.1f} {snap['infer']['drops']:>6}")
+    print(f"process: cpu {proc['cpu_percent']:.0f} %  rss {proc['rss_mb']:.0f} MB  threads {proc['threads']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "process": proc, "sessions": dict(snapshots)}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Soak test: the full GUI pipeline for hours, watching for leaks and drift.
+
+Drives the real path a user does: RunModelController's "GStream" click
+opens a video inference window (VideoInferenceController + the shared
+InferenceSession, QImage/QPixmap per frame); every --cycle-seconds that
+window is closed and the button clicked again. Frames come from a
+synthetic source and, unless --model is given, detections from the
+StubDetector, so it runs on any box.
+
+Every --sample-seconds it records RSS, thread count, live widgets,
+tracemalloc growth (plus, now and then, the top allocators against the
+post-warm-up baseline) and the result latency percentiles of that
+interval, each after a full gc.collect(). At the end it fails
+(exit 1) when growth or drift after warm-up exceeds the thresholds.
+
+    QT_QPA_PLATFORM=offscreen poetry run python -m benchmarks.soak --hours 4 --json soak.jsonl
+    QT_QPA_PLATFORM=offscreen poetry run python -m benchmarks.soak --hours 0.05 --warmup-seconds 30 --sample-seconds 10
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+import weakref
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+from jmodel_desktop.src.core.frame_trace import LatencyHistogram
+from jmodel_desktop.src.core.process_stats import ProcessSampler
+
+from .synthetic import StubDetector
+
+STUB_MODEL = "stub-detector.pt"
+
+
+def _slope_per_hour(points):
+    """Least-squares slope of [(t_s, value)], in value per hour."""
+    if len(points) < 3:
+        return 0.0
+    n = len(points)
+    mt = sum(t for t, _ in points) / n
+    mv = sum(v for _, v in points) / n
+    var = sum((t - mt) ** 2 for t, _ in points)
+    if var <= 0:
+        return 0.0
+    return sum((t - mt) * (v - mv) for t, v in points) / var * 3600.0
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2] if values else None
+
+
+class Soak:
+    def __init__(self, args):
+        from jmodel_desktop.src.controllers.run_model_controller import RunModelController
+        from jmodel_desktop.src.controllers.session_manager import session_manager
+        from jmodel_desktop.src.utils.load_windows import create_window
+
+        self.args = args
+        self.started = time.monotonic()
+        self.process = ProcessSampler()
+        self.samples = []
+        self.errors = []
+        self.cycles = 0
+        self.images = {"video": 0, "infer": 0}
+        self.baseline = None  # (traced bytes, tracemalloc snapshot) at the end of warm-up
+        self._since_snapshot = 0
+        self._result_counts = weakref.WeakKeyDictionary()  # StageStats -> bin counts already seen
+        self._latency = LatencyHistogram()  # results since the last sample
+        self._watched = weakref.WeakSet()
+
+        manager = session_manager()
+        manager.grace_s = args.grace
+        if args.model is None:
+            manager.group_factory = lambda models: StubDetector(args.latency_ms / 1000.0, args.detections)
+        manager.sessions_changed.connect(self._watch_sessions)
+
+        self.window = create_window("run_model_window")
+        self.controller = RunModelController(self.window)
+        self._select(self.controller.combo_model, args.model or STUB_MODEL)
+        self._select(self.controller.combo_device, args.source)
+
+    @staticmethod
+    def _select(combo, value):
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItem(value, value)
+        combo.setEnabled(True)
+        combo.setCurrentIndex(0)
+        combo.blockSignals(False)
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    # ---------- Pipeline ----------
+    def _watch_sessions(self):
+        from jmodel_desktop.src.controllers.session_manager import session_manager
+
+        for session in session_manager().sessions():
+            if session in self._watched:
+                continue
+            self._watched.add(session)
+            session.video_qimage.connect(lambda _img: self._count("video"))
+            session.infer_qimage.connect(lambda _img: self._count("infer"))
+            session.error.connect(self._on_error)
+            stats = session.stats
+            session.stopped.connect(lambda: self._harvest(stats))  # results of a closed session still count
+
+    def _count(self, path):
+        self.images[path] += 1
+
+    def _on_error(self, msg):
+        self.errors.append((round(self.elapsed(), 1), msg))
+
+    def open_window(self):
+        self.controller.on_gstream_clicked()
+        self.cycles += 1
+
+    def cycle(self):
+        child = getattr(self.controller, "_video_window", None)
+        if child is not None:
+            child.close()  # WA_DeleteOnClose: window and controller go away
+        self.open_window()
+
+    # ---------- Sampling ----------
+    def _harvest(self, stats):
+        stage = stats.stage("result")
+        counts, _, _ = stage.histogram_snapshot()
+        seen = self._result_counts.get(stage, [0] * len(counts))
+        for i, (now, before) in enumerate(zip(counts, seen)):
+            self._latency.counts[i] += now - before
+            self._latency.total += now - before
+        self._result_counts[stage] = counts
+
+    def _interval_latency(self):
+        """Result latency of the frames since the last sample, across every session."""
+        from jmodel_desktop.src.controllers.session_manager import session_manager
+
+        for session in session_manager().sessions():
+            self._harvest(session.stats)
+        latency, self._latency = self._latency, LatencyHistogram()
+        return latency.to_dict()
+
+    def _allocators(self, final=False):
+        """
+        Traced-memory growth since warm-up (cheap, every sample) and the top
+        allocators (a full snapshot, which holds the GIL for a while, so only
+        every --snapshot-every samples and at the end).
+        """
+        if not tracemalloc.is_tracing():
+            return None, []
+        traced = tracemalloc.get_traced_memory()[0]
+        if self.baseline is None:
+            if self.elapsed() >= self.args.warmup_seconds:
+                self.baseline = (traced, self._snapshot())
+            return 0.0, []
+        self._since_snapshot += 1
+        growth = (traced - self.baseline[0]) / 1e6
+        if not final and self._since_snapshot < self.args.snapshot_every:
+            return growth, []
+        self._since_snapshot = 0
+        diff = self._snapshot().compare_to(self.baseline[1], "lineno")
+        top = [
+            {"where": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+             "size_diff_kb": round(d.size_diff / 1024, 1), "count_diff": d.count_diff}
+            for d in sorted(diff, key=lambda d: d.size_diff, reverse=True)[:self.args.top]
+            if d.size_diff > 0
+        ]
+        return growth, top
+
+    @staticmethod
+    def _snapshot():
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    def sample(self, final=False):
+        # Frames only kept alive by reference cycles would otherwise count
+        # as growth (or not) depending on when the cyclic GC last ran; this
+        # also covers the warm-up baseline, taken by the first sample after it
+        gc.collect()
+        proc = self.process.sample()
+        latency = self._interval_latency()
+        traced_growth, top = self._allocators(final)
+        sample = {
+            "t_s": round(self.elapsed(), 1),
+            "rss_mb": round(proc["rss_mb"], 1),
+            "cpu_percent": round(proc["cpu_percent"], 1),
+            "threads": proc["threads"],
+            "widgets": len(QApplication.allWidgets()),
+            "cycles": self.cycles,
+            "video_images": self.images["video"],
+            "infer_images": self.images["infer"],
+            "results": latency["count"],
+            "latency_p50_ms": latency["p50_ms"],
+            "latency_p95_ms": latency["p95_ms"],
+            "latency_p99_ms": latency["p99_ms"],
+            "traced_growth_mb": None if traced_growth is None else round(traced_growth, 2),
+            "top_allocators": top,
+        }
+        self.images = {"video": 0, "infer": 0}
+        self.samples.append(sample)
+        print(f"{sample['t_s']:>8.0f} s  rss {sample['rss_mb']:>7.1f} MB  threads {sample['threads']:>3}"
+              f"  widgets {sample['widgets']:>4}  traced +{sample['traced_growth_mb'] or 0:>6.2f} MB"
+              f"  results {sample['results']:>5}  p95 {sample['latency_p95_ms'] or 0:>6.1f} ms", flush=True)
+        if self.args.json:
+            with open(self.args.json, "a", encoding="utf-8") as f:
+                f.write(json.dumps(sample) + "\n")
+
+    # ---------- Verdict ----------
+    def verdict(self):
+        """List of failure messages (empty: pass) and the summary they are based on."""
+        a = self.args
+        steady = [s for s in self.samples if s["t_s"] >= a.warmup_seconds]
+        failures = []
+        if self.errors:
+            failures.append(f"{len(self.errors)} pipeline error(s), first: {self.errors[0][1]}")
+        if len(steady) < 3:
+            failures.append(f"only {len(steady)} samples after warm-up; run longer or sample more often")
+            return failures, {}
+
+        k = max(1, len(steady) // 10)  # first/last 10 % of the steady samples
+        head, tail = steady[:k], steady[-k:]
+        summary = {
+            "steady_samples": len(steady),
+            "rss_growth_mb": _median(s["rss_mb"] for s in tail) - _median(s["rss_mb"] for s in head),
+            "rss_slope_mb_per_h": _slope_per_hour([(s["t_s"], s["rss_mb"]) for s in steady]),
+            # Medians: windows being torn down show up as transient widgets/threads
+            "thread_growth": _median(s["threads"] for s in tail) - _median(s["threads"] for s in head),
+            "widget_growth": _median(s["widgets"] for s in tail) - _median(s["widgets"] for s in head),
+            "traced_growth_mb": None,
+        }
+        if tail[-1]["traced_growth_mb"] is not None:
+            # Medians again: frames in flight alone swing the traced total by several MB
+            summary["traced_growth_mb"] = (_median(s["traced_growth_mb"] for s in tail)
+                                           - _median(s["traced_growth_mb"] for s in head))
+        p95_head = _median(s["latency_p95_ms"] for s in head if s["latency_p95_ms"] is not None)
+        p95_tail = _median(s["latency_p95_ms"] for s in tail if s["latency_p95_ms"] is not None)
+        summary["latency_p95_drift"] = (p95_tail / p95_head - 1.0) if p95_head and p95_tail else None
+        if not any(s["results"] for s in tail):
+            failures.append("no inference results at the end of the run")
+
+        if summary["rss_growth_mb"] > a.max_rss_growth_mb:
+            failures.append(f"RSS grew {summary['rss_growth_mb']:.1f} MB (limit {a.max_rss_growth_mb})")
+        span_h = (steady[-1]["t_s"] - steady[0]["t_s"]) / 3600.0
+        if span_h >= 0.25 and summary["rss_slope_mb_per_h"] > a.max_rss_slope:
+            failures.append(f"RSS trend {summary['rss_slope_mb_per_h']:.1f} MB/h (limit {a.max_rss_slope})")
+        if summary["thread_growth"] > a.max_thread_growth:
+            failures.append(f"threads grew by {summary['thread_growth']} (limit {a.max_thread_growth})")
+        if summary["widget_growth"] > a.max_widget_growth:
+            failures.append(f"live widgets grew by {summary['widget_growth']} (limit {a.max_widget_growth})")
+        if summary["traced_growth_mb"] is not None and summary["traced_growth_mb"] > a.max_traced_growth_mb:
+            failures.append(f"Python allocations grew {summary['traced_growth_mb']:.1f} MB"
+                            f" (limit {a.max_traced_growth_mb}); see top_allocators")
+        if summary["latency_p95_drift"] is not None and summary["latency_p95_drift"] > a.max_latency_drift:
+            failures.append(f"latency p95 drifted {summary['latency_p95_drift'] * 100:.0f} %"
+                            f" ({p95_head:.1f} -> {p95_tail:.1f} ms, limit {a.max_latency_drift * 100:.0f} %)")
+        return failures, summary
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--source", default="synthetic://1280x720@30")
+    parser.add_argument("--model", default=None, help="real model path; default: StubDetector")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub detector latency")
+    parser.add_argument("--detections", type=int, default=10, help="stub detections per frame")
+    parser.add_argument("--cycle-seconds", type=float, default=60.0,
+                        help="close the window and click again this often (0: one window for the whole run)")
+    parser.add_argument("--grace", type=float, default=0.0,
+                        help="session grace period; 0 rebuilds the session on every click")
+    parser.add_argument("--sample-seconds", type=float, default=60.0)
+    parser.add_argument("--warmup-seconds", type=float, default=300.0, help="excluded from the thresholds")
+    parser.add_argument("--top", type=int, default=10, help="top allocators kept per sample")
+    parser.add_argument("--snapshot-every", type=int, default=30,
+                        help="samples between top-allocator snapshots (each stalls the process briefly)")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip allocation tracing (its overhead)")
+    parser.add_argument("--json", default=None, help="append one JSON line per sample, then the verdict")
+
+    limits = parser.add_argument_group("thresholds (after warm-up)")
+    limits.add_argument("--max-rss-growth-mb", type=float, default=64.0)
+    limits.add_argument("--max-rss-slope", type=float, default=8.0, help="MB/h, checked on runs over 15 min")
+    limits.add_argument("--max-traced-growth-mb", type=float, default=16.0)
+    limits.add_argument("--max-thread-growth", type=int, default=2)
+    limits.add_argument("--max-widget-growth", type=int, default=20)
+    limits.add_argument("--max-latency-drift", type=float, default=0.5, help="p95, fraction of the start value")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    soak = Soak(args)
+    soak.open_window()
+    if not args.no_tracemalloc:
+        tracemalloc.start()  # after the imports: fewer traces, faster snapshots
+
+    timers = []
+
+    def every(seconds, fn):
+        timer = QTimer()
+        timer.setInterval(int(seconds * 1000))
+        timer.timeout.connect(fn)
+        timer.start()
+        timers.append(timer)
+
+    def finish():
+        for timer in timers:
+            timer.stop()
+        soak.sample(final=True)  # while the pipeline is still running
+        app.quit()
+
+    every(args.sample_seconds, soak.sample)
+    if args.cycle_seconds > 0:
+        every(args.cycle_seconds, soak.cycle)
+    QTimer.singleShot(int(args.hours * 3600 * 1000), finish)
+    app.exec()
+
+    failures, summary = soak.verdict()
+    print(json.dumps(summary, indent=2))
+    if args.json:
+        with open(args.json, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"verdict": "fail" if failures else "pass", "failures": failures,
+                                "errors": soak.errors, **summary}) + "\n")
+    for msg in failures:
+        print(f"FAIL: {msg}")
+    print("soak: " + ("FAIL" if failures else "PASS"))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Camera-free, model-free inputs for the benchmarks: deterministic frames
+(the core.sources pattern) and a detector stub with a configurable latency.
+"""
+import time
+
+import numpy as np
+
+from jmodel_desktop.src.core.overlay import Overlay
+from jmodel_desktop.src.core.sources import synthetic_frame
+
+
+def synthetic_frames(count=None, width=1280, height=720, pool=32):
+    """
+    Yields `count` frames (forever when None). Frames come from a pool
+    generated up front, so the generator costs nothing per frame.
+    """
+    frames = [synthetic_frame(i, width, height) for i in range(pool)]
+    i = 0
+    while count is None or i < count:
+        yield frames[i % pool]
+        i += 1
+
+
+def stub_overlay(detections=10, seq=None):
+    """`detections` boxes laid out on a grid, normalized like a real result."""
+    n = detections
+    cols = max(1, int(np.ceil(np.sqrt(n))))
+    idx = np.arange(n, dtype=np.float32)
+    x1 = (idx % cols) / cols
+    y1 = (idx // cols) / cols
+    boxes = np.stack([x1, y1, x1 + 0.8 / cols, y1 + 0.8 / cols], axis=1).astype(np.float32)
+    return Overlay(
+        boxes=boxes,
+        classes=(np.arange(n) % 3).astype(np.int32),
+        confs=np.full((n,), 0.9, dtype=np.float32),
+        names={0: "person", 1: "car", 2: "dog"},
+        seq=seq,
+    )
+
+
+class StubDetector:
+    """
+    Stands in for core.model_group.ModelGroup (same load/infer/close
+    interface). `latency_s` is spent sleeping, like a GPU wait that releases
+    the GIL; `busy=True` spins instead, like CPU-bound inference.
+    """
+
+    def __init__(self, latency_s=0.02, detections=10, busy=False):
+        self.latency_s = latency_s
+        self.detections = detections
+        self.busy = busy
+        self.calls = 0
+
+    def load(self):
+        pass
+
+    def close(self):
+        pass
+
+    def memory_bytes(self):
+        return [0]
+
+    def infer(self, frame, seq=None, trace=None):
+        self.calls += 1
+        if self.busy:
+            end = time.perf_counter() + self.latency_s
+            while time.perf_counter() < end:
+                pass
+        elif self.latency_s:
+            time.sleep(self.latency_s)
+        return stub_overlay(self.detections, seq=seq)
@@ -0,0 +1,130 @@
+"""
+End-to-end frame path without camera or model: a synthetic producer feeds
+a SharedFrame the way the broker does, core.inference.InferenceLoop runs a
+StubDetector on it, and each result is composited like InferenceWorker
+does for the inference view.
+"""
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from jmodel_desktop.src.controllers.inference_session import bgr_to_qimage
+from jmodel_desktop.src.core.frames import SharedFrame, resize_to_fit
+from jmodel_desktop.src.core.inference import InferenceLoop
+from jmodel_desktop.src.core.overlay import render_overlay
+from jmodel_desktop.src.core.stats import StatsAggregator
+
+from .conftest import _percentile, record
+from .synthetic import StubDetector, synthetic_frames
+
+VIEW = (960, 540)
+
+SCENARIOS = {
+    # name: (capture fps or None = as fast as possible, stub latency s, infer fps cap)
+    "camera30_stub20ms": (30, 0.020, None),
+    "camera30_stub20ms_infer6": (30, 0.020, 6),
+    "unpaced_stub0ms": (None, 0.0, None),
+}
+
+
+class _Run:
+    def __init__(self, capture_fps, latency_s, infer_fps, width=1280, height=720, traced=False):
+        self.shared = SharedFrame()
+        self.capture_fps = capture_fps
+        self.width, self.height = width, height
+        self.traced = traced
+        self.captured = {}  # seq -> perf_counter when handed to inference
+        self.latencies = []
+        self.alloc_peaks = []
+        self.stats = StatsAggregator()
+        self._stop = threading.Event()
+        self.detector = StubDetector(latency_s)
+        if traced:
+            infer = self.detector.infer
+
+            def infer_traced(frame, seq=None, trace=None):
+                tracemalloc.reset_peak()
+                self._alloc_base = tracemalloc.get_traced_memory()[0]
+                return infer(frame, seq, trace)
+            self.detector.infer = infer_traced
+        self.loop = InferenceLoop(
+            [("stub", "detect")], self.shared,
+            infer_fps=infer_fps or 10_000,
+            on_result=self._on_result,
+            stats=self.stats,
+            group=self.detector,
+        )
+
+    def _produce(self):
+        period = 1.0 / self.capture_fps if self.capture_fps else 0.0
+        next_t = time.perf_counter()
+        for seq, frame in enumerate(synthetic_frames(width=self.width, height=self.height), start=1):
+            if self._stop.is_set():
+                return
+            self.captured[seq] = time.perf_counter()
+            self.shared.set(frame, seq)
+            self.stats.stage("capture").record()
+            if period:
+                next_t += period
+                time.sleep(max(0.0, next_t - time.perf_counter()))
+            else:
+                time.sleep(0)  # let the inference thread have the GIL
+
+    def _on_result(self, frame, overlay):
+        view = resize_to_fit(frame, VIEW)
+        if view is frame:
+            view = frame.copy()
+        render_overlay(view, overlay)
+        bgr_to_qimage(view)
+        self.latencies.append(time.perf_counter() - self.captured.pop(overlay.seq))
+        if self.traced:
+            self.alloc_peaks.append(tracemalloc.get_traced_memory()[1] - self._alloc_base)
+
+    def run(self, seconds):
+        threads = [
+            threading.Thread(target=self._produce, name="capture", daemon=True),
+            threading.Thread(target=self.loop.run, name="inference", daemon=True),
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        self._stop.set()
+        self.loop.stop()
+        for t in threads:
+            t.join(2.0)
+        return self
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_pipeline(scenario, e2e_seconds):
+    capture_fps, latency_s, infer_fps = SCENARIOS[scenario]
+
+    timed = _Run(capture_fps, latency_s, infer_fps).run(e2e_seconds)
+    assert timed.latencies, "no frame made it through the pipeline"
+
+    # Allocations are measured in a separate, shorter run: tracemalloc slows everything down
+    tracemalloc.start()
+    try:
+        traced = _Run(capture_fps, latency_s, infer_fps, traced=True).run(min(1.0, e2e_seconds))
+    finally:
+        tracemalloc.stop()
+
+    latencies = sorted(timed.latencies)
+    peaks = sorted(traced.alloc_peaks) or [0]
+    snapshot = timed.stats.snapshot()
+    frames = len(latencies)
+    record(f"pipeline[{scenario}]", {
+        "kind": "e2e",
+        "seconds": e2e_seconds,
+        "frames": frames,
+        "fps": frames / e2e_seconds,
+        "capture_fps": timed.stats.stage("capture").total / e2e_seconds,
+        "latency_p50_ms": _percentile(latencies, 0.50) * 1000.0,
+        "latency_p95_ms": _percentile(latencies, 0.95) * 1000.0,
+        "latency_p99_ms": _percentile(latencies, 0.99) * 1000.0,
+        "infer_p50_ms": snapshot["infer"]["p50_ms"],
+        "dropped_frames": timed.stats.stage("infer").drops,
+        "alloc_bytes_per_frame": _percentile(peaks, 0.50),
+    })
@@ -0,0 +1,121 @@
+"""Micro-benchmarks for each stage of the frame path, one frame at a time."""
+import os
+
+import pytest
+
+from jmodel_desktop.src.controllers.inference_session import bgr_to_qimage
+from jmodel_desktop.src.core.broker import Subscription
+from jmodel_desktop.src.core.frame_trace import CAPTURE, FrameTrace
+from jmodel_desktop.src.core.frames import SharedFrame, resize_to_fit
+from jmodel_desktop.src.core.overlay import render_overlay
+from jmodel_desktop.src.core.stats import StageStats
+
+from .synthetic import StubDetector, synthetic_frame, stub_overlay
+
+SIZES = {"720p": (1280, 720), "1080p": (1920, 1080)}
+VIEW = (960, 540)
+
+
+@pytest.fixture(scope="module", params=list(SIZES))
+def frame(request):
+    w, h = SIZES[request.param]
+    return request.param, synthetic_frame(1, w, h)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def test_shared_frame_set(bench, frame):
+    name, image = frame
+    shared = SharedFrame()
+    bench(f"shared_frame.set[{name}]", lambda: shared.set(image))
+
+
+def test_shared_frame_get_copy(bench, frame):
+    name, image = frame
+    shared = SharedFrame()
+    shared.set(image)
+    bench(f"shared_frame.get_copy_with_seq[{name}]", lambda: shared.get_copy_with_seq())
+
+
+def test_resize_to_view(bench, frame):
+    name, image = frame
+    result = bench(f"resize_to_fit[{name}->960x540]", lambda: resize_to_fit(image, VIEW))
+    assert result["calls"] > 0
+
+
+def test_bgr_to_qimage(bench, frame):
+    name, image = frame
+    view = resize_to_fit(image, VIEW)
+    bench(f"bgr_to_qimage[{name}->960x540]", lambda: bgr_to_qimage(view))
+    bench(f"bgr_to_qimage[{name} full]", lambda: bgr_to_qimage(image))
+
+
+def test_qpixmap_from_image(bench, qapp, frame):
+    from PySide6.QtGui import QPixmap
+
+    name, image = frame
+    qimage = bgr_to_qimage(resize_to_fit(image, VIEW))
+    bench(f"qpixmap.fromImage[{name}->960x540]", lambda: QPixmap.fromImage(qimage))
+
+
+def test_render_overlay(bench):
+    view = synthetic_frame(1, *VIEW)
+    overlay = stub_overlay(10)
+    bench("render_overlay[960x540, 10 boxes]", lambda: render_overlay(view, overlay))
+
+
+def test_composite(bench, frame):
+    """What InferenceWorker._on_result does per result: scale, copy, draw, convert."""
+    name, image = frame
+    overlay = stub_overlay(10)
+
+    def composite():
+        view = resize_to_fit(image, VIEW)
+        if view is image:
+            view = image.copy()
+        render_overlay(view, overlay)
+        return bgr_to_qimage(view)
+
+    bench(f"composite[{name}->960x540]", composite)
+
+
+def test_letterbox(bench, frame):
+    pytest.importorskip("torch")
+    from jmodel_desktop.src.core.preprocess import Preprocessor
+
+    name, image = frame
+    pre = Preprocessor(640, device="cpu")
+    bench(f"letterbox[{name}->640]", lambda: pre.letterbox(image))
+    bench(f"preprocess[{name}->640 tensor]", lambda: pre(image))
+
+
+def test_stub_detector(bench):
+    detector = StubDetector(latency_s=0.0)
+    image = synthetic_frame(1)
+    bench("stub_detector.infer[0 ms]", lambda: detector.infer(image, seq=1))
+
+
+def test_broker_offer(bench):
+    image = synthetic_frame(1)
+    push = Subscription("bench", on_frame=lambda seq, frame: None)
+    pull = Subscription("bench", queue_size=4)
+    counter = iter(range(10 ** 9))
+    bench("subscription._offer[push]", lambda: push._offer(next(counter), image, 0.0))
+    bench("subscription._offer[pull latest]", lambda: pull._offer(next(counter), image, 0.0))
+
+
+def test_stage_stats_record(bench):
+    stats = StageStats("bench")
+    bench("stage_stats.record", lambda: stats.record(0.01), warmup=300)
+
+
+def test_frame_trace_mark(bench):
+    trace = FrameTrace()
+    counter = iter(range(10 ** 9))
+    bench("frame_trace.mark", lambda: trace.mark(next(counter), CAPTURE, 0.0), warmup=300)
+
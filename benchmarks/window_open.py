@@ -0,0 +1,58 @@
+"""
+Window-open time: runtime QUiLoader parsing vs. classes generated by
+utils/build_ui.py.
+
+    QT_QPA_PLATFORM=offscreen poetry run python -m benchmarks.window_open --runs 50
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from jmodel_desktop.src.utils.load_windows import FindChildUi, create_window, load_ui
+
+VIEWS = ("run_model_window", "video_inference_window")
+
+
+def _time_runs(open_window, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        window = open_window()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        window.deleteLater()
+        QApplication.processEvents()
+    return samples
+
+
+def _runtime(name):
+    window = load_ui(f":/views/{name}.ui")
+    window.ui = FindChildUi(window)
+    return window
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'view':<26} {'mode':<9} {'median ms':>10} {'p95 ms':>8}")
+    for name in VIEWS:
+        for mode, open_window in (
+            ("runtime", lambda: _runtime(name)),
+            ("compiled", lambda: create_window(name)),
+        ):
+            open_window().deleteLater()  # warm-up (imports, first resource access)
+            samples = sorted(_time_runs(open_window, args.runs))
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(f"{name:<26} {mode:<9} {statistics.median(samples):>10.2f} {p95:>8.2f}")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
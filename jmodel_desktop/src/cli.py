@@ -0,0 +1,136 @@
+"""
+jmodel-run: headless runner on top of the Qt-free core.
+
+    jmodel-run --source /dev/video0 --model yolo11n.pt --detections -
+    jmodel-run --source clip.mp4 --model yolo11n.pt --out annotated.mp4 --offline
+
+Only argparse is imported up front; OpenCV, numpy and ultralytics are
+imported once the arguments are valid, so --help and bad invocations
+return immediately.
+"""
+import argparse
+import sys
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="jmodel-run", description="Run a model on a video source without a GUI.")
+    parser.add_argument("--source", required=True, help="/dev/videoN, camera index, video file, stream URL, or synthetic:// replay:// images:// archive:// (core.sources)")
+    parser.add_argument("--model", action="append", required=True, help="model path (repeat to attach several models)")
+    parser.add_argument("--classifier", default=None, help="optional crop classifier model")
+
+    rates = parser.add_argument_group("rates")
+    rates.add_argument("--width", type=int, default=1280)
+    rates.add_argument("--height", type=int, default=720)
+    rates.add_argument("--fps", type=int, default=30, help="capture fps requested from the camera")
+    rates.add_argument("--infer-fps", type=float, default=6.0)
+    rates.add_argument("--imgsz", type=int, default=640)
+
+    outputs = parser.add_argument_group("outputs")
+    outputs.add_argument("--out", default=None, help="annotated video file (.mp4)")
+    outputs.add_argument("--detections", default=None, help="detections as JSON lines ('-' for stdout)")
+    outputs.add_argument("--record-raw", default=None, metavar="NAME",
+                         help="every captured frame, uncompressed, to NAME.raw + NAME.idx (replay with archive://NAME)")
+
+    run = parser.add_argument_group("run")
+    run.add_argument("--duration", type=float, default=None, help="stop after N seconds (live sources)")
+    run.add_argument("--offline", action="store_true", help="process a video file with no dropped frames")
+    run.add_argument("--batch", type=int, default=8, help="batch size for --offline")
+
+    diag = parser.add_argument_group("diagnostics")
+    diag.add_argument("--trace", default=None, metavar="PATH",
+                      help="record thread spans and write a Chrome trace (Perfetto) on exit; "
+                           "SIGUSR2 dumps/starts one at any time")
+    return parser
+
+
+def _run_offline(args, models):
+    from .core.batch_video import BatchVideoProcessor
+
+    processor = BatchVideoProcessor(
+        args.source,
+        models=models,
+        out_path=args.out,
+        detections_path=args.detections,
+        batch_size=args.batch,
+        imgsz=args.imgsz,
+        classifier_path=args.classifier,
+    )
+    processor.run()
+    print(processor.summary(), file=sys.stderr)
+    return 0
+
+
+def _run_live(args, models):
+    import time
+
+    from .core.pipeline import Pipeline
+    from .core.sinks import JsonlSink, VideoFileSink
+
+    recorder = None
+    if args.record_raw:
+        from .core.frame_archive import ArchiveRecorder
+
+        recorder = ArchiveRecorder(args.record_raw)
+
+    sinks = []
+    if args.out:
+        sinks.append(VideoFileSink(args.out, fps=args.infer_fps))
+    if args.detections:
+        sinks.append(JsonlSink(args.detections))
+
+    pipeline = Pipeline(
+        args.source,
+        models,
+        width=args.width,
+        height=args.height,
+        fps=args.fps,
+        infer_fps=args.infer_fps,
+        imgsz=args.imgsz,
+        classifier_path=args.classifier,
+        sinks=sinks,
+        on_frame=recorder.offer if recorder is not None else None,
+    )
+
+    started = time.monotonic()
+    pipeline.start()
+    try:
+        pipeline.wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pipeline.stop()
+        if recorder is not None:
+            recorder.close()
+
+    elapsed = time.monotonic() - started
+    print(f"{pipeline.inferred} frames inferred in {elapsed:.1f} s", file=sys.stderr)
+    if recorder is not None:
+        print(f"{recorder.writer.frames} frames recorded to {recorder.writer.raw_path}"
+              f" ({recorder.dropped} dropped)", file=sys.stderr)
+    for msg in pipeline.errors:
+        print(f"[jmodel-run] ERROR: {msg}", file=sys.stderr)
+    return 1 if pipeline.errors else 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    from .core import tracing
+    from .service.models import guess_task
+
+    tracing.install_signal_handler()
+    if args.trace:
+        tracing.start()
+
+    models = [(path, guess_task(path)) for path in args.model]
+    try:
+        if args.offline:
+            return _run_offline(args, models)
+        return _run_live(args, models)
+    finally:
+        if args.trace:
+            print(f"trace written to {tracing.dump(args.trace)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
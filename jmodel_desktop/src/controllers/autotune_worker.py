@@ -0,0 +1,60 @@
+from PySide6.QtCore import QObject, Signal, Slot
+
+from ..core.autotune import AutoTuner
+from ..core.frames import resize_to_fit
+from .inference_session import bgr_to_qimage
+
+# What a typical view asks the preview path for (InferenceSession scales to the label)
+PREVIEW_SIZE = (960, 540)
+
+
+def _preview(seq, frame):
+    bgr_to_qimage(resize_to_fit(frame, PREVIEW_SIZE))
+
+
+class AutoTuneWorker(QObject):
+    """QThread adapter around core.autotune.AutoTuner."""
+    progress = Signal(int, int, str)  # done, total, last trial as text
+    finished = Signal(object)  # AutoTuner.run() result
+    error = Signal(str)
+
+    def __init__(self, device_path, models, latency_target_ms, classifier_path=None, parent=None):
+        super().__init__(parent)
+        self._tuner = AutoTuner(
+            device_path,
+            models,
+            latency_target_ms=latency_target_ms,
+            classifier_path=classifier_path,
+            on_preview=_preview,
+            on_progress=self._on_progress,
+        )
+
+    def _on_progress(self, done, total, trial):
+        if trial is None:
+            text = "Loading model..."
+        elif trial["error"]:
+            text = f"{describe(trial)}: {trial['error']}"
+        elif trial["size_mismatch"]:
+            w, h = trial["frame_size"]
+            text = f"{describe(trial)}: camera delivered {w}x{h}, skipped"
+        else:
+            text = (f"{describe(trial)}: {trial['infer_fps_measured']:.1f} fps, "
+                    f"p95 {trial['latency_p95_ms'] or 0:.0f} ms")
+        self.progress.emit(done, total, text)
+
+    @Slot()
+    def run(self):
+        try:
+            result = self._tuner.run()
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(result)
+
+    def stop(self):
+        self._tuner.stop()
+
+
+def describe(settings):
+    return (f"{settings['width']}x{settings['height']}@{settings['fps']} "
+            f"infer {settings['infer_fps']} fps, UI {settings['ui_fps']} fps, imgsz {settings['imgsz']}")
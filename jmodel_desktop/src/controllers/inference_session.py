@@ -0,0 +1,451 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal, Slot, QThread
+from PySide6.QtGui import QImage
+
+import numpy as np
+
+from ..core.broker import capture_broker
+from ..core import tracing
+from ..core.frame_trace import CONVERT, ENQUEUE, PREVIEW_CONVERT
+from ..core.frames import FrameRing, SharedFrame, resize_to_fit
+from ..core.inference import InferenceLoop
+from ..core.overlay import render_overlay
+from ..core.stats import StatsAggregator
+from ..service.session_settings import load_background_infer_fps
+
+
+def bgr_to_qimage(frame):
+    frame = np.ascontiguousarray(frame)
+    h, w = frame.shape[:2]
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888).copy()
+
+
+class InferenceWorker(QObject):
+    """QThread adapter around core.inference.InferenceLoop."""
+    infer_qimage = Signal(object)  # QImage
+    infer_overlay = Signal(object)  # Overlay (compact, no pixel data)
+    error = Signal(str)
+    finished = Signal()
+
+    def __init__(self, models, shared: SharedFrame, infer_fps=6, imgsz=640, classifier_path=None, sinks=(), stats=None, group=None, parent=None):
+        """
+        :param models: list of (model_path, task); all of them run on every frame
+        :param group: prebuilt model group (see InferenceLoop); None loads `models`
+        """
+        super().__init__(parent)
+        self.view_size = None  # (w, h) of the view showing infer_qimage
+        self.visible = True    # False: no view is showing it, skip the composite
+        self.trace = None      # FrameTrace while frame timing is on
+        self._loop = InferenceLoop(
+            models,
+            shared,
+            infer_fps=infer_fps,
+            imgsz=imgsz,
+            classifier_path=classifier_path,
+            sinks=sinks,
+            on_result=self._on_result,
+            on_error=self.error.emit,
+            stats=stats,
+            group=group,
+        )
+
+    def set_infer_fps(self, infer_fps):
+        self._loop.set_infer_fps(infer_fps)
+
+    def set_trace(self, trace):
+        self.trace = trace
+        self._loop.trace = trace
+
+    def backlog(self):
+        """Frames captured since inference last picked one up (0 until the first)."""
+        loop = self._loop
+        if not loop.last_seq:
+            return 0
+        return max(0, loop.shared.seq - loop.last_seq)
+
+    def model_memory(self):
+        return list(self._loop.model_memory)
+
+    def _on_result(self, frame, overlay):
+        self.infer_overlay.emit(overlay)
+        if not self.visible:
+            return
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
+
+        # Composite at the size the view reported, not at camera resolution
+        view = resize_to_fit(frame, self.view_size or (640, 640))
+        if view is frame:
+            view = frame.copy()
+        render_overlay(view, overlay)
+        image = bgr_to_qimage(view)
+        trace = self.trace
+        if trace is not None and overlay.seq is not None:
+            trace.mark(overlay.seq, CONVERT, time.perf_counter())
+            image.setText("seq", str(overlay.seq))  # lets the view mark "paint"
+        if tr is not None:
+            tr.add("inference.composite", t0)
+        self.infer_qimage.emit(image)
+
+    @Slot()
+    def run(self):
+        threading.current_thread().name = "inference"  # QThread; named for traces and profiles
+        try:
+            self._loop.run()
+        finally:
+            self.finished.emit()
+
+    def stop(self):
+        self._loop.stop()
+
+class SessionConfig:
+    """Everything that identifies a running capture + inference pair."""
+
+    def __init__(self, device_path, model_path, task="detect", extra_models=(), classifier_path=None,
+                 width=1280, height=720, fps=30, infer_fps=6, ui_fps=15, imgsz=640):
+        self.device_path = device_path
+        self.model_path = model_path
+        self.task = task
+        self.extra_models = tuple(tuple(m) for m in extra_models)
+        self.classifier_path = classifier_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.infer_fps = infer_fps
+        self.ui_fps = ui_fps
+        self.imgsz = imgsz
+
+    def key(self):
+        return (
+            self.device_path, self.model_path, self.task, self.extra_models, self.classifier_path,
+            self.width, self.height, self.fps, self.infer_fps, self.ui_fps, self.imgsz,
+        )
+
+    def label(self):
+        return f"{self.device_path} | {self.model_path}"
+
+
+# Longest delay synchronised mode can apply (sizes the display ring)
+SYNC_MAX_DELAY_S = 2.0
+LATENCY_EMA_ALPHA = 0.2
+
+
+class InferenceSession(QObject):
+    """
+    Capture subscriptions + inference thread for one SessionConfig,
+    independent of any window. The camera itself is opened through the
+    capture broker, so sessions on the same device share one capture.
+    Views connect to its signals; SessionManager decides when it is
+    started and stopped.
+    """
+    video_qimage = Signal(object)  # QImage
+    infer_qimage = Signal(object)  # QImage
+    infer_overlay = Signal(object)  # Overlay
+    error = Signal(str)
+    stopped = Signal()
+    thread_finished = Signal()  # the inference thread is gone; may come well after `stopped`
+    _capture_error = Signal(str)  # broker thread -> GUI thread
+
+    def __init__(self, config: SessionConfig, sinks=(), group_factory=None, parent=None):
+        """
+        :param sinks: recording/analytics sinks; with any attached, inference
+                      keeps its full rate while no view is visible
+        :param group_factory: callable(models) -> model group, used instead of
+                              loading the models (soak runs use a stub detector)
+        """
+        super().__init__(parent)
+        self.config = config
+        self.sinks = list(sinks)
+        self.group_factory = group_factory
+        self.stats = StatsAggregator()
+        for stage in ("capture", "preview", "infer", "result"):
+            self.stats.stage(stage)  # fixed display order
+        self._shared = SharedFrame()
+
+        self._preview_sub = None
+        self._infer_sub = None
+        self._infer_thread = None
+        self._infer_worker = None
+        self._running = False
+        self._thread_running = None  # QThread until its `finished`, which may come well after stop()
+        self._delete_pending = False
+        self._capture_error.connect(self._on_error)
+
+        # view -> (video (w, h), inference (w, h)); frames are scaled to the largest
+        self._view_sizes = {}
+        self._video_size = None
+        self._infer_size = None
+
+        # Views currently visible on screen (shown, not minimized, exposed)
+        self._visible_views = set()
+        self._preview_enabled = False
+
+        # Synchronised mode: when an overlay arrives the live view shows the
+        # frame it belongs to (by seq; the nearest earlier preview frame when
+        # the preview did not sample that one). In between it runs
+        # `sync_delay()` behind, so motion stays smooth
+        self.latency_s = None  # EMA, capture -> inference result on the GUI thread
+        self._sync = False
+        self._sync_delay_s = None  # fixed delay; None follows latency_s
+        self._sync_shown_seq = 0
+        self._sync_overlay_seq = 0  # newest overlay not lined up yet; set on the GUI thread
+        self.trace = None  # FrameTrace of the device while frame timing is on
+        self._capture_clock = FrameRing(256)  # (seq, t) of frames handed to inference
+        self._display_ring = FrameRing(int(SYNC_MAX_DELAY_S * config.ui_fps) + 2)
+
+    def is_running(self):
+        return self._running
+
+    def set_view_size(self, view, video_size, infer_size):
+        """Views report their label sizes so the worker threads scale once, to exactly that."""
+        self._view_sizes[view] = (tuple(video_size), tuple(infer_size))
+        self._update_view_size()
+
+    def clear_view_size(self, view):
+        self._view_sizes.pop(view, None)
+        self._update_view_size()
+
+    def set_sync(self, enabled, delay_ms=0):
+        """
+        The view lines up with each overlay by seq either way; the delay
+        only paces the frames shown in between.
+
+        :param delay_ms: fixed delay; 0 follows the measured inference latency
+        """
+        self._sync_delay_s = delay_ms / 1000.0 if delay_ms else None
+        self._sync = bool(enabled)
+        if not self._sync:
+            self._display_ring.clear()
+            self._sync_shown_seq = 0
+            self._sync_overlay_seq = 0
+
+    def set_frame_trace(self, enabled):
+        """Per-frame stage timing (core.frame_trace); returns the FrameTrace or None."""
+        broker = capture_broker()
+        if enabled and self._running:
+            self.trace = broker.enable_frame_trace(self.config.device_path)
+        else:
+            if self.trace is not None:
+                broker.disable_frame_trace(self.config.device_path)
+            self.trace = None
+        if self._infer_worker is not None:
+            self._infer_worker.set_trace(self.trace)
+        return self.trace
+
+    def sync_delay(self):
+        if self._sync_delay_s is not None:
+            return min(self._sync_delay_s, SYNC_MAX_DELAY_S)
+        return min(self.latency_s or 0.0, SYNC_MAX_DELAY_S)
+
+    def set_view_visible(self, view, visible):
+        if visible:
+            self._visible_views.add(view)
+        else:
+            self._visible_views.discard(view)
+        self._apply_visibility()
+
+    def _apply_visibility(self):
+        visible = bool(self._visible_views)
+        self._preview_enabled = visible
+        if self._infer_worker is None:
+            return
+        self._infer_worker.visible = visible
+        if visible or self.sinks:
+            self._infer_worker.set_infer_fps(self.config.infer_fps)
+        else:
+            self._infer_worker.set_infer_fps(load_background_infer_fps())
+
+    def metrics(self):
+        """
+        Monitoring snapshot (dashboard, metrics endpoint): per-stage stats,
+        queue depths and the capture -> result latency. Reads counters only,
+        the worker threads are never blocked.
+        """
+        worker = self._infer_worker
+        return {
+            "label": self.config.label(),
+            "device": self.config.device_path,
+            "model": self.config.model_path,
+            "running": self._running,
+            "stages": self.stats.snapshot(),
+            "queues": {"infer": worker.backlog() if worker is not None else 0},
+            "latency_ms": self.latency_s * 1000.0 if self.latency_s is not None else None,
+            "model_memory": dict(zip(
+                [self.config.model_path] + [m[0] for m in self.config.extra_models],
+                worker.model_memory() if worker is not None else [],
+            )),
+        }
+
+    def _update_view_size(self):
+        def largest(sizes):
+            sizes = [s for s in sizes if s[0] > 0 and s[1] > 0]
+            if not sizes:
+                return None
+            return max(s[0] for s in sizes), max(s[1] for s in sizes)
+
+        self._video_size = largest(v for v, _ in self._view_sizes.values())
+        self._infer_size = largest(i for _, i in self._view_sizes.values())
+        if self._infer_worker is not None:
+            self._infer_worker.view_size = self._infer_size
+
+    def start(self):
+        if self._running:
+            return
+        cfg = self.config
+
+        # Inference thread
+        self._infer_thread = QThread(self)
+        models = [(cfg.model_path, cfg.task)] + [tuple(m) for m in cfg.extra_models]
+        self._infer_worker = InferenceWorker(
+            models=models,
+            shared=self._shared,
+            infer_fps=cfg.infer_fps,
+            imgsz=cfg.imgsz,
+            classifier_path=cfg.classifier_path,
+            sinks=self.sinks,
+            stats=self.stats,
+            group=self.group_factory(models) if self.group_factory is not None else None,
+        )
+        self._infer_worker.view_size = self._infer_size
+        self._apply_visibility()
+        self._infer_worker.moveToThread(self._infer_thread)
+        self._infer_thread.started.connect(self._infer_worker.run)
+        self._infer_worker.infer_qimage.connect(self.infer_qimage)
+        self._infer_worker.infer_overlay.connect(self.infer_overlay)
+        self._infer_worker.infer_overlay.connect(self._on_infer_overlay)
+        self._infer_worker.error.connect(self._on_error)
+
+        # Cleanup
+        self._infer_worker.finished.connect(self._infer_thread.quit)
+        self._infer_worker.finished.connect(self._infer_worker.deleteLater)
+        self._infer_thread.finished.connect(self._infer_thread.deleteLater)
+        self._infer_thread.finished.connect(self._on_infer_thread_finished)
+        self._thread_running = self._infer_thread
+
+        self._running = True
+        self._infer_thread.start()
+
+        # Capture (shared per device). Callbacks run on the broker's capture thread.
+        broker = capture_broker()
+        capture = dict(width=cfg.width, height=cfg.height, fps=cfg.fps)
+        self._infer_sub = broker.subscribe(
+            cfg.device_path, name=f"infer {cfg.model_path}",
+            on_frame=self._on_infer_frame,
+            on_error=self._capture_error.emit, **capture,
+        )
+        self._preview_sub = broker.subscribe(
+            cfg.device_path, name=f"preview {cfg.model_path}", max_fps=cfg.ui_fps,
+            on_frame=self._on_preview, **capture,
+        )
+
+    def _on_infer_frame(self, seq, frame):
+        now = time.monotonic()
+        self._capture_clock.push(seq, None, now)
+        self.stats.stage("capture").record(t=now)
+        self._shared.set(frame, seq)
+        trace = self.trace
+        if trace is not None:
+            trace.mark(seq, ENQUEUE, time.perf_counter())
+
+    def _on_preview(self, seq, frame):
+        if not self._preview_enabled:
+            return
+        t0 = time.perf_counter()
+        frame = resize_to_fit(frame, self._video_size)
+        if self._sync:
+            now = time.monotonic()
+            self._display_ring.push(seq, frame, now)
+            entry = None
+            overlay_seq = self._sync_overlay_seq
+            if overlay_seq:
+                entry = self._display_ring.latest_up_to(overlay_seq)
+                self._sync_overlay_seq = 0
+            if entry is not None:
+                # The overlay's own frame, even when a fixed delay shorter
+                # than the latency had already shown later ones
+                if entry[0] == self._sync_shown_seq:
+                    return
+            else:
+                entry = self._display_ring.latest_before(now - self.sync_delay())
+                # Never step back in time when the delay grows; hold until caught up
+                if entry[0] <= self._sync_shown_seq:
+                    return
+            shown_seq, _, frame = entry
+            self._sync_shown_seq = seq = shown_seq
+        image = bgr_to_qimage(frame)
+        self.stats.stage("preview").record(time.perf_counter() - t0)
+        trace = self.trace
+        if trace is not None:
+            trace.mark(seq, PREVIEW_CONVERT, time.perf_counter())
+            image.setText("seq", str(seq))
+        tr = tracing.active
+        if tr is not None:
+            tr.add("preview.convert", t0, args={"seq": seq})
+        self.video_qimage.emit(image)
+
+    def _on_infer_overlay(self, overlay):
+        if self._sync:
+            self._sync_overlay_seq = overlay.seq
+        entry = self._capture_clock.find(overlay.seq)
+        if entry is None:
+            return
+        latency = time.monotonic() - entry[1]
+        self.stats.stage("result").record(latency)
+        if self.latency_s is None:
+            self.latency_s = latency
+        else:
+            self.latency_s += LATENCY_EMA_ALPHA * (latency - self.latency_s)
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+
+        broker = capture_broker()
+        for sub in (self._preview_sub, self._infer_sub):
+            if sub is not None:
+                broker.unsubscribe(sub)
+        self._preview_sub = None
+        self._infer_sub = None
+        self.trace = None
+
+        if self._infer_worker:
+            self._infer_worker.stop()
+
+        # No wait: loading a model or one slow infer can take seconds. The
+        # thread quits once the loop returns; see delete_when_stopped().
+        if self._infer_thread:
+            self._infer_thread.quit()
+
+        self._infer_thread = None
+        self._infer_worker = None
+        self.stopped.emit()
+
+    def _on_infer_thread_finished(self):
+        self._thread_running = None
+        self.thread_finished.emit()
+        if self._delete_pending:
+            self.deleteLater()
+
+    def is_thread_running(self):
+        return self._thread_running is not None
+
+    def delete_when_stopped(self):
+        """deleteLater(), deferred until the inference thread (a child of the session) has finished."""
+        if self._thread_running is None:
+            self.deleteLater()
+        else:
+            self._delete_pending = True
+
+    def wait_stopped(self):
+        """Blocks until the inference thread has finished (application shutdown)."""
+        thread = self._thread_running
+        if thread is not None:
+            thread.wait()
+
+    def _on_error(self, msg: str):
+        print("[InferenceSession] ERROR:", msg)
+        self.error.emit(msg)
+        self.stop()
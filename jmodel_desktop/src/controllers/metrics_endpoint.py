@@ -0,0 +1,105 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from ..core.broker import capture_broker
+from ..core.metrics import MetricsServer, render
+from ..core.process_stats import ProcessSampler
+from ..service.session_settings import (
+    load_metrics_enabled,
+    load_metrics_host,
+    load_metrics_mode,
+    load_metrics_port,
+)
+from .session_manager import session_manager
+
+PUBLISH_MS = 1000
+
+
+class MetricsEndpoint(QObject):
+    """
+    Renders the sessions, broker devices and process stats on the GUI thread
+    once a second and hands the text to core.metrics.MetricsServer, which
+    answers scrapes from that copy.
+    """
+    status_changed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._server = None
+        self._process = ProcessSampler()
+        self.status = "Off"
+        self._timer = QTimer(self)
+        self._timer.setInterval(PUBLISH_MS)
+        self._timer.timeout.connect(self.publish)
+
+    def apply_settings(self):
+        """(Re)starts or stops the server from QSettings; call after the settings change."""
+        self.stop()
+        if not load_metrics_enabled():
+            self._set_status("Off")
+            return
+        if load_metrics_mode() == "external":
+            host = load_metrics_host() or "0.0.0.0"
+        else:
+            host = "127.0.0.1"
+        server = MetricsServer(host, load_metrics_port())
+        try:
+            server.start()
+        except OSError as e:
+            print("[metrics] ERROR:", e)
+            self._set_status(f"Error: {e}")
+            return
+        self._server = server
+        self.publish()
+        self._timer.start()
+        self._set_status(f"Serving {server.url()}")
+
+    def stop(self):
+        self._timer.stop()
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+
+    def snapshot(self):
+        sessions = []
+        seen = {}
+        for session in session_manager().sessions():
+            if not session.is_running():
+                continue
+            m = session.metrics()
+            name = m["label"]
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name} #{seen[name]}"  # same device + model, other settings
+            m["labels"] = {"session": name, "device": m["device"], "model": m["model"]}
+            m["histograms"] = {s.name: s.histogram_snapshot() for s in session.stats.stages()}
+            sessions.append(m)
+        return {
+            "sessions": sessions,
+            "devices": capture_broker().devices(),
+            "process": self._process.sample(),
+            "time": time.time(),
+        }
+
+    def publish(self):
+        if self._server is not None:
+            self._server.publish(render(self.snapshot()))
+
+    def _set_status(self, text):
+        self.status = text
+        self.status_changed.emit(text)
+
+
+_endpoint = None
+
+
+def metrics_endpoint():
+    """Application-wide MetricsEndpoint (stopped when the app quits)."""
+    global _endpoint
+    if _endpoint is None:
+        app = QApplication.instance()
+        _endpoint = MetricsEndpoint(parent=app)
+        app.aboutToQuit.connect(_endpoint.stop)
+    return _endpoint
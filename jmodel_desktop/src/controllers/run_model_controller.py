@@ -1,44 +1,48 @@
-from PySide6.QtCore import QObject, Qt
-from PySide6.QtWidgets import QComboBox, QPushButton, QRadioButton, QTextEdit
+from PySide6.QtCore import QObject, Qt, QThread
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QMessageBox, QProgressDialog
 
-from ..utils.load_windows import load_ui
-from .video_inference_controller import VideoInferenceController
+from ..utils.load_windows import create_window
 
-from ..service.models import listar_modelos_desde_env
-from ..service.devices import list_v4l2_devices_linux
+from ..service.models import listar_modelos_desde_env, classifier_model_from_env, extra_models_from_env, guess_task
+from ..service.devices import list_test_sources, list_v4l2_devices_linux
+from ..service.session_settings import load_autotune_latency_ms, load_tuned_settings, save_tuned_settings
+
+# Used until the auto-tuner has stored settings for a (device, model)
+DEFAULT_SESSION_SETTINGS = {"width": 1280, "height": 720, "fps": 30, "infer_fps": 6, "ui_fps": 15, "imgsz": 640}
 
 class RunModelController(QObject):
     def __init__(self, window):
         super().__init__()
         self.window = window
+        self.ui = window.ui
+
+        self._autotune_thread = None
+        self._autotune_worker = None
+        self._autotune_dialog = None
 
         self._resolve_widgets()
         self._wire_signals()
         self._init_ui_state()
+        self._build_menu()
 
     # ---------- Widget lookup ----------
-    def _require(self, widget_type, object_name: str):
-        widget = self.window.findChild(widget_type, object_name)
-        if widget is None:
-            raise RuntimeError(f"Widget not found: {object_name} ({widget_type.__name__})")
-        return widget
-
     def _resolve_widgets(self):
         # Buttons
-        self.btn_ultralytics = self._require(QPushButton, "pushButton_utralytics")  # UI name as-is
-        self.btn_gstream = self._require(QPushButton, "pushButton_gstream")
-        self.btn_opencv = self._require(QPushButton, "pushButton_opencv")
+        self.btn_ultralytics = self.ui.pushButton_utralytics  # UI name as-is
+        self.btn_gstream = self.ui.pushButton_gstream
+        self.btn_opencv = self.ui.pushButton_opencv
 
         # Radios
-        self.radio_local = self._require(QRadioButton, "radioButton_local")
-        self.radio_remote = self._require(QRadioButton, "radioButton_remote")
+        self.radio_local = self.ui.radioButton_local
+        self.radio_remote = self.ui.radioButton_remote
 
         # Combos
-        self.combo_model = self._require(QComboBox, "comboBox_select_model")
-        self.combo_device = self._require(QComboBox, "comboBox_2")
+        self.combo_model = self.ui.comboBox_select_model
+        self.combo_device = self.ui.comboBox_2
 
         # Optional: URL text edit
-        self.text_url = self._require(QTextEdit, "textEdit_url")
+        self.text_url = self.ui.textEdit_url
 
     # ---------- Signal wiring ----------
     def _wire_signals(self):
@@ -66,6 +70,13 @@ class RunModelController(QObject):
         self._fill_model_combo_from_env()
         self._fill_device_combo_from_v4l2()
 
+    def _build_menu(self):
+        tools_menu = self.window.menuBar().addMenu("Tools")
+        self.action_autotune = QAction("Auto-tune...", self.window)
+        self.action_autotune.setToolTip("Try capture/inference settings on the selected device and model and keep the fastest")
+        self.action_autotune.triggered.connect(self.on_autotune_triggered)
+        tools_menu.addAction(self.action_autotune)
+
     # ---- Fill combos ----
     def _fill_model_combo_from_env(self):
         models = listar_modelos_desde_env()
@@ -89,7 +100,7 @@ class RunModelController(QObject):
             self.combo_model.blockSignals(False)
 
     def _fill_device_combo_from_v4l2(self):
-        devices = list_v4l2_devices_linux()  # [(path, label), ...]
+        devices = list_v4l2_devices_linux() + list_test_sources()  # [(path, label), ...]
 
         self.combo_device.blockSignals(True)
         try:
@@ -141,7 +152,12 @@ class RunModelController(QObject):
             print("No device selected.")
             return
 
-        child = load_ui(":/views/video_inference_window.ui")
+        # Heavy (cv2/numpy/ultralytics); usually already warmed in the background
+        from .video_inference_controller import VideoInferenceController
+
+        settings = {**DEFAULT_SESSION_SETTINGS, **(load_tuned_settings(device_path, model_path) or {})}
+
+        child = create_window("video_inference_window")
 
         # Ventana hija “dependiente” del padre (owned window)
         child.setParent(self.window, Qt.Window)
@@ -153,15 +169,115 @@ class RunModelController(QObject):
             child,
             model_path=model_path,
             device_path=device_path,
-            width=1280,
-            height=720,
-            fps=30,
+            task=guess_task(model_path),
+            extra_models=extra_models_from_env(),
+            classifier_path=classifier_model_from_env(),
             parent=child,
+            **settings,
         )
 
         child.show()
         print(f"GStream clicked | model={self.combo_model.currentText()} | device={self.combo_device.currentText()}")
 
+    def on_autotune_triggered(self):
+        model_path = self.combo_model.currentData()
+        device_path = self.combo_device.currentData()
+        if not model_path or not device_path:
+            QMessageBox.information(self.window, "Auto-tune", "Select a model and a device first.")
+            return
+        if self._autotune_thread is not None:
+            return
+
+        from .autotune_worker import AutoTuneWorker
+        from .session_manager import session_manager
+
+        # Trials need the camera to themselves; warm sessions would hold it
+        session_manager().drop_idle(device_path)
+
+        self._autotune_target = (device_path, model_path)
+        self._autotune_thread = QThread(self)
+        self._autotune_worker = AutoTuneWorker(
+            device_path,
+            [(model_path, guess_task(model_path))] + [tuple(m) for m in extra_models_from_env()],
+            latency_target_ms=load_autotune_latency_ms(),
+            classifier_path=classifier_model_from_env(),
+        )
+        self._autotune_worker.moveToThread(self._autotune_thread)
+        self._autotune_thread.started.connect(self._autotune_worker.run)
+        self._autotune_worker.progress.connect(self._on_autotune_progress)
+        self._autotune_worker.finished.connect(self._on_autotune_finished)
+        self._autotune_worker.error.connect(self._on_autotune_error)
+
+        # Cleanup
+        for signal in (self._autotune_worker.finished, self._autotune_worker.error):
+            signal.connect(self._autotune_thread.quit)
+        self._autotune_thread.finished.connect(self._autotune_worker.deleteLater)
+        self._autotune_thread.finished.connect(self._autotune_thread.deleteLater)
+        self._autotune_thread.finished.connect(self._on_autotune_thread_finished)
+
+        self._autotune_dialog = QProgressDialog("Auto-tuning...", "Cancel", 0, 0, self.window)
+        self._autotune_dialog.setWindowTitle("Auto-tune")
+        self._autotune_dialog.setWindowModality(Qt.WindowModal)
+        self._autotune_dialog.setMinimumDuration(0)
+        self._autotune_dialog.setAutoReset(False)
+        self._autotune_dialog.setAutoClose(False)
+        worker = self._autotune_worker
+        # Called directly on the GUI thread (it only sets a flag); the worker's thread is busy
+        self._autotune_dialog.canceled.connect(lambda: worker.stop())
+        self._autotune_dialog.show()
+        self._autotune_thread.start()
+
+    def _on_autotune_progress(self, done, total, text):
+        if self._autotune_dialog is None:
+            return
+        self._autotune_dialog.setMaximum(total)
+        self._autotune_dialog.setValue(done)
+        self._autotune_dialog.setLabelText(f"Trial {done}/{total}\n{text}")
+
+    def _close_autotune_dialog(self):
+        if self._autotune_dialog is not None:
+            self._autotune_dialog.canceled.disconnect()
+            self._autotune_dialog.close()
+            self._autotune_dialog.deleteLater()
+            self._autotune_dialog = None
+
+    def _on_autotune_finished(self, result):
+        from .autotune_worker import describe
+
+        self._close_autotune_dialog()
+        device_path, model_path = self._autotune_target
+        best = result["best"]
+        if result["cancelled"]:
+            QMessageBox.information(self.window, "Auto-tune", "Cancelled; settings unchanged.")
+            return
+        if best is None:
+            QMessageBox.warning(
+                self.window, "Auto-tune",
+                f"No configuration kept p95 latency under {result['latency_target_ms']:.0f} ms; settings unchanged.",
+            )
+            return
+        trial = next(t for t in result["trials"] if all(t[k] == v for k, v in best.items()))
+        save_tuned_settings(device_path, model_path, best, extra={
+            "latency_target_ms": result["latency_target_ms"],
+            "infer_fps_measured": trial["infer_fps_measured"],
+            "latency_p95_ms": trial["latency_p95_ms"],
+        })
+        print(f"Auto-tune | device={device_path} | model={model_path} | {describe(best)}")
+        QMessageBox.information(
+            self.window, "Auto-tune",
+            f"{describe(best)}\n\n{trial['infer_fps_measured']:.1f} inferences/s, "
+            f"p95 latency {trial['latency_p95_ms']:.0f} ms.\nSaved for this device and model.",
+        )
+
+    def _on_autotune_error(self, msg: str):
+        self._close_autotune_dialog()
+        print("[AutoTune] ERROR:", msg)
+        QMessageBox.warning(self.window, "Auto-tune", msg)
+
+    def _on_autotune_thread_finished(self):
+        self._autotune_thread = None
+        self._autotune_worker = None
+
     def on_opencv_clicked(self):
         print(f"OpenCV clicked | mode={self._mode()} | model={self.combo_model.currentText()} | device={self.combo_device.currentText()}")
 
@@ -0,0 +1,117 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from ..service.session_settings import load_grace_seconds
+from .inference_session import InferenceSession, SessionConfig
+
+
+class SessionManager(QObject):
+    """
+    Keeps one InferenceSession per SessionConfig key, shared by every view
+    attached to it. When the last view detaches the session keeps running
+    (capture open, model loaded) for a grace period; attaching again within
+    that time is instant.
+    """
+    sessions_changed = Signal()
+
+    def __init__(self, grace_s=None, parent=None):
+        super().__init__(parent)
+        # None = read the setting on every release, so changes apply right away
+        self.grace_s = grace_s
+        # callable(models) -> model group for new sessions; None loads the models
+        self.group_factory = None
+        self._sessions = {}  # key -> InferenceSession
+        self._refs = {}      # key -> attached views
+        self._timers = {}    # key -> grace QTimer
+        self._stopping = set()  # dropped sessions whose inference thread is still running
+
+    def sessions(self):
+        return list(self._sessions.values())
+
+    def acquire(self, config: SessionConfig):
+        key = config.key()
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+
+        session = self._sessions.get(key)
+        if session is None:
+            session = InferenceSession(config, group_factory=self.group_factory, parent=self)
+            session.error.connect(lambda _msg, k=key: self._drop(k))
+            self._sessions[key] = session
+            self._refs[key] = 0
+            session.start()
+            self.sessions_changed.emit()
+
+        self._refs[key] += 1
+        return session
+
+    def release(self, session):
+        key = session.config.key()
+        if key not in self._sessions:
+            return
+        self._refs[key] = max(0, self._refs[key] - 1)
+        if self._refs[key] > 0:
+            return
+
+        grace_s = load_grace_seconds() if self.grace_s is None else float(self.grace_s)
+        if grace_s <= 0:
+            self._drop(key)
+            return
+
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(int(grace_s * 1000))
+        timer.timeout.connect(lambda k=key: self._expire(k))
+        self._timers[key] = timer
+        timer.start()
+
+    def _expire(self, key):
+        self._timers.pop(key, None)
+        if self._refs.get(key, 0) == 0:
+            self._drop(key)
+
+    def _drop(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        session = self._sessions.pop(key, None)
+        self._refs.pop(key, None)
+        if session is None:
+            return
+        session.stop()
+        if session.is_thread_running():
+            self._stopping.add(session)
+            session.thread_finished.connect(lambda s=session: self._stopping.discard(s))
+        session.delete_when_stopped()
+        self.sessions_changed.emit()
+
+    def drop_idle(self, device_path):
+        """Stops the sessions on `device_path` that only run for their grace period."""
+        for key, session in list(self._sessions.items()):
+            if session.config.device_path == device_path and self._refs.get(key, 0) == 0:
+                self._drop(key)
+
+    def shutdown(self):
+        for key in list(self._sessions):
+            self._drop(key)
+        # The app is going away: nothing deferred would run, so wait here,
+        # also for sessions dropped earlier (grace 0 drops them as the windows close)
+        for session in list(self._stopping):
+            session.wait_stopped()
+        self._stopping.clear()
+
+
+_manager = None
+
+
+def session_manager():
+    """Application-wide SessionManager (stopped when the app quits)."""
+    global _manager
+    if _manager is None:
+        app = QApplication.instance()
+        _manager = SessionManager(parent=app)
+        app.aboutToQuit.connect(_manager.shutdown)
+    return _manager
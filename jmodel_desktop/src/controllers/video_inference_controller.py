@@ -1,250 +1,228 @@
-from PySide6.QtCore import QObject, Signal, Slot, QThread, Qt, QEvent
-from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QLabel
-
-import threading
 import time
-import numpy as np
-import cv2
-from ultralytics import YOLO
-
-class SharedFrame:
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._frame = None
-
-    def set(self, frame):
-        with self._lock:
-            self._frame = frame
-
-    def get_copy(self):
-        with self._lock:
-            if self._frame is None:
-                return None
-            return self._frame.copy()
-
-class CaptureWorker(QObject):
-    video_qimage = Signal(object)  # QImage
-    error = Signal(str)
-    finished = Signal()
-
-    def __init__(self, capture_source, shared: SharedFrame, use_gstreamer=True, ui_fps=15, parent=None):
-        super().__init__(parent)
-        self.capture_source = capture_source
-        self.shared = shared
-        self.use_gstreamer = use_gstreamer
-        self.ui_period = 1.0 / float(ui_fps)
-        self._running = False
-
-    @Slot()
-    def run(self):
-
-        cap = cv2.VideoCapture(self.capture_source, cv2.CAP_GSTREAMER if self.use_gstreamer else 0)
-        if not cap.isOpened():
-            self.error.emit("Could not open video capture source.")
-            self.finished.emit()
-            return
 
-        self._running = True
-        last_emit = 0.0
-        fail_count = 0
-
-        while self._running:
-            ok, frame = cap.read()
-            if not ok or frame is None:
-                fail_count += 1
-                time.sleep(0.01)  # evita busy loop
-                if fail_count > 100:
-                    self.error.emit("Capture stalled (too many read failures).")
-                    break
-                continue
-
-            fail_count = 0
-            self.shared.set(frame)
-
-            now = time.monotonic()
-            if (now - last_emit) >= self.ui_period:
-                frame = np.ascontiguousarray(frame)
-                h, w = frame.shape[:2]
-                qimg = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888).copy()
-                self.video_qimage.emit(qimg)
-                last_emit = now
-
-        cap.release()
-        self.finished.emit()
+from PySide6.QtCore import Qt, QObject, QEvent, QTimer
+from PySide6.QtGui import QAction, QPixmap
+from PySide6.QtWidgets import QFileDialog, QLabel
 
-    def stop(self):
-        self._running = False
+from ..core import tracing
+from .inference_session import SessionConfig
+from .session_manager import session_manager
+from ..utils.diagnostics import add_profiler_actions, add_trace_actions
+from ..service.session_settings import (
+    load_frame_trace,
+    load_sync_delay_ms,
+    load_sync_overlay,
+    save_frame_trace,
+    save_sync_overlay,
+)
 
 
-class InferenceWorker(QObject):
-    infer_qimage = Signal(object)  # QImage
-    error = Signal(str)
-    finished = Signal()
-
-    def __init__(self, model_path, shared: SharedFrame, infer_fps=6, parent=None):
-        super().__init__(parent)
-        self.model_path = model_path
-        self.shared = shared
-        self.infer_period = 1.0 / float(infer_fps)
-        self._running = False
-
-    @Slot()
-    def run(self):
-
-        model = YOLO(self.model_path, task="detect")
-        try:
-            dummy = np.zeros((640, 640, 3), dtype=np.uint8)
-            _ = model.predict(dummy, verbose=False)
-        except Exception as e:
-            self.error.emit(f"Model not usable (engine/TRT mismatch): {e}")
-            self.finished.emit()
-            return
-        self._running = True
-        last_infer = 0.0
-
-        while self._running:
-            now = time.monotonic()
-            if (now - last_infer) < self.infer_period:
-                time.sleep(0.005)
-                continue
-
-            frame = self.shared.get_copy()
-            if frame is None:
-                time.sleep(0.01)
-                continue
-
-            last_infer = now
-
-            try:
-                import cv2
-                small = cv2.resize(frame, (640, 640), interpolation=cv2.INTER_LINEAR)
-                results = model.predict(small, verbose=False)
-                
-                annotated = results[0].plot()  # numpy BGR
-                annotated = np.ascontiguousarray(annotated)
-                h, w = annotated.shape[:2]
-                qimg = QImage(annotated.data, w, h, annotated.strides[0], QImage.Format_BGR888).copy()
-                self.infer_qimage.emit(qimg)
-            except Exception as e:
-                self.error.emit(f"Inference error: {e}")
-                break
-
-        self.finished.emit()
+class VideoInferenceController(QObject):
+    """
+    View side of a video inference window. The capture and inference work
+    lives in a shared InferenceSession that outlives the window for a
+    grace period, so reopening the same (device, model) is instant.
+    """
 
-    def stop(self):
-        self._running = False
+    _VISIBILITY_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose)
 
-class VideoInferenceController(QObject):
-    def __init__(self, window, model_path, device_path, width=1280, height=720, fps=30, parent=None):
+    def __init__(self, window, model_path, device_path, width=1280, height=720, fps=30, task="detect", extra_models=(), classifier_path=None,
+                 infer_fps=6, ui_fps=15, imgsz=640, parent=None):
         super().__init__(parent)
         self.window = window
-        self.model_path = model_path
-        self.device_path = device_path
-        self.width = width
-        self.height = height
-        self.fps = fps
+        self.config = SessionConfig(
+            device_path=device_path,
+            model_path=model_path,
+            task=task,
+            # Extra (model_path, task) pairs that share this session's frames
+            extra_models=extra_models,
+            classifier_path=classifier_path,
+            width=width,
+            height=height,
+            fps=fps,
+            infer_fps=infer_fps,
+            ui_fps=ui_fps,
+            imgsz=imgsz,
+        )
 
+        self._session = None
+        self._visible = None
+        self._handle = None  # QWindow, watched for Expose once the window exists
         self._resolve_widgets()
         self.window.installEventFilter(self)
 
-        # Reduce trabajo por frame
-        self.label_video.setScaledContents(True)
-        self.label_inference.setScaledContents(True)
-
-        self._shared = SharedFrame()
-
-        self._capture_thread = None
-        self._infer_thread = None
-        self._capture_worker = None
-        self._infer_worker = None
-
-        self._start()
-
-    def _require(self, widget_type, object_name):
-        w = self.window.findChild(widget_type, object_name)
-        if w is None:
-            raise RuntimeError(f"Widget not found: {object_name} ({widget_type.__name__})")
-        return w
-
-    def _resolve_widgets(self):
-        self.label_video = self._require(QLabel, "label_video")
-        self.label_inference = self._require(QLabel, "label_inference")
-
-    def _build_gstreamer_pipeline_mjpeg(self):
-        return (
-            f"v4l2src device={self.device_path} io-mode=2 ! "
-            f"image/jpeg,width={self.width},height={self.height},framerate={self.fps}/1 ! "
-            "jpegdec ! videoconvert ! "
-            "queue leaky=downstream max-size-buffers=1 ! "
-            "appsink max-buffers=1 drop=true sync=false"
+        # Frames arrive already scaled to the label size; the GUI thread only blits
+        for label in (self.label_video, self.label_inference):
+            label.setScaledContents(False)
+            label.setAlignment(Qt.AlignCenter)
+            label.installEventFilter(self)
+
+        # Frame timing: seq of the image each label is about to paint
+        self._trace = None
+        self._pending_paint = {}
+        self._timing_label = QLabel(self.label_inference)
+        self._timing_label.setStyleSheet(
+            "background: rgba(0, 0, 0, 160); color: #e5e7eb; font-family: monospace; padding: 4px;"
         )
+        self._timing_label.move(4, 4)
+        self._timing_label.hide()
+
+        self._build_menu()
+
+        # Status bar stats at a fixed low rate, never per frame
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(500)
+        self._stats_timer.timeout.connect(self._show_stats)
+
+        self._attach()
+
+    def _build_menu(self):
+        view_menu = self.window.menuBar().addMenu("View")
+        self.action_sync = QAction("Synchronised overlay", self.window)
+        self.action_sync.setCheckable(True)
+        self.action_sync.setChecked(load_sync_overlay())
+        self.action_sync.setToolTip("Delay the live view so it shows the frame the inference belongs to")
+        self.action_sync.toggled.connect(self._on_sync_toggled)
+        view_menu.addAction(self.action_sync)
+
+        view_menu.addSeparator()
+        self.action_timing = QAction("Frame timing", self.window)
+        self.action_timing.setCheckable(True)
+        self.action_timing.setChecked(load_frame_trace())
+        self.action_timing.setToolTip("Per-stage latency from capture to paint")
+        self.action_timing.toggled.connect(self._on_timing_toggled)
+        view_menu.addAction(self.action_timing)
+
+        self.action_export_timing = QAction("Export frame timing...", self.window)
+        self.action_export_timing.triggered.connect(self._export_timing)
+        view_menu.addAction(self.action_export_timing)
+
+        view_menu.addSeparator()
+        add_trace_actions(view_menu, self.window)
+        add_profiler_actions(view_menu, self.window)
+
+    def _on_sync_toggled(self, enabled):
+        save_sync_overlay(enabled)
+        if self._session is not None:
+            self._session.set_sync(enabled, load_sync_delay_ms())
+
+    def _on_timing_toggled(self, enabled):
+        save_frame_trace(enabled)
+        self._apply_timing()
+
+    def _apply_timing(self):
+        enabled = self.action_timing.isChecked() and self._session is not None
+        self._trace = self._session.set_frame_trace(enabled) if self._session is not None else None
+        self._pending_paint.clear()
+        self.action_export_timing.setEnabled(self._trace is not None)
+        self._timing_label.setVisible(self._trace is not None)
+
+    def _export_timing(self):
+        if self._trace is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self.window, "Export frame timing", "frame_timing.json", "JSON (*.json)")
+        if not path:
+            return
+        self._trace.export_json(path, extra={"session": self.config.label()})
+        self.window.statusBar().showMessage(f"Frame timing exported to {path}")
 
-    def _start(self):
-        pipeline = self._build_gstreamer_pipeline_mjpeg()
-
-        # Capture thread
-        self._capture_thread = QThread(self.window)
-        self._capture_worker = CaptureWorker(
-            capture_source=pipeline,
-            shared=self._shared,
-            use_gstreamer=True,
-            ui_fps=15,
-        )
-        self._capture_worker.moveToThread(self._capture_thread)
-        self._capture_thread.started.connect(self._capture_worker.run)
-        self._capture_worker.video_qimage.connect(self._on_video_qimage)
-        self._capture_worker.error.connect(self._on_error)
-
-        # Inference thread
-        self._infer_thread = QThread(self.window)
-        self._infer_worker = InferenceWorker(
-            model_path=self.model_path,
-            shared=self._shared,
-            infer_fps=6,
+    def _resolve_widgets(self):
+        self.label_video = self.window.ui.label_video
+        self.label_inference = self.window.ui.label_inference
+
+    def _attach(self):
+        self._session = session_manager().acquire(self.config)
+        self._session.video_qimage.connect(self._on_video_qimage)
+        self._session.infer_qimage.connect(self._on_infer_qimage)
+        self._session.error.connect(self._on_error)
+        self._session.set_sync(self.action_sync.isChecked(), load_sync_delay_ms())
+        self._apply_timing()
+        self._report_view_size()
+        self._visible = None
+        self._update_visibility()
+        self._stats_timer.start()
+
+    def _show_stats(self):
+        if self._session is not None and self._visible:
+            self.window.statusBar().showMessage(self._session.stats.format_line())
+            if self._trace is not None:
+                self._timing_label.setText(self._trace.format_table())
+                self._timing_label.adjustSize()
+
+    def _update_visibility(self):
+        """Shown, not minimized and exposed; otherwise the session stops building images."""
+        if self._handle is None and self.window.windowHandle() is not None:
+            self._handle = self.window.windowHandle()
+            self._handle.installEventFilter(self)
+        visible = (
+            self.window.isVisible()
+            and not self.window.isMinimized()
+            and (self._handle is None or self._handle.isExposed())
         )
-        self._infer_worker.moveToThread(self._infer_thread)
-        self._infer_thread.started.connect(self._infer_worker.run)
-        self._infer_worker.infer_qimage.connect(self._on_infer_qimage)
-        self._infer_worker.error.connect(self._on_error)
-
-        # Cleanup
-        self._capture_worker.finished.connect(self._capture_thread.quit)
-        self._capture_worker.finished.connect(self._capture_worker.deleteLater)
-        self._capture_thread.finished.connect(self._capture_thread.deleteLater)
-
-        self._infer_worker.finished.connect(self._infer_thread.quit)
-        self._infer_worker.finished.connect(self._infer_worker.deleteLater)
-        self._infer_thread.finished.connect(self._infer_thread.deleteLater)
-
-        self._capture_thread.start()
-        self._infer_thread.start()
+        if visible != self._visible and self._session is not None:
+            self._visible = visible
+            self._session.set_view_visible(self, visible)
+
+    def _report_view_size(self):
+        if self._session is not None:
+            self._session.set_view_size(
+                self,
+                (self.label_video.width(), self.label_video.height()),
+                (self.label_inference.width(), self.label_inference.height()),
+            )
+
+    def detach(self):
+        if self._session is None:
+            return
+        self._stats_timer.stop()
+        session, self._session = self._session, None
+        session.video_qimage.disconnect(self._on_video_qimage)
+        session.infer_qimage.disconnect(self._on_infer_qimage)
+        session.error.disconnect(self._on_error)
+        session.clear_view_size(self)
+        session.set_view_visible(self, False)
+        if self._trace is not None:
+            session.set_frame_trace(False)
+            self._trace = None
+            self._pending_paint.clear()
+        session_manager().release(session)
 
     def stop(self):
-        if self._capture_worker:
-            self._capture_worker.stop()
-        if self._infer_worker:
-            self._infer_worker.stop()
-
-        if self._capture_thread:
-            self._capture_thread.quit()
-            self._capture_thread.wait(1500)
-
-        if self._infer_thread:
-            self._infer_thread.quit()
-            self._infer_thread.wait(1500)
+        self.detach()
 
     def eventFilter(self, watched, event):
         if watched == self.window and event.type() == QEvent.Close:
-            self.stop()
+            self.detach()
+        elif watched in (self.window, self._handle) and event.type() in self._VISIBILITY_EVENTS:
+            self._update_visibility()
+        elif event.type() == QEvent.Resize and watched in (self.label_video, self.label_inference):
+            self._report_view_size()
+        elif event.type() == QEvent.Paint and self._trace is not None:
+            seq = self._pending_paint.pop(watched, None)
+            if seq is not None:
+                path = "inference" if watched is self.label_inference else "preview"
+                self._trace.complete(seq, path)
         return super().eventFilter(watched, event)
 
     def _on_video_qimage(self, qimg):
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
         self.label_video.setPixmap(QPixmap.fromImage(qimg))
+        if tr is not None:
+            tr.add("gui.set_pixmap video", t0)
+        if self._trace is not None and qimg.text("seq"):
+            self._pending_paint[self.label_video] = int(qimg.text("seq"))
 
     def _on_infer_qimage(self, qimg):
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
         self.label_inference.setPixmap(QPixmap.fromImage(qimg))
+        if tr is not None:
+            tr.add("gui.set_pixmap inference", t0)
+        if self._trace is not None and qimg.text("seq"):
+            self._pending_paint[self.label_inference] = int(qimg.text("seq"))
 
     def _on_error(self, msg: str):
         print("[VideoInference] ERROR:", msg)
-        self.stop()
\ No newline at end of file
+        self.window.statusBar().showMessage(f"Error: {msg}")
+        self.detach()
@@ -0,0 +1,255 @@
+"""
+Auto-tuning of capture and inference settings for one device + model.
+
+Short timed trials over a grid of capture size/fps, inference rate, UI
+(preview) rate and inference size, each one the real capture + inference
+path: a broker subscription feeding core.inference.InferenceLoop. The
+pick is the configuration with the highest inference fps whose p95
+capture -> result latency stays within the target. Among those within 5 %
+of the best fps, the one that keeps the most detail wins (larger imgsz,
+then larger delivered frames), then the one asking for fewer inferences,
+then the lowest latency. Trials where the camera delivered another size
+than requested are kept for the record but never picked: their settings
+would not produce what was measured.
+"""
+import itertools
+import threading
+import time
+
+from .broker import capture_broker
+from .frames import FrameRing, SharedFrame
+from .inference import InferenceLoop
+from .model_group import ModelGroup
+from .stats import StatsAggregator
+
+DEFAULT_GRID = {
+    "size": ((1280, 720), (640, 480)),
+    "fps": (30,),
+    "infer_fps": (6, 10, 15, 30),
+    "ui_fps": (15,),
+    "imgsz": (640, 480, 320),
+}
+DEFAULT_LATENCY_TARGET_MS = 150.0
+FPS_TOLERANCE = 0.05  # within 5 % of the best counts as "as fast"
+SETTINGS_KEYS = ("width", "height", "fps", "infer_fps", "ui_fps", "imgsz")
+
+
+def grid_configs(grid=None):
+    """Every combination of the grid as a settings dict; inference never asks for more fps than the capture."""
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    configs = []
+    for (w, h), fps, imgsz, infer_fps, ui_fps in itertools.product(
+        grid["size"], grid["fps"], grid["imgsz"], grid["infer_fps"], grid["ui_fps"],
+    ):
+        if infer_fps > fps:
+            continue
+        configs.append({"width": w, "height": h, "fps": fps, "infer_fps": infer_fps,
+                        "ui_fps": min(ui_fps, fps), "imgsz": imgsz})
+    return configs
+
+
+def pick_best(trials, latency_target_ms):
+    """Best trial (see module docstring) or None when none met the target."""
+    ok = [
+        t for t in trials
+        if t["error"] is None and t["results"] and not t["size_mismatch"]
+        and t["latency_p95_ms"] <= latency_target_ms
+    ]
+    if not ok:
+        return None
+    fastest = max(t["infer_fps_measured"] for t in ok)
+    near = [t for t in ok if t["infer_fps_measured"] >= fastest * (1.0 - FPS_TOLERANCE)]
+    return max(near, key=lambda t: (t["imgsz"], t["frame_size"][0] * t["frame_size"][1],
+                                    -t["infer_fps"], -t["latency_p95_ms"]))
+
+
+def _capture_mode(config):
+    return config["width"], config["height"], config["fps"]
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+class _KeepLoaded:
+    """A model group shared by several trials: InferenceLoop's load/close become no-ops."""
+
+    def __init__(self, group):
+        self.group = group
+        self.error = None
+        try:
+            group.load()
+        except Exception as e:
+            group.close()
+            self.error = f"Model not usable at this size: {e}"
+
+    def load(self):
+        if self.error is not None:
+            raise RuntimeError(self.error)
+
+    def close(self):
+        pass
+
+    def infer(self, frame, seq=None, trace=None):
+        return self.group.infer(frame, seq=seq, trace=trace)
+
+    def memory_bytes(self):
+        return self.group.memory_bytes()
+
+
+class AutoTuner:
+    """
+    Runs the trials on the calling thread (minutes: run it off the GUI
+    thread). The device must not be in use, since capture parameters
+    only apply to its first subscriber.
+
+    :param models: list of (model_path, task), as for InferenceLoop
+    :param group_factory: callable(models, imgsz) -> model group; default ModelGroup
+    :param on_preview: callable(seq, frame) run at ui_fps on the capture
+                       thread, i.e. what a view costs (the GUI passes its
+                       QImage conversion)
+    :param on_progress: callable(done, total, trial or None)
+    """
+
+    def __init__(self, device, models, grid=None, latency_target_ms=DEFAULT_LATENCY_TARGET_MS,
+                 trial_seconds=3.0, warmup_seconds=1.0, classifier_path=None,
+                 group_factory=None, on_preview=None, on_progress=None):
+        self.device = device
+        self.models = list(models)
+        self.configs = grid_configs(grid)
+        self.latency_target_ms = latency_target_ms
+        self.trial_seconds = trial_seconds
+        self.warmup_seconds = warmup_seconds
+        self.classifier_path = classifier_path
+        self.group_factory = group_factory
+        self.on_preview = on_preview
+        self.on_progress = on_progress
+        self.trials = []
+        self._groups = {}  # imgsz -> _KeepLoaded
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def _group(self, imgsz):
+        group = self._groups.get(imgsz)
+        if group is None:
+            if self.group_factory is not None:
+                built = self.group_factory(self.models, imgsz)
+            else:
+                built = ModelGroup(self.models, imgsz=imgsz, classifier_path=self.classifier_path)
+            group = self._groups[imgsz] = _KeepLoaded(built)
+        return group
+
+    def run(self):
+        """
+        Returns {"best": settings dict or None, "trials": [...],
+        "latency_target_ms", "cancelled"}.
+        """
+        broker = capture_broker()
+        if self.device in broker.devices():
+            raise RuntimeError(f"{self.device} is in use; close its sessions before auto-tuning")
+
+        total = len(self.configs)
+        if self.on_progress is not None:
+            self.on_progress(0, total, None)
+        try:
+            # Grouped by capture mode: one open per mode, held between its trials
+            for mode, configs in itertools.groupby(sorted(self.configs, key=_capture_mode), key=_capture_mode):
+                w, h, fps = mode
+                hold = broker.subscribe(self.device, name="autotune", width=w, height=h, fps=fps)
+                try:
+                    for config in configs:
+                        if self._stop.is_set():
+                            break
+                        trial = self._trial(config)
+                        self.trials.append(trial)
+                        if self.on_progress is not None:
+                            self.on_progress(len(self.trials), total, trial)
+                finally:
+                    broker.unsubscribe(hold)
+                if self._stop.is_set():
+                    break
+        finally:
+            for group in self._groups.values():
+                group.group.close()
+            self._groups.clear()
+
+        best = pick_best(self.trials, self.latency_target_ms)
+        return {
+            "best": {k: best[k] for k in SETTINGS_KEYS} if best is not None else None,
+            "trials": self.trials,
+            "latency_target_ms": self.latency_target_ms,
+            "cancelled": self._stop.is_set(),
+        }
+
+    def _trial(self, config):
+        trial = {**config, "error": None, "results": 0, "infer_fps_measured": 0.0, "capture_fps": 0.0,
+                 "latency_p50_ms": None, "latency_p95_ms": None, "frame_size": None, "size_mismatch": False}
+        group = self._group(config["imgsz"])
+        if group.error is not None:
+            trial["error"] = group.error
+            return trial
+
+        shared = SharedFrame()
+        clock = FrameRing(256)  # (seq, t) of frames handed to inference
+        latencies = []
+        counts = {"frames": 0}
+        measuring = threading.Event()
+        errors = []
+
+        def on_frame(seq, frame):
+            now = time.monotonic()
+            clock.push(seq, None, now)
+            shared.set(frame, seq)
+            if measuring.is_set():
+                counts["frames"] += 1
+                trial["frame_size"] = (frame.shape[1], frame.shape[0])
+
+        def on_result(frame, overlay):
+            entry = clock.find(overlay.seq)
+            if entry is not None and measuring.is_set():
+                latencies.append(time.monotonic() - entry[1])
+
+        loop = InferenceLoop(
+            self.models, shared,
+            infer_fps=config["infer_fps"],
+            on_result=on_result,
+            on_error=errors.append,
+            stats=StatsAggregator(),
+            group=group,
+        )
+        thread = threading.Thread(target=loop.run, name="autotune inference", daemon=True)
+        thread.start()
+        broker = capture_broker()
+        capture = dict(width=config["width"], height=config["height"], fps=config["fps"])
+        subs = [broker.subscribe(self.device, name="autotune infer", on_frame=on_frame,
+                                 on_error=errors.append, **capture)]
+        if self.on_preview is not None:
+            subs.append(broker.subscribe(self.device, name="autotune preview", max_fps=config["ui_fps"],
+                                         on_frame=self.on_preview, **capture))
+        try:
+            self._stop.wait(self.warmup_seconds)
+            measuring.set()
+            started = time.monotonic()
+            self._stop.wait(self.trial_seconds)
+            measuring.clear()
+            elapsed = time.monotonic() - started
+        finally:
+            for sub in subs:
+                broker.unsubscribe(sub)
+            loop.stop()
+            thread.join(5.0)
+
+        if errors:
+            trial["error"] = errors[0]
+        if trial["frame_size"] is not None:
+            trial["size_mismatch"] = trial["frame_size"] != (config["width"], config["height"])
+        latencies.sort()
+        trial["results"] = len(latencies)
+        trial["infer_fps_measured"] = len(latencies) / elapsed
+        trial["capture_fps"] = counts["frames"] / elapsed
+        if latencies:
+            trial["latency_p50_ms"] = _percentile(latencies, 0.50) * 1000.0
+            trial["latency_p95_ms"] = _percentile(latencies, 0.95) * 1000.0
+        return trial
@@ -0,0 +1,240 @@
+"""
+Offline processing of recorded video files, tuned for throughput.
+
+Unlike the live paths nothing is dropped: the decoder blocks when the
+inference stage is behind, and the inference stage blocks when the
+encoders are behind. Rendering runs on a pool sized to the machine,
+while a single writer keeps the output video in frame order.
+
+    python -m jmodel_desktop.src.core.batch_video input.mp4 --model yolo11n.pt \
+        --out annotated.mp4 --detections detections.jsonl --batch 8
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+from .model_group import ModelGroup
+from ..service.models import guess_task
+from .overlay import overlay_to_dict, render_overlay
+
+_END = object()
+
+
+class BatchVideoProcessor:
+    def __init__(self, input_path, models, out_path=None, detections_path=None, batch_size=8,
+                 imgsz=640, classifier_path=None, workers=None):
+        """
+        :param models: list of (model_path, task)
+        :param workers: render/encode threads (default: all cores)
+        """
+        self.input_path = input_path
+        self.models = models
+        self.out_path = out_path
+        self.detections_path = detections_path
+        self.batch_size = max(1, int(batch_size))
+        self.imgsz = imgsz
+        self.classifier_path = classifier_path
+        self.workers = workers or os.cpu_count() or 4
+
+        self.frames = 0
+        self.wall_time = 0.0
+        self._errors = []
+
+    # ---------- Stages ----------
+    @staticmethod
+    def _put(q, item, stop):
+        """Blocking put that gives up once `stop` is set (nobody is reading any more)."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _decode(self, cap, frames_q, stop):
+        try:
+            seq = 0
+            while not stop.is_set():
+                ok, frame = cap.read()
+                if not ok or frame is None:
+                    break
+                seq += 1
+                if not self._put(frames_q, (seq, frame), stop):  # blocks instead of dropping
+                    break
+        except Exception as e:
+            self._errors.append(f"decode: {e}")
+        finally:
+            self._put(frames_q, _END, stop)
+
+    # Writers keep draining their queue after an error so the producer never blocks
+    def _write_video(self, writer, video_q):
+        while True:
+            future = video_q.get()
+            if future is _END:
+                break
+            if self._errors:
+                continue
+            try:
+                writer.write(future.result())
+            except Exception as e:
+                self._errors.append(f"encode: {e}")
+
+    def _write_detections(self, fh, det_q, frame_w, frame_h):
+        while True:
+            item = det_q.get()
+            if item is _END:
+                break
+            if self._errors:
+                continue
+            try:
+                fh.write(json.dumps(overlay_to_dict(item, frame_w, frame_h)))
+                fh.write("\n")
+            except Exception as e:
+                self._errors.append(f"detections: {e}")
+
+    @staticmethod
+    def _render(frame, overlay):
+        return render_overlay(frame, overlay)
+
+    def _next_batch(self, frames_q):
+        item = frames_q.get()
+        if item is _END:
+            return [], True
+        batch = [item]
+        while len(batch) < self.batch_size:
+            item = frames_q.get()
+            if item is _END:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    # ---------- Run ----------
+    def run(self):
+        cap = cv2.VideoCapture(self.input_path)
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open video file: {self.input_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        frame_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        try:
+            import torch
+            torch.set_num_threads(os.cpu_count() or 1)
+        except ImportError:
+            pass
+
+        group = ModelGroup(self.models, imgsz=self.imgsz, classifier_path=self.classifier_path)
+        group.load()
+
+        writer = None
+        if self.out_path:
+            writer = cv2.VideoWriter(self.out_path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (frame_w, frame_h))
+            if not writer.isOpened():
+                raise RuntimeError(f"Could not open video writer: {self.out_path}")
+        det_fh = open(self.detections_path, "w", encoding="utf-8") if self.detections_path else None
+
+        # Bounded queues give back-pressure end to end
+        frames_q = queue.Queue(maxsize=self.batch_size * 4)
+        video_q = queue.Queue(maxsize=self.workers * 4)
+        det_q = queue.Queue(maxsize=self.batch_size * 8)
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="render")
+        stop = threading.Event()
+        decoder = threading.Thread(target=self._decode, args=(cap, frames_q, stop), name="decode", daemon=True)
+        threads = [decoder]
+        if writer is not None:
+            threads.append(threading.Thread(target=self._write_video, args=(writer, video_q), name="encode", daemon=True))
+        if det_fh is not None:
+            threads.append(threading.Thread(
+                target=self._write_detections, args=(det_fh, det_q, frame_w, frame_h), name="detections", daemon=True
+            ))
+
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+
+        try:
+            done = False
+            while not done and not self._errors:
+                batch, done = self._next_batch(frames_q)
+                if not batch:
+                    break
+                seqs = [seq for seq, _ in batch]
+                frames = [frame for _, frame in batch]
+                overlays = group.infer_batch(frames, seqs)
+
+                for frame, overlay in zip(frames, overlays):
+                    if writer is not None:
+                        video_q.put(pool.submit(self._render, frame, overlay))
+                    if det_fh is not None:
+                        det_q.put(overlay)
+                self.frames += len(batch)
+        finally:
+            # The decoder may be blocked on a full queue (inference failed) or
+            # inside cap.read(): stop it, drain, and only then release the capture
+            stop.set()
+            while decoder.is_alive():
+                try:
+                    while True:
+                        frames_q.get_nowait()
+                except queue.Empty:
+                    pass
+                decoder.join(0.05)
+            video_q.put(_END)
+            det_q.put(_END)
+            for t in threads[1:]:
+                t.join()
+            pool.shutdown(wait=True)
+            group.close()
+            cap.release()
+            if writer is not None:
+                writer.release()
+            if det_fh is not None:
+                det_fh.close()
+
+        self.wall_time = time.perf_counter() - started
+        if self._errors:
+            raise RuntimeError("; ".join(self._errors))
+        return self.frames, self.wall_time
+
+    def summary(self):
+        fps = self.frames / self.wall_time if self.wall_time > 0 else 0.0
+        return f"{self.frames} frames in {self.wall_time:.2f} s ({fps:.1f} fps, batch={self.batch_size}, workers={self.workers})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Process a recorded video file with no dropped frames.")
+    parser.add_argument("input", help="video file to process")
+    parser.add_argument("--model", action="append", required=True, help="model path (repeat for several models)")
+    parser.add_argument("--classifier", default=None, help="optional crop classifier model")
+    parser.add_argument("--out", default=None, help="annotated output video (.mp4)")
+    parser.add_argument("--detections", default=None, help="detections output (.jsonl)")
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--workers", type=int, default=None, help="render/encode threads (default: all cores)")
+    args = parser.parse_args(argv)
+
+    processor = BatchVideoProcessor(
+        args.input,
+        models=[(path, guess_task(path)) for path in args.model],
+        out_path=args.out,
+        detections_path=args.detections,
+        batch_size=args.batch,
+        imgsz=args.imgsz,
+        classifier_path=args.classifier,
+        workers=args.workers,
+    )
+    processor.run()
+    print(processor.summary())
+
+
+if __name__ == "__main__":
+    main()
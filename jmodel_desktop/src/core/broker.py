@@ -0,0 +1,260 @@
+"""
+Capture broker: one capture pipeline per device, fanned out to any number
+of subscribers (previews, inference sessions, recorders).
+
+Frames are decoded once and shared by reference, so subscribers must
+treat them as read-only (copy before drawing on them).
+"""
+import threading
+import time
+from collections import deque
+
+from . import tracing
+from .capture import CaptureLoop, capture_source_for, is_live_source
+from .frame_trace import CAPTURE, DECODE, FrameTrace
+
+# Drop policies for pull (queue) subscriptions
+LATEST = "latest"            # keep only the newest frame
+DROP_OLDEST = "drop_oldest"  # bounded queue, evict the oldest when full
+DROP_NEWEST = "drop_newest"  # bounded queue, reject new frames when full
+POLICIES = (LATEST, DROP_OLDEST, DROP_NEWEST)
+
+
+class Subscription:
+    """
+    One consumer of a device. Either push (`on_frame(seq, frame)` runs on
+    the capture thread, keep it cheap) or pull (`get()` from the consumer's
+    own thread, with the drop policy applied when it falls behind).
+    `max_fps` limits deliveries; frames skipped by it are not drops.
+    """
+
+    def __init__(self, device, name="", max_fps=None, policy=LATEST, queue_size=1, on_frame=None, on_error=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.device = device
+        self.name = name
+        self.policy = policy
+        self.queue_size = 1 if policy == LATEST else max(1, int(queue_size))
+        self.on_frame = on_frame
+        self.on_error = on_error
+
+        self.delivered = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.error = None
+        self.closed = False
+
+        self._period = 0.0
+        self._last = 0.0
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self.set_max_fps(max_fps)
+
+    def set_max_fps(self, max_fps):
+        """Can be changed while running (e.g. slower when the view is hidden)."""
+        self._period = 1.0 / float(max_fps) if max_fps else 0.0
+
+    def pending(self):
+        return len(self._queue)
+
+    # ---------- Capture thread side ----------
+    def _offer(self, seq, frame, now):
+        if self._period and (now - self._last) < self._period:
+            self.skipped += 1
+            return
+        self._last = now
+
+        if self.on_frame is not None:
+            self.on_frame(seq, frame)
+            self.delivered += 1
+            return
+
+        with self._cond:
+            if len(self._queue) >= self.queue_size:
+                self.dropped += 1
+                if self.policy == DROP_NEWEST:
+                    return
+                self._queue.popleft()
+            self._queue.append((seq, frame))
+            self._cond.notify()
+
+    def _close(self, error=None):
+        with self._cond:
+            self.error = error
+            self.closed = True
+            self._cond.notify_all()
+        if error and self.on_error is not None:
+            self.on_error(error)
+
+    # ---------- Consumer side ----------
+    def get(self, timeout=None):
+        """Returns (seq, frame), or None on timeout / when the capture ended."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._queue or self.closed, timeout):
+                return None
+            if not self._queue:
+                return None
+            self.delivered += 1
+            return self._queue.popleft()
+
+
+class _DeviceCapture:
+    def __init__(self, broker, device, width, height, fps):
+        self.broker = broker
+        self.device = device
+        self.params = (width, height, fps)
+        self.subscribers = ()  # replaced, never mutated, so the capture thread can iterate freely
+        self.seq = 0
+        self.frames = 0
+        self.trace = None  # FrameTrace while frame timing is on for this device
+        self._error = None
+
+        capture_source, use_gstreamer = capture_source_for(device, width, height, fps)
+        self.loop = CaptureLoop(
+            capture_source,
+            None,
+            use_gstreamer=use_gstreamer,
+            preview_fps=0,
+            on_error=self._on_error,
+            stop_on_eof=not is_live_source(device),
+            on_frame=self._fan_out,
+        )
+        self.thread = threading.Thread(target=self._run, name=f"capture {device}", daemon=True)
+
+    def set_trace(self, trace):
+        self.loop.timestamps = trace is not None
+        self.trace = trace
+
+    def _fan_out(self, frame):
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
+        self.seq += 1
+        self.frames += 1
+        trace = self.trace
+        if trace is not None:
+            trace.mark(self.seq, CAPTURE, self.loop.t_grabbed)
+            trace.mark(self.seq, DECODE, self.loop.t_decoded)
+        now = time.monotonic()
+        for sub in self.subscribers:
+            try:
+                sub._offer(self.seq, frame, now)
+            except Exception as e:
+                # A failing consumer loses its subscription, not the device
+                self.broker._subscriber_failed(self, sub, f"Frame callback failed ({sub.name or 'subscriber'}): {e}")
+        if tr is not None:
+            tr.add("broker.fan_out", t0, args={"seq": self.seq, "subscribers": len(self.subscribers)})
+
+    def _on_error(self, msg):
+        self._error = msg
+
+    def _run(self):
+        try:
+            self.loop.run()
+        finally:
+            self.broker._device_ended(self, self._error)
+
+
+class CaptureBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices = {}  # device -> _DeviceCapture
+
+    def subscribe(self, device, name="", max_fps=None, policy=LATEST, queue_size=1, on_frame=None,
+                  on_error=None, width=1280, height=720, fps=30):
+        """
+        Attaches to `device`, opening it if nobody else has. Capture
+        parameters only apply to the first subscriber of a device.
+        """
+        sub = Subscription(device, name, max_fps, policy, queue_size, on_frame, on_error)
+        with self._lock:
+            capture = self._devices.get(device)
+            start = capture is None
+            if start:
+                capture = _DeviceCapture(self, device, width, height, fps)
+                self._devices[device] = capture
+            elif capture.params != (width, height, fps):
+                print(f"[broker] {device} already open at {capture.params}; ignoring {(width, height, fps)}")
+            capture.subscribers = capture.subscribers + (sub,)
+        if start:
+            capture.thread.start()
+        return sub
+
+    def unsubscribe(self, sub, timeout=2.0):
+        with self._lock:
+            capture = self._devices.get(sub.device)
+            if capture is None or sub not in capture.subscribers:
+                return
+            capture.subscribers = tuple(s for s in capture.subscribers if s is not sub)
+            last = not capture.subscribers
+            if last:
+                del self._devices[sub.device]
+        sub._close()
+        if last:
+            capture.loop.stop()
+            if threading.current_thread() is not capture.thread:
+                capture.thread.join(timeout)
+
+    def _subscriber_failed(self, capture, sub, error):
+        """Called on the capture thread; the capture stops only if `sub` was its last subscriber."""
+        print(f"[broker] {capture.device}: {error}")
+        with self._lock:
+            capture.subscribers = tuple(s for s in capture.subscribers if s is not sub)
+            last = not capture.subscribers
+            if last and self._devices.get(capture.device) is capture:
+                del self._devices[capture.device]
+        if last:
+            capture.loop.stop()
+        sub._close(error)
+
+    def _device_ended(self, capture, error):
+        with self._lock:
+            if self._devices.get(capture.device) is capture:
+                del self._devices[capture.device]
+            subscribers, capture.subscribers = capture.subscribers, ()
+        for sub in subscribers:
+            sub._close(error)
+
+    def enable_frame_trace(self, device):
+        """Starts per-frame stage timing on an open device; returns its FrameTrace (or None)."""
+        with self._lock:
+            capture = self._devices.get(device)
+        if capture is None:
+            return None
+        if capture.trace is None:
+            capture.set_trace(FrameTrace())
+        return capture.trace
+
+    def disable_frame_trace(self, device):
+        with self._lock:
+            capture = self._devices.get(device)
+        if capture is not None:
+            capture.set_trace(None)
+
+    def devices(self):
+        """Snapshot for monitoring: {device: {"frames", "subscribers": [...]}}."""
+        with self._lock:
+            captures = list(self._devices.values())
+        return {
+            c.device: {
+                "frames": c.frames,
+                "subscribers": [
+                    {"name": s.name, "delivered": s.delivered, "dropped": s.dropped,
+                     "skipped": s.skipped, "pending": s.pending()}
+                    for s in c.subscribers
+                ],
+            }
+            for c in captures
+        }
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def capture_broker():
+    """Process-wide broker, so every window and session shares devices."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = CaptureBroker()
+        return _broker
@@ -0,0 +1,134 @@
+import functools
+import time
+
+import cv2
+
+from . import tracing
+from .sources import is_source_uri, open_source, source_is_live
+
+
+def build_gstreamer_pipeline_mjpeg(device_path, width=1280, height=720, fps=30):
+    return (
+        f"v4l2src device={device_path} io-mode=2 ! "
+        f"image/jpeg,width={width},height={height},framerate={fps}/1 ! "
+        "jpegdec ! videoconvert ! "
+        "queue leaky=downstream max-size-buffers=1 ! "
+        "appsink max-buffers=1 drop=true sync=false"
+    )
+
+
+def capture_source_for(source, width=1280, height=720, fps=30):
+    """
+    Maps a user-facing source to (capture_source, use_gstreamer):
+    "/dev/videoN" -> MJPEG GStreamer pipeline, "0"/"1" -> camera index,
+    synthetic:// replay:// images:// -> a core.sources factory,
+    anything else (file, rtsp://, ...) -> opened as-is by OpenCV.
+    """
+    source = str(source)
+    if is_source_uri(source):
+        return functools.partial(open_source, source, width, height, fps), False
+    if source.startswith("/dev/video"):
+        return build_gstreamer_pipeline_mjpeg(source, width, height, fps), True
+    if source.isdigit():
+        return int(source), False
+    return source, False
+
+
+def is_live_source(source):
+    source = str(source)
+    if is_source_uri(source):
+        return source_is_live(source)
+    return source.startswith("/dev/video") or source.isdigit() or "://" in source
+
+
+class CaptureLoop:
+    """
+    Reads frames into a SharedFrame as fast as the source delivers them.
+
+    Every `preview_period` seconds the latest frame is also handed to
+    `on_preview(frame)`; the caller decides what a preview is (a QImage
+    for the GUI, nothing at all when headless). `on_frame(frame)` sees
+    every frame (used by the capture broker; `shared` may then be None).
+    With `stop_on_eof` a read failure ends the loop quietly (video files)
+    instead of counting as a stall. `capture_source` can also be a
+    callable returning a VideoCapture-like object (core.sources).
+    """
+
+    def __init__(self, capture_source, shared, use_gstreamer=True, preview_fps=15,
+                 on_preview=None, on_error=None, stop_on_eof=False, on_frame=None):
+        self.capture_source = capture_source
+        self.shared = shared
+        self.on_frame = on_frame
+        self.use_gstreamer = use_gstreamer
+        self.stop_on_eof = stop_on_eof
+        self.preview_period = 1.0 / float(preview_fps) if preview_fps else None
+        self.on_preview = on_preview
+        self.on_error = on_error
+        # Frame tracing: perf_counter of the last grab / retrieve (set by the broker)
+        self.timestamps = False
+        self.t_grabbed = 0.0
+        self.t_decoded = 0.0
+        self._running = False
+
+    def _error(self, msg):
+        if self.on_error is not None:
+            self.on_error(msg)
+
+    def run(self):
+        if callable(self.capture_source):
+            try:
+                cap = self.capture_source()
+            except (OSError, ValueError) as e:
+                self._error(f"Could not open frame source: {e}")
+                return
+        else:
+            cap = cv2.VideoCapture(self.capture_source, cv2.CAP_GSTREAMER if self.use_gstreamer else cv2.CAP_ANY)
+        if not cap.isOpened():
+            self._error("Could not open video capture source.")
+            return
+
+        self._running = True
+        last_emit = 0.0
+        fail_count = 0
+
+        try:
+            while self._running:
+                tr = tracing.active
+                t_read = time.perf_counter() if tr is not None else 0.0
+                if self.timestamps:
+                    # read() == grab() + retrieve(); split only to time them
+                    ok = cap.grab()
+                    self.t_grabbed = time.perf_counter()
+                    ok, frame = cap.retrieve() if ok else (False, None)
+                    self.t_decoded = time.perf_counter()
+                else:
+                    ok, frame = cap.read()
+                if tr is not None:
+                    tr.add("capture.read", t_read)
+                if not ok or frame is None:
+                    if self.stop_on_eof:
+                        break
+                    fail_count += 1
+                    time.sleep(0.01)  # evita busy loop
+                    if fail_count > 100:
+                        self._error("Capture stalled (too many read failures).")
+                        break
+                    continue
+
+                fail_count = 0
+                if self.shared is not None:
+                    self.shared.set(frame)
+                if self.on_frame is not None:
+                    self.on_frame(frame)
+
+                if self.on_preview is None or self.preview_period is None:
+                    continue
+                now = time.monotonic()
+                if (now - last_emit) >= self.preview_period:
+                    self.on_preview(frame)
+                    last_emit = now
+        finally:
+            cap.release()
+
+    def stop(self):
+        self._running = False
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+import numpy as np
+import cv2
+
+
+class CropClassifier:
+    """
+    Second stage that classifies detection crops instead of the full frame.
+
+    Every crop of a frame is resized into one preallocated buffer and sent
+    to the classifier in a single predict call. Results are cached per
+    track id, so a tracked object is classified once, not every frame.
+    """
+
+    def __init__(self, model_path, crop_size=224, max_crops=32, cache_size=512):
+        self.model_path = model_path
+        self.crop_size = int(crop_size)
+        self.max_crops = int(max_crops)
+        self.cache_size = int(cache_size)
+
+        self._model = None
+        self._crops = np.zeros((self.max_crops, self.crop_size, self.crop_size, 3), dtype=np.uint8)
+        self._cache = OrderedDict()  # track_id -> (label, conf)
+
+    def load(self):
+        from ultralytics import YOLO
+
+        self._model = YOLO(self.model_path, task="classify")
+        # Warm-up with a full batch so the first real frame does not pay for it
+        self._model.predict(list(self._crops), imgsz=self.crop_size, verbose=False)
+
+    def reset(self):
+        self._cache.clear()
+
+    def classify(self, frame, boxes_xyxy, track_ids=None):
+        """
+        Returns a list of (label, conf) aligned with boxes_xyxy.
+
+        :param frame: BGR image the boxes refer to
+        :param boxes_xyxy: (N, 4) array in frame pixel coordinates
+        :param track_ids: optional sequence of N track ids (None = untracked)
+        """
+        n = len(boxes_xyxy)
+        labels = [None] * n
+        if n == 0:
+            return labels
+
+        h, w = frame.shape[:2]
+        pending = []  # (box index, track id)
+
+        for i in range(n):
+            track_id = track_ids[i] if track_ids is not None else None
+            if track_id is not None and track_id in self._cache:
+                self._cache.move_to_end(track_id)
+                labels[i] = self._cache[track_id]
+                continue
+
+            # Objects beyond the buffer are picked up on a later frame
+            if len(pending) >= self.max_crops:
+                continue
+
+            x1, y1, x2, y2 = (int(v) for v in boxes_xyxy[i])
+            x1, y1 = max(x1, 0), max(y1, 0)
+            x2, y2 = min(x2, w), min(y2, h)
+            if x2 <= x1 or y2 <= y1:
+                continue
+
+            cv2.resize(
+                frame[y1:y2, x1:x2],
+                (self.crop_size, self.crop_size),
+                dst=self._crops[len(pending)],
+                interpolation=cv2.INTER_LINEAR,
+            )
+            pending.append((i, track_id))
+
+        if not pending:
+            return labels
+
+        # One call for all crops of the frame (views into the buffer, no copies)
+        batch = [self._crops[k] for k in range(len(pending))]
+        results = self._model.predict(batch, imgsz=self.crop_size, verbose=False)
+
+        for (i, track_id), result in zip(pending, results):
+            probs = result.probs
+            label = (result.names[int(probs.top1)], float(probs.top1conf))
+            labels[i] = label
+            if track_id is not None:
+                self._cache[track_id] = label
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return labels
+
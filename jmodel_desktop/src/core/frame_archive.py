@@ -0,0 +1,225 @@
+"""
+Raw frame archive: exactly what the camera delivered, for reproducing
+field issues.
+
+An archive is two files:
+
+    NAME.raw  frames back to back, uncompressed (uint8, 64-byte aligned)
+    NAME.idx  16-byte header + one fixed-size record per frame:
+              seq, wall-clock time, offset, width, height, channels
+
+The writer appends through a growing memory map; the reader maps the file
+read-only and hands out frames as numpy views of the map (no copy, no
+decode). `ArchiveRecorder` does the writing on its own thread so the
+capture thread only queues a reference.
+"""
+import mmap
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+IDX_MAGIC = b"JMFRAMES\x01".ljust(16, b"\x00")
+IDX_DTYPE = np.dtype([
+    ("seq", "<i8"),
+    ("t", "<f8"),        # time.time() when the frame was captured
+    ("offset", "<i8"),   # byte offset in the .raw file
+    ("width", "<u4"),
+    ("height", "<u4"),
+    ("channels", "<u4"),
+    ("_pad", "<u4"),
+])
+ALIGN = 64
+GROW_BYTES = 256 * 1024 * 1024
+
+
+def archive_paths(path):
+    """NAME (with or without .raw/.idx) -> (raw path, idx path)."""
+    base, ext = os.path.splitext(path)
+    if ext not in (".raw", ".idx"):
+        base = path
+    return base + ".raw", base + ".idx"
+
+
+class FrameArchiveWriter:
+    """Appends frames to NAME.raw / NAME.idx. Not thread-safe: one writer thread."""
+
+    def __init__(self, path, grow_bytes=GROW_BYTES):
+        self.raw_path, self.idx_path = archive_paths(path)
+        self.grow_bytes = grow_bytes
+        self.frames = 0
+        self.bytes = 0  # used size of the .raw file
+        self._raw = open(self.raw_path, "w+b")
+        self._idx = open(self.idx_path, "wb")
+        self._idx.write(IDX_MAGIC)
+        self._mm = None
+        self._capacity = 0
+        self._record = np.zeros(1, dtype=IDX_DTYPE)
+
+    def _grow(self, needed):
+        capacity = self._capacity
+        while capacity < needed:
+            capacity += self.grow_bytes
+        if self._mm is not None:
+            self._mm.close()
+        self._raw.truncate(capacity)
+        self._mm = mmap.mmap(self._raw.fileno(), capacity)
+        self._capacity = capacity
+
+    def append(self, seq, frame, t=None):
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Only uint8 frames can be archived, got {frame.dtype}")
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        size = frame.nbytes
+        offset = -(-self.bytes // ALIGN) * ALIGN
+        if offset + size > self._capacity:
+            self._grow(offset + size)
+
+        # Straight copy into the page cache through the map
+        target = np.ndarray(frame.shape, dtype=np.uint8, buffer=self._mm, offset=offset)
+        target[...] = frame
+        self.bytes = offset + size
+
+        # The index record goes last, so it never points at missing data
+        r = self._record[0]
+        r["seq"], r["t"], r["offset"] = seq, time.time() if t is None else t, offset
+        r["width"], r["height"], r["channels"] = width, height, channels
+        self._idx.write(self._record.tobytes())
+        self.frames += 1
+
+    def flush(self):
+        if self._mm is not None:
+            self._mm.flush()
+        self._idx.flush()
+
+    def close(self):
+        if self._raw is None:
+            return
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+        self._raw.truncate(self.bytes)
+        self._raw.close()
+        self._idx.close()
+        self._raw = None
+
+
+class FrameArchiveReader:
+    """
+    Random access to an archive. `frame(i)` is a read-only view of the map:
+    valid for as long as it is referenced, even after close().
+    """
+
+    def __init__(self, path):
+        self.raw_path, self.idx_path = archive_paths(path)
+        with open(self.idx_path, "rb") as f:
+            if f.read(len(IDX_MAGIC)) != IDX_MAGIC:
+                raise ValueError(f"Not a frame archive index: {self.idx_path}")
+            data = f.read()
+        # A record cut short by a crash is ignored
+        usable = len(data) - len(data) % IDX_DTYPE.itemsize
+        self.index = np.frombuffer(data[:usable], dtype=IDX_DTYPE)
+        self._mm = None
+        if len(self.index):
+            with open(self.raw_path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._check_complete()
+        self.timestamps = self.index["t"]
+
+    def _check_complete(self):
+        last = self.index[-1]
+        end = int(last["offset"]) + int(last["width"]) * int(last["height"]) * int(last["channels"])
+        if end > len(self._mm):
+            # Data cut short (crash before the map was flushed): keep what is there
+            ends = self.index["offset"] + self.index["width"].astype(np.int64) * self.index["height"] * self.index["channels"]
+            self.index = self.index[ends <= len(self._mm)]
+
+    def __len__(self):
+        return len(self.index)
+
+    def frame(self, i):
+        r = self.index[i]
+        h, w, c = int(r["height"]), int(r["width"]), int(r["channels"])
+        shape = (h, w, c) if c > 1 else (h, w)
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._mm, offset=int(r["offset"]))
+
+    def seek_time(self, t):
+        """Index of the first frame captured at or after wall-clock time `t`."""
+        return int(np.searchsorted(self.timestamps, t, side="left"))
+
+    def duration(self):
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self) > 1 else 0.0
+
+    def close(self):
+        # Views handed out keep the map alive; it is unmapped once they are gone
+        self._mm = None
+
+
+class ArchiveRecorder:
+    """
+    Records every frame it is offered into an archive on a thread of its
+    own. `offer(seq, frame)` only queues a reference (use it as a broker
+    `on_frame` or CaptureLoop `on_frame`); when the disk falls behind
+    the newest frames are dropped and counted. Also usable as an
+    inference sink (write/close), which records only the inferred frames.
+    """
+
+    def __init__(self, path, queue_size=32, grow_bytes=GROW_BYTES):
+        self.writer = FrameArchiveWriter(path, grow_bytes)
+        self.dropped = 0
+        self.error = None
+        self._seq = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._sub = None
+        self._thread = threading.Thread(target=self._run, name=f"recorder {os.path.basename(path)}", daemon=True)
+        self._thread.start()
+
+    # ---------- Producer side ----------
+    def offer(self, seq, frame=None):
+        if frame is None:  # CaptureLoop.on_frame(frame)
+            seq, frame = None, seq
+        if seq is None:
+            self._seq += 1
+            seq = self._seq
+        try:
+            self._queue.put_nowait((seq, frame, time.time()))
+        except queue.Full:
+            self.dropped += 1
+
+    def attach(self, device, **capture):
+        """Records `device` through the capture broker (every frame, not only inferred ones)."""
+        from .broker import capture_broker
+
+        self._sub = capture_broker().subscribe(device, name="recorder", on_frame=self.offer, **capture)
+        return self._sub
+
+    def write(self, frame, overlay):
+        self.offer(overlay.seq, frame)
+
+    # ---------- Writer thread ----------
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self.writer.append(*item)
+            except (OSError, ValueError) as e:
+                self.error = str(e)
+                print("[recorder] ERROR:", e)
+
+    def close(self, timeout=10.0):
+        if self._sub is not None:
+            from .broker import capture_broker
+
+            capture_broker().unsubscribe(self._sub)
+            self._sub = None
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self.writer.close()
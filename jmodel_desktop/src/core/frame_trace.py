@@ -0,0 +1,158 @@
+"""
+Per-frame stage timestamps, from the camera to the pixels on screen.
+
+Every stage marks the moment it finished with a frame (keyed by the
+broker sequence number). When the frame is painted, the time between
+consecutive marks is added to a per-stage latency histogram. Tracing is
+off unless a FrameTrace exists: callers hold `trace = None` and skip
+every mark, so the disabled cost is one `is None` check per stage.
+"""
+import bisect
+import json
+import math
+import time
+
+STAGES = (
+    "capture",          # frame grabbed from the device
+    "decode",           # frame retrieved as a BGR array
+    "enqueue",          # handed to the inference SharedFrame
+    "dequeue",          # picked up by the inference loop (queue wait)
+    "preprocess",       # letterbox + tensor
+    "infer",            # all models done
+    "postprocess",      # classifier + overlay merge
+    "convert",          # composite + QImage for the inference view
+    "paint",            # inference view painted
+    "preview_convert",  # scaled + QImage for the live view
+    "preview_paint",    # live view painted
+)
+(CAPTURE, DECODE, ENQUEUE, DEQUEUE, PREPROCESS, INFER, POSTPROCESS,
+ CONVERT, PAINT, PREVIEW_CONVERT, PREVIEW_PAINT) = range(len(STAGES))
+
+# Which marks a frame goes through on each path to the screen
+PATHS = {
+    "inference": (CAPTURE, DECODE, ENQUEUE, DEQUEUE, PREPROCESS, INFER, POSTPROCESS, CONVERT, PAINT),
+    "preview": (CAPTURE, DECODE, PREVIEW_CONVERT, PREVIEW_PAINT),
+}
+
+# Log-spaced histogram edges: 10 us .. ~10 s, 8 bins per decade
+BIN_EDGES = [10 ** (e / 8.0) * 1e-5 for e in range(0, 6 * 8 + 1)]
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BIN_EDGES) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_right(BIN_EDGES, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def percentile(self, q):
+        """Upper edge of the bin holding the q-quantile (seconds)."""
+        if not self.total:
+            return None
+        target = q * self.total
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target and count:
+                return BIN_EDGES[min(i, len(BIN_EDGES) - 1)]
+        return BIN_EDGES[-1]
+
+    def to_dict(self):
+        return {
+            "count": self.total,
+            "mean_ms": self.sum / self.total * 1000.0 if self.total else None,
+            "p50_ms": _ms(self.percentile(0.50)),
+            "p95_ms": _ms(self.percentile(0.95)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "counts": self.counts,
+        }
+
+
+def _ms(seconds):
+    return None if seconds is None else seconds * 1000.0
+
+
+class FrameTrace:
+    """
+    Timestamps for the last `capacity` frames (rows reused by seq) and the
+    histograms they feed. Marks come from several threads but each
+    (seq, stage) cell has a single writer; a row is reset when a newer
+    seq claims it.
+    """
+
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self._seqs = [-1] * capacity
+        self._rows = [[math.nan] * len(STAGES) for _ in range(capacity)]
+        self.histograms = {
+            path: {STAGES[s]: LatencyHistogram() for s in stages[1:]} | {"total": LatencyHistogram()}
+            for path, stages in PATHS.items()
+        }
+        self.started = time.time()
+
+    def mark(self, seq, stage, t=None):
+        i = seq % self.capacity
+        row = self._rows[i]
+        if self._seqs[i] != seq:
+            if self._seqs[i] > seq:
+                return  # late mark for a frame whose row was already reused
+            self._seqs[i] = seq
+            row[:] = [math.nan] * len(STAGES)
+        row[stage] = time.perf_counter() if t is None else t
+
+    def complete(self, seq, path, t=None):
+        """Marks the path's last stage and adds the frame to the histograms."""
+        stages = PATHS[path]
+        self.mark(seq, stages[-1], t)
+        i = seq % self.capacity
+        if self._seqs[i] != seq:
+            return
+        row = self._rows[i]
+        hists = self.histograms[path]
+        prev = None
+        for stage in stages:
+            t_stage = row[stage]
+            if t_stage != t_stage:  # NaN: stage not traced for this frame
+                continue
+            if prev is not None:
+                hists[STAGES[stage]].add(max(0.0, t_stage - prev))
+            prev = t_stage
+        first = row[stages[0]]
+        if first == first:
+            hists["total"].add(max(0.0, row[stages[-1]] - first))
+
+    def snapshot(self):
+        """{path: {stage: {count, mean_ms, p50_ms, p95_ms, p99_ms, counts}}}"""
+        return {
+            path: {stage: h.to_dict() for stage, h in hists.items()}
+            for path, hists in self.histograms.items()
+        }
+
+    def format_table(self):
+        """Compact text for an on-screen overlay."""
+        lines = []
+        for path, hists in self.histograms.items():
+            lines.append(f"{path:<18}{'p50':>8}{'p95':>8}")
+            for stage, h in hists.items():
+                if not h.total:
+                    continue
+                p50, p95 = h.percentile(0.5), h.percentile(0.95)
+                lines.append(f"  {stage:<16}{p50 * 1000:>6.1f}ms{p95 * 1000:>6.1f}ms")
+        return "\n".join(lines)
+
+    def export_json(self, path, extra=None):
+        data = {
+            "started": self.started,
+            "exported": time.time(),
+            "bin_edges_ms": [e * 1000.0 for e in BIN_EDGES],
+            "paths": {name: [STAGES[s] for s in stages] for name, stages in PATHS.items()},
+            "histograms": self.snapshot(),
+        }
+        if extra:
+            data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import cv2
+
+from . import tracing
+
+
+class SharedFrame:
+    """
+    Latest frame + sequence number, shared between capture and inference.
+    With tracing on, time spent waiting for `_lock` is recorded as spans.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._seq = 0
+
+    def _acquire(self, who):
+        tr = tracing.active
+        if tr is None:
+            self._lock.acquire()
+            return
+        t0 = time.perf_counter()
+        self._lock.acquire()
+        tr.add(f"SharedFrame._lock wait ({who})", t0)
+
+    @property
+    def seq(self):
+        """Last sequence number set (lock-free read, for monitoring)."""
+        return self._seq
+
+    def set(self, frame, seq=None):
+        """`seq` lets a producer with its own numbering (the broker) keep it."""
+        self._acquire("set")
+        try:
+            self._frame = frame
+            self._seq = self._seq + 1 if seq is None else seq
+        finally:
+            self._lock.release()
+
+    def get_copy(self):
+        self._acquire("get")
+        try:
+            if self._frame is None:
+                return None
+            return self._frame.copy()
+        finally:
+            self._lock.release()
+
+    def get_copy_with_seq(self, newer_than=0):
+        """
+        Returns (seq, frame copy). The frame is None when there is nothing
+        newer than `newer_than`, so a frame is never processed twice.
+        """
+        self._acquire("get")
+        try:
+            if self._frame is None or self._seq <= newer_than:
+                return self._seq, None
+            return self._seq, self._frame.copy()
+        finally:
+            self._lock.release()
+
+
+def fit_size(frame_w, frame_h, box_w, box_h):
+    """Largest (w, h) with the frame's aspect ratio that fits in the box."""
+    scale = min(box_w / frame_w, box_h / frame_h)
+    return max(1, int(frame_w * scale)), max(1, int(frame_h * scale))
+
+
+def resize_to_fit(frame, box):
+    """
+    Downscales `frame` once to fit `box` = (w, h) (INTER_AREA). Frames that
+    already fit, a None box or an empty one (a label not laid out yet) are
+    returned unchanged.
+    """
+    if not box or box[0] <= 0 or box[1] <= 0:
+        return frame
+    h, w = frame.shape[:2]
+    size = fit_size(w, h, *box)
+    if size[0] >= w and size[1] >= h:
+        return frame
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+class FrameRing:
+    """
+    Fixed-size ring of recent (seq, t, frame) entries. Each slot holds one
+    tuple, so a reader on another thread always sees a whole entry.
+    `frame` may be None when only capture times are needed.
+    """
+
+    def __init__(self, capacity):
+        self._slots = [None] * max(1, int(capacity))
+        self._next = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def push(self, seq, frame, t):
+        self._slots[self._next] = (seq, t, frame)
+        self._next = (self._next + 1) % len(self._slots)
+
+    def find(self, seq):
+        for entry in self._slots:
+            if entry is not None and entry[0] == seq:
+                return entry
+        return None
+
+    def latest_up_to(self, seq):
+        """Entry `seq` if present, else the newest one before it (None if all are newer)."""
+        best = None
+        for entry in self._slots:
+            if entry is not None and entry[0] <= seq and (best is None or entry[0] > best[0]):
+                best = entry
+        return best
+
+    def latest_before(self, t):
+        """Newest entry captured at or before `t` (the oldest one if all are newer)."""
+        best = oldest = None
+        for entry in self._slots:
+            if entry is None:
+                continue
+            if entry[1] <= t and (best is None or entry[1] > best[1]):
+                best = entry
+            if oldest is None or entry[1] < oldest[1]:
+                oldest = entry
+        return best or oldest
+
+    def clear(self):
+        self._slots = [None] * len(self._slots)
+        self._next = 0
@@ -0,0 +1,131 @@
+import time
+
+from . import tracing
+from .frame_trace import DEQUEUE
+from .model_group import ModelGroup
+
+# Polling granularity of the loop; being this late is still on time
+LATE_TOLERANCE_S = 0.01
+
+
+class InferenceLoop:
+    """
+    Runs the model group on the newest frame of a SharedFrame at `infer_fps`.
+
+    Each result is passed to `on_result(frame, overlay)` and to every sink.
+    Sinks are objects with write(frame, overlay) and close(). With a
+    StatsAggregator, the "infer" stage gets the model time per frame.
+    Captured frames that were never inferred count as skipped when the
+    `infer_fps` limit passed over them on purpose. They count as drops
+    when they were overwritten after inference was already due, i.e. the
+    model could not keep up.
+    """
+
+    def __init__(self, models, shared, infer_fps=6, imgsz=640, classifier_path=None,
+                 sinks=(), on_result=None, on_error=None, stats=None, group=None):
+        """
+        :param models: list of (model_path, task); all of them run on every frame
+        :param group: prebuilt model group (load/infer/close/memory_bytes) used
+                      instead of a ModelGroup of `models`, e.g. a stub detector
+        """
+        self.models = models
+        self.group = group
+        self.shared = shared
+        self.set_infer_fps(infer_fps)
+        self.imgsz = imgsz
+        self.classifier_path = classifier_path
+        self.sinks = list(sinks)
+        self.on_result = on_result
+        self.on_error = on_error
+        self.stats = stats.stage("infer") if stats is not None else None
+        self.trace = None  # FrameTrace, set while frame timing is on
+        self.last_seq = 0  # seq of the frame picked up last (monitoring)
+        self.model_memory = []  # bytes per model once loaded (ModelGroup.memory_bytes)
+        self._running = False
+        self._stopped = False  # stop() may come before or during the model load
+
+    def set_infer_fps(self, infer_fps):
+        """Can be changed while running; 0/None pauses inference (model stays loaded)."""
+        self.infer_period = 1.0 / float(infer_fps) if infer_fps else None
+
+    def _error(self, msg):
+        if self.on_error is not None:
+            self.on_error(msg)
+
+    def run(self):
+        group = self.group or ModelGroup(self.models, imgsz=self.imgsz, classifier_path=self.classifier_path)
+        try:
+            group.load()
+        except Exception as e:
+            group.close()
+            self._error(f"Model not usable (engine/TRT mismatch): {e}")
+            return
+        self.model_memory = group.memory_bytes()
+
+        self._running = not self._stopped
+        last_infer = 0.0
+        last_seq = 0
+
+        try:
+            while self._running:
+                period = self.infer_period
+                if period is None:
+                    last_infer = 0.0  # frames passed over while paused are skipped, not dropped
+                    time.sleep(0.05)
+                    continue
+
+                now = time.monotonic()
+                if (now - last_infer) < period:
+                    time.sleep(0.005)
+                    continue
+
+                seq, frame = self.shared.get_copy_with_seq(newer_than=last_seq)
+                if frame is None:
+                    time.sleep(0.01)
+                    continue
+
+                trace = self.trace
+                if trace is not None:
+                    trace.mark(seq, DEQUEUE, time.perf_counter())
+                if self.stats is not None and last_seq:
+                    self._count_missed(max(0, seq - last_seq - 1), now - last_infer if last_infer else 0.0, period)
+                last_infer = now
+                last_seq = self.last_seq = seq
+
+                tr = tracing.active
+                try:
+                    t0 = time.perf_counter()
+                    overlay = group.infer(frame, seq=seq, trace=trace)
+                    if tr is not None:
+                        tr.add("inference.infer", t0, args={"seq": seq, "detections": len(overlay)})
+                    if self.stats is not None:
+                        self.stats.record(time.monotonic() - now)
+                    for sink in self.sinks:
+                        t0 = time.perf_counter()
+                        sink.write(frame, overlay)
+                        if tr is not None:
+                            tr.add(f"sink.write {type(sink).__name__}", t0)
+                    if self.on_result is not None:
+                        self.on_result(frame, overlay)
+                except Exception as e:
+                    self._error(f"Inference error: {e}")
+                    break
+        finally:
+            group.close()
+            for sink in self.sinks:
+                sink.close()
+
+    def _count_missed(self, missed, gap, period):
+        """
+        Splits the `missed` frames between two picks `gap` seconds apart.
+        Capture is taken as evenly spaced: the share of the gap past the
+        period (the previous inference overran) is dropped, the rest skipped.
+        """
+        late = gap - period
+        lost = round(missed * late / gap) if late > LATE_TOLERANCE_S else 0
+        self.stats.drop(lost)
+        self.stats.skip(missed - lost)
+
+    def stop(self):
+        self._stopped = True
+        self._running = False
@@ -0,0 +1,196 @@
+"""
+OpenMetrics (Prometheus) text endpoint for the pipeline.
+
+The owner renders a snapshot into text at its own pace with `publish()`;
+the HTTP thread only ever returns the last published bytes, so a scrape
+never touches the capture/inference threads or their locks.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .frame_trace import BIN_EDGES
+
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_PORT = 9464
+
+# Exported histogram buckets: every 4th internal edge (~3.2x apart, 10 us .. 10 s)
+BUCKET_INDEXES = list(range(0, len(BIN_EDGES), 4))
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value):
+    if value is None:
+        return "NaN"
+    if isinstance(value, float):
+        return repr(value)
+    return str(int(value))
+
+
+class _Family:
+    def __init__(self, name, kind, help_text, unit=None):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.unit = unit
+        self.samples = []  # (suffix, labels, value)
+
+    def add(self, labels, value, suffix=""):
+        self.samples.append((suffix, labels, value))
+
+    def lines(self):
+        out = [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {self.help}"]
+        if self.unit:
+            out.append(f"# UNIT {self.name} {self.unit}")
+        for suffix, labels, value in self.samples:
+            out.append(f"{self.name}{suffix}{_labels(labels)} {_number(value)}")
+        return out
+
+
+def _histogram(family, labels, counts, total_sum, count):
+    running = 0
+    edges = iter(BUCKET_INDEXES)
+    edge = next(edges, None)
+    for i, c in enumerate(counts):
+        running += c
+        if i == edge:
+            family.add({**labels, "le": f"{BIN_EDGES[i]:.6g}"}, running, "_bucket")
+            edge = next(edges, None)
+    family.add({**labels, "le": "+Inf"}, count, "_bucket")
+    family.add(labels, count, "_count")
+    family.add(labels, float(total_sum), "_sum")
+
+
+def render(snapshot):
+    """
+    Text exposition of a snapshot:
+      {"sessions": [{"labels", "stages", "histograms", "queues", "model_memory", "latency_ms"}],
+       "devices": CaptureBroker.devices(), "process": ProcessSampler.sample(), "time": epoch}
+    """
+    f = {
+        "frames": _Family("jmodel_capture_frames", "counter", "Frames read from a capture device."),
+        "delivered": _Family("jmodel_subscriber_frames_delivered", "counter", "Frames handed to a broker subscriber."),
+        "dropped": _Family("jmodel_subscriber_frames_dropped", "counter", "Frames a subscriber queue overflowed."),
+        "skipped": _Family("jmodel_subscriber_frames_skipped", "counter", "Frames skipped by a subscriber fps limit."),
+        "pending": _Family("jmodel_subscriber_queue_depth", "gauge", "Frames waiting in a subscriber queue."),
+        "events": _Family("jmodel_stage_events", "counter", "Frames processed by a session stage."),
+        "drops": _Family("jmodel_stage_drops", "counter", "Frames a session stage lost (it could not keep up)."),
+        "stage_skipped": _Family("jmodel_stage_skipped", "counter", "Frames a session stage passed over on purpose (rate limit)."),
+        "fps": _Family("jmodel_stage_fps", "gauge", "Recent rate of a session stage."),
+        "latency": _Family("jmodel_stage_latency_seconds", "histogram", "Per-frame time of a session stage.", "seconds"),
+        "queue": _Family("jmodel_session_queue_depth", "gauge", "Frames captured but not yet picked up by a session queue."),
+        "e2e": _Family("jmodel_session_result_latency_seconds", "gauge", "Smoothed capture to inference result latency.", "seconds"),
+        "model": _Family("jmodel_model_memory_bytes", "gauge", "Approximate memory of a loaded model.", "bytes"),
+        "cpu": _Family("jmodel_process_cpu_percent", "gauge", "Process CPU use (100 = one core)."),
+        "rss": _Family("jmodel_process_resident_memory_bytes", "gauge", "Process resident set size.", "bytes"),
+        "threads": _Family("jmodel_process_threads", "gauge", "Process OS threads."),
+        "time": _Family("jmodel_snapshot_timestamp_seconds", "gauge", "When this snapshot was taken.", "seconds"),
+    }
+
+    for device, info in snapshot.get("devices", {}).items():
+        f["frames"].add({"device": device}, info["frames"], "_total")
+        seen = {}
+        for sub in info["subscribers"]:
+            # Names need not be unique (two sessions on one device); series must be
+            name = sub["name"]
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name} #{seen[name]}"
+            labels = {"device": device, "subscriber": name}
+            f["delivered"].add(labels, sub["delivered"], "_total")
+            f["dropped"].add(labels, sub["dropped"], "_total")
+            f["skipped"].add(labels, sub["skipped"], "_total")
+            f["pending"].add(labels, sub["pending"])
+
+    for session in snapshot.get("sessions", ()):
+        base = session["labels"]
+        for stage, s in session["stages"].items():
+            labels = {**base, "stage": stage}
+            f["events"].add(labels, s["total"], "_total")
+            f["drops"].add(labels, s["drops"], "_total")
+            f["stage_skipped"].add(labels, s.get("skipped", 0), "_total")
+            f["fps"].add(labels, float(s["fps"]))
+        for stage, (counts, total_sum, count) in session.get("histograms", {}).items():
+            if count:
+                _histogram(f["latency"], {**base, "stage": stage}, counts, total_sum, count)
+        for queue, depth in session["queues"].items():
+            f["queue"].add({**base, "queue": queue}, depth)
+        if session.get("latency_ms") is not None:
+            f["e2e"].add(base, session["latency_ms"] / 1000.0)
+        for model, size in session.get("model_memory", {}).items():
+            f["model"].add({**base, "model_file": model}, size)
+
+    process = snapshot.get("process")
+    if process:
+        f["cpu"].add({}, float(process["cpu_percent"]))
+        f["rss"].add({}, int(process["rss_mb"] * 1024 * 1024))
+        f["threads"].add({}, process["threads"])
+    f["time"].add({}, float(snapshot.get("time", time.time())))
+
+    lines = []
+    for family in f.values():
+        if family.samples:
+            lines.extend(family.lines())
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.body
+        accept = self.headers.get("Accept", "")
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_TYPE if "openmetrics" in accept else PROMETHEUS_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # scrapes every few seconds would flood the console
+
+
+class MetricsServer:
+    """HTTP server on a daemon thread returning the last published text."""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self._httpd = None
+        self._thread = None
+
+    def start(self):
+        """Binds and serves; raises OSError if the address is in use."""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.body = b"# EOF\n"
+        self.port = self._httpd.server_address[1]  # port 0 = any free port
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+
+    def publish(self, text):
+        if self._httpd is not None:
+            self._httpd.body = text.encode("utf-8")
+
+    def url(self):
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        self._thread = None
@@ -0,0 +1,148 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import tracing
+from .crop_classifier import CropClassifier
+from .frame_trace import INFER, POSTPROCESS, PREPROCESS
+from .overlay import overlay_from_result, merge_overlays
+from .preprocess import Preprocessor
+
+
+class ModelGroup:
+    """
+    One or more models attached to the same frame stream.
+
+    Each frame is letterboxed and normalized once, the tensor is fanned out
+    to every model (concurrently when there is more than one) and the
+    per-model overlays are merged under the frame sequence number.
+    The optional crop classifier runs on the primary (first) model only.
+    """
+
+    def __init__(self, models, imgsz=640, classifier_path=None):
+        """
+        :param models: list of (model_path, task)
+        """
+        if not models:
+            raise ValueError("ModelGroup needs at least one model.")
+        self.models = list(models)
+        self.imgsz = imgsz
+        self.classifier_path = classifier_path
+
+        self._preprocess = None
+        self._yolos = []
+        self._classifier = None
+        self._executor = None
+
+    def load(self):
+        from ultralytics import YOLO
+
+        self._preprocess = Preprocessor(self.imgsz)
+        self._yolos = [YOLO(path, task=task) for path, task in self.models]
+
+        dummy, _ = self._preprocess(np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8))
+        for model in self._yolos:
+            model.predict(dummy, imgsz=self.imgsz, verbose=False)
+
+        if self.classifier_path:
+            self._classifier = CropClassifier(self.classifier_path)
+            self._classifier.load()
+
+        if len(self._yolos) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=len(self._yolos), thread_name_prefix="model")
+
+    def memory_bytes(self):
+        """
+        Approximate memory per loaded model: parameters + buffers for torch
+        models, the file size for exported ones (engine/onnx/...).
+        """
+        sizes = []
+        for (path, _task), yolo in zip(self.models, self._yolos):
+            module = getattr(yolo, "model", None)
+            if hasattr(module, "parameters") and hasattr(module, "buffers"):
+                tensors = list(module.parameters()) + list(module.buffers())
+                sizes.append(sum(t.numel() * t.element_size() for t in tensors))
+            else:
+                sizes.append(os.path.getsize(path) if os.path.isfile(path) else 0)
+        return sizes
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run_model(self, index, tensor, geometry):
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
+        model = self._yolos[index]
+        if index == 0 and self._classifier is not None:
+            # Tracking gives stable ids for the classifier cache
+            results = model.track(tensor, imgsz=self.imgsz, persist=True, verbose=False)
+        else:
+            results = model.predict(tensor, imgsz=self.imgsz, verbose=False)
+        overlay = geometry.unmap_overlay(overlay_from_result(results[0]))
+        if tr is not None:
+            tr.add(f"model.predict[{index}]", t0, args={"model": self.models[index][0]})
+        return overlay
+
+    def infer(self, frame, seq=None, trace=None):
+        tensor, geometry = self._preprocess(frame)
+        if trace is not None:
+            trace.mark(seq, PREPROCESS, time.perf_counter())
+
+        if self._executor is None:
+            overlays = [self._run_model(0, tensor, geometry)]
+        else:
+            futures = [
+                self._executor.submit(self._run_model, i, tensor, geometry)
+                for i in range(len(self._yolos))
+            ]
+            overlays = [f.result() for f in futures]
+        if trace is not None:
+            trace.mark(seq, INFER, time.perf_counter())
+
+        primary = overlays[0]
+        if self._classifier is not None and len(primary):
+            # Crops come from the full-resolution frame, not the model input
+            h, w = frame.shape[:2]
+            boxes_px = primary.boxes * np.array([w, h, w, h], dtype=np.float32)
+            primary.labels = self._classifier.classify(frame, boxes_px, primary.track_ids)
+
+        merged = merge_overlays(overlays, seq=seq)
+        if trace is not None:
+            trace.mark(seq, POSTPROCESS, time.perf_counter())
+        return merged
+
+    def _run_model_batch(self, index, tensor, geometries):
+        results = self._yolos[index].predict(tensor, imgsz=self.imgsz, verbose=False)
+        return [g.unmap_overlay(overlay_from_result(r)) for r, g in zip(results, geometries)]
+
+    def infer_batch(self, frames, seqs):
+        """
+        Throughput path for offline processing: one predict call per model
+        for the whole batch. No tracking (trackers need frames one by one),
+        so the crop classifier, if any, sees every box on every frame.
+        """
+        tensor, geometries = self._preprocess.batch(frames)
+
+        if self._executor is None:
+            per_model = [self._run_model_batch(0, tensor, geometries)]
+        else:
+            futures = [
+                self._executor.submit(self._run_model_batch, i, tensor, geometries)
+                for i in range(len(self._yolos))
+            ]
+            per_model = [f.result() for f in futures]
+
+        merged = []
+        for k, (frame, seq) in enumerate(zip(frames, seqs)):
+            overlays = [model_overlays[k] for model_overlays in per_model]
+            primary = overlays[0]
+            if self._classifier is not None and len(primary):
+                h, w = frame.shape[:2]
+                boxes_px = primary.boxes * np.array([w, h, w, h], dtype=np.float32)
+                primary.labels = self._classifier.classify(frame, boxes_px)
+            merged.append(merge_overlays(overlays, seq=seq))
+        return merged
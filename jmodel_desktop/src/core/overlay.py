@@ -0,0 +1,258 @@
+import numpy as np
+import cv2
+
+# COCO-17 keypoint skeleton (pairs of keypoint indices)
+POSE_SKELETON = (
+    (15, 13), (13, 11), (16, 14), (14, 12), (11, 12),
+    (5, 11), (6, 12), (5, 6), (5, 7), (6, 8), (7, 9),
+    (8, 10), (1, 2), (0, 1), (0, 2), (1, 3), (2, 4),
+    (3, 5), (4, 6),
+)
+
+# Mask resolution kept per instance, relative to the model input (640 -> 160)
+MASK_STRIDE = 4
+
+
+def _class_color(class_id):
+    # Deterministic, well-spread BGR color per class id
+    hue = (int(class_id) * 47) % 180
+    hsv = np.uint8([[[hue, 200, 255]]])
+    b, g, r = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)[0, 0]
+    return int(b), int(g), int(r)
+
+
+class Overlay:
+    """
+    Compact, resolution independent result of one inference.
+
+    Boxes and keypoints are normalized to [0, 1] of the source frame, and
+    each mask is only the low-res patch under its box, so an overlay is a
+    few KB instead of a full-frame array per instance.
+    """
+
+    def __init__(self, boxes, classes, confs, names, track_ids=None, masks=None, keypoints=None, labels=None, seq=None):
+        self.seq = seq              # frame sequence number the overlay belongs to
+        self.boxes = boxes          # (N, 4) float32, normalized xyxy
+        self.classes = classes      # (N,) int32
+        self.confs = confs          # (N,) float32
+        self.names = names          # {class_id: name}
+        self.track_ids = track_ids  # list[int] | None
+        self.masks = masks          # list[(mh, mw) uint8 | None] | None
+        self.keypoints = keypoints  # (N, K, 3) float32, normalized xy + conf | None
+        self.labels = labels        # list[(label, conf) | None] | None (second stage)
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def nbytes(self):
+        total = self.boxes.nbytes + self.classes.nbytes + self.confs.nbytes
+        if self.masks is not None:
+            total += sum(m.nbytes for m in self.masks if m is not None)
+        if self.keypoints is not None:
+            total += self.keypoints.nbytes
+        return total
+
+
+def overlay_from_result(result):
+    """
+    Builds an Overlay from an ultralytics Results object (detect/segment/pose).
+
+    Coordinates are normalized to the model input; use
+    Letterbox.unmap_overlay to bring them back to the original frame.
+    """
+    boxes = result.boxes
+    if boxes is None or len(boxes) == 0:
+        return empty_overlay(result.names)
+
+    boxes_n = boxes.xyxyn.cpu().numpy().astype(np.float32)
+    track_ids = boxes.id.int().tolist() if boxes.id is not None else None
+
+    masks = None
+    if result.masks is not None:
+        # Downsample on the device before the transfer, then keep only the box patch
+        data = result.masks.data[:, ::MASK_STRIDE, ::MASK_STRIDE]
+        data = (data > 0.5).cpu().numpy().astype(np.uint8)
+        mh, mw = data.shape[1:]
+        masks = []
+        for i, (x1, y1, x2, y2) in enumerate(boxes_n):
+            c1, r1 = int(x1 * mw), int(y1 * mh)
+            c2, r2 = max(int(np.ceil(x2 * mw)), c1 + 1), max(int(np.ceil(y2 * mh)), r1 + 1)
+            masks.append(np.ascontiguousarray(data[i, r1:r2, c1:c2]))
+
+    keypoints = None
+    if result.keypoints is not None and result.keypoints.xyn is not None:
+        xyn = result.keypoints.xyn.cpu().numpy()
+        if result.keypoints.conf is not None:
+            conf = result.keypoints.conf.cpu().numpy()
+        else:
+            conf = np.ones(xyn.shape[:2], dtype=np.float32)
+        keypoints = np.concatenate([xyn, conf[..., None]], axis=-1).astype(np.float32)
+
+    return Overlay(
+        boxes=boxes_n,
+        classes=boxes.cls.cpu().numpy().astype(np.int32),
+        confs=boxes.conf.cpu().numpy().astype(np.float32),
+        names=result.names,
+        track_ids=track_ids,
+        masks=masks,
+        keypoints=keypoints,
+    )
+
+
+def empty_overlay(names=None, seq=None):
+    return Overlay(
+        boxes=np.zeros((0, 4), dtype=np.float32),
+        classes=np.zeros((0,), dtype=np.int32),
+        confs=np.zeros((0,), dtype=np.float32),
+        names=names or {},
+        seq=seq,
+    )
+
+
+def merge_overlays(overlays, seq=None):
+    """
+    Merges the overlays of several models that ran on the same frame.
+
+    Class ids are offset per model so names (and colors) never collide.
+    Instances without masks/keypoints get None / zero-confidence entries.
+    """
+    overlays = [o for o in overlays if o is not None]
+    if not overlays:
+        return empty_overlay(seq=seq)
+    if len(overlays) == 1:
+        overlays[0].seq = seq
+        return overlays[0]
+
+    names = {}
+    classes = []
+    offset = 0
+    for o in overlays:
+        for class_id, name in o.names.items():
+            names[offset + int(class_id)] = name
+        classes.append(o.classes + offset)
+        offset += (max(o.names) + 1) if o.names else 0
+
+    masks = None
+    if any(o.masks is not None for o in overlays):
+        masks = []
+        for o in overlays:
+            masks.extend(o.masks if o.masks is not None else [None] * len(o))
+
+    keypoints = None
+    with_kpts = [o.keypoints for o in overlays if o.keypoints is not None and len(o.keypoints)]
+    if with_kpts:
+        k = max(kp.shape[1] for kp in with_kpts)
+        parts = []
+        for o in overlays:
+            part = np.zeros((len(o), k, 3), dtype=np.float32)
+            if o.keypoints is not None and len(o.keypoints):
+                part[:, :o.keypoints.shape[1]] = o.keypoints
+            parts.append(part)
+        keypoints = np.concatenate(parts)
+
+    labels = None
+    if any(o.labels is not None for o in overlays):
+        labels = []
+        for o in overlays:
+            labels.extend(o.labels if o.labels is not None else [None] * len(o))
+
+    return Overlay(
+        boxes=np.concatenate([o.boxes for o in overlays]),
+        classes=np.concatenate(classes).astype(np.int32),
+        confs=np.concatenate([o.confs for o in overlays]),
+        names=names,
+        # Track ids are per model; they are only meaningful for a single model
+        track_ids=None,
+        masks=masks,
+        keypoints=keypoints,
+        labels=labels,
+        seq=seq,
+    )
+
+
+def overlay_to_dict(overlay, frame_w, frame_h):
+    """JSON-friendly view of an overlay in frame pixels (masks are left out)."""
+    scale = np.array([frame_w, frame_h, frame_w, frame_h], dtype=np.float32)
+    boxes_px = overlay.boxes * scale
+    detections = []
+    for i in range(len(overlay)):
+        det = {
+            "class_id": int(overlay.classes[i]),
+            "class": overlay.names.get(int(overlay.classes[i]), str(int(overlay.classes[i]))),
+            "conf": round(float(overlay.confs[i]), 4),
+            "box": [round(float(v), 1) for v in boxes_px[i]],
+        }
+        if overlay.track_ids is not None:
+            det["track_id"] = overlay.track_ids[i]
+        if overlay.labels is not None and overlay.labels[i] is not None:
+            det["label"], det["label_conf"] = overlay.labels[i][0], round(overlay.labels[i][1], 4)
+        if overlay.keypoints is not None:
+            kpts = overlay.keypoints[i] * np.array([frame_w, frame_h, 1.0], dtype=np.float32)
+            det["keypoints"] = np.round(kpts, 2).tolist()
+        detections.append(det)
+    return {"seq": overlay.seq, "detections": detections}
+
+
+def render_overlay(image, overlay, alpha=0.45, kpt_conf=0.5):
+    """
+    Draws an Overlay onto a BGR image of any size (in place).
+
+    Masks are upscaled only to their own box and alpha-blended inside that
+    region, so the cost scales with the covered area, not the frame size.
+    """
+    h, w = image.shape[:2]
+    if len(overlay) == 0:
+        return image
+
+    scale = np.array([w, h, w, h], dtype=np.float32)
+    boxes_px = (overlay.boxes * scale).astype(np.int32)
+    np.clip(boxes_px[:, 0::2], 0, w, out=boxes_px[:, 0::2])
+    np.clip(boxes_px[:, 1::2], 0, h, out=boxes_px[:, 1::2])
+
+    for i, (x1, y1, x2, y2) in enumerate(boxes_px):
+        color = _class_color(overlay.classes[i])
+
+        if overlay.masks is not None and overlay.masks[i] is not None and x2 > x1 and y2 > y1:
+            roi = image[y1:y2, x1:x2]
+            mask = cv2.resize(overlay.masks[i], (x2 - x1, y2 - y1), interpolation=cv2.INTER_NEAREST)
+            tint = np.empty_like(roi)
+            tint[:] = color
+            blended = cv2.addWeighted(roi, 1.0 - alpha, tint, alpha, 0.0)
+            np.copyto(roi, blended, where=mask[..., None].astype(bool))
+
+        cv2.rectangle(image, (int(x1), int(y1)), (int(x2), int(y2)), color, 2)
+
+        text = f"{overlay.names.get(int(overlay.classes[i]), overlay.classes[i])} {overlay.confs[i]:.2f}"
+        if overlay.labels is not None and overlay.labels[i] is not None:
+            label, conf = overlay.labels[i]
+            text += f" | {label} {conf:.2f}"
+        cv2.putText(
+            image,
+            text,
+            (int(x1) + 2, max(int(y1) - 6, 12)),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            color,
+            1,
+            cv2.LINE_AA,
+        )
+
+    if overlay.keypoints is not None:
+        _render_keypoints(image, overlay.keypoints, kpt_conf)
+
+    return image
+
+
+def _render_keypoints(image, keypoints, kpt_conf):
+    h, w = image.shape[:2]
+    pts = keypoints[..., :2] * np.array([w, h], dtype=np.float32)
+    visible = keypoints[..., 2] >= kpt_conf
+
+    for person_pts, person_visible in zip(pts.astype(np.int32), visible):
+        if person_pts.shape[0] == 17:
+            for a, b in POSE_SKELETON:
+                if person_visible[a] and person_visible[b]:
+                    cv2.line(image, tuple(person_pts[a]), tuple(person_pts[b]), (255, 200, 0), 2, cv2.LINE_AA)
+        for (x, y), ok in zip(person_pts, person_visible):
+            if ok:
+                cv2.circle(image, (int(x), int(y)), 3, (0, 0, 255), -1, cv2.LINE_AA)
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from .capture import CaptureLoop, capture_source_for, is_live_source
+from .frames import SharedFrame
+from .inference import InferenceLoop
+
+
+class Pipeline:
+    """
+    Capture + inference on plain threads, with results going to sinks.
+    This is the headless counterpart of VideoInferenceController.
+    """
+
+    def __init__(self, source, models, width=1280, height=720, fps=30, infer_fps=6, imgsz=640,
+                 classifier_path=None, sinks=(), on_result=None, on_frame=None):
+        self.source = source
+        self.models = models
+        self.errors = []
+        self.inferred = 0
+        self._on_result = on_result
+        self._done = threading.Event()
+
+        capture_source, use_gstreamer = capture_source_for(source, width, height, fps)
+        self.shared = SharedFrame()
+        self.capture = CaptureLoop(
+            capture_source,
+            self.shared,
+            use_gstreamer=use_gstreamer,
+            preview_fps=0,
+            on_error=self._error,
+            stop_on_eof=not is_live_source(source),
+            on_frame=on_frame,
+        )
+        self.inference = InferenceLoop(
+            models,
+            self.shared,
+            infer_fps=infer_fps,
+            imgsz=imgsz,
+            classifier_path=classifier_path,
+            sinks=sinks,
+            on_result=self._result,
+            on_error=self._error,
+        )
+        self._threads = []
+
+    def _error(self, msg):
+        self.errors.append(msg)
+        self._done.set()
+
+    def _result(self, frame, overlay):
+        self.inferred += 1
+        if self._on_result is not None:
+            self._on_result(frame, overlay)
+
+    def _run(self, loop):
+        try:
+            loop.run()
+        finally:
+            # Either loop ending (source exhausted, error) ends the pipeline
+            self._done.set()
+
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self._run, args=(self.capture,), name="capture", daemon=True),
+            threading.Thread(target=self._run, args=(self.inference,), name="inference", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def wait(self, duration=None):
+        """Blocks until `duration` seconds pass, a loop ends, or an error occurs."""
+        self._done.wait(duration)
+
+    def stop(self, timeout=2.0):
+        self.capture.stop()
+        self.inference.stop()
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.monotonic()))
@@ -0,0 +1,101 @@
+import numpy as np
+import cv2
+
+LETTERBOX_FILL = 114
+
+
+class Letterbox:
+    """Geometry of one letterboxed frame (frame pixels -> square model input)."""
+
+    def __init__(self, imgsz, scale, pad_x, pad_y, frame_w, frame_h):
+        self.imgsz = imgsz
+        self.scale = scale
+        self.pad_x = pad_x
+        self.pad_y = pad_y
+        self.frame_w = frame_w
+        self.frame_h = frame_h
+
+    def unmap_overlay(self, overlay):
+        """
+        Converts overlay coordinates normalized to the model input into
+        coordinates normalized to the original frame (in place).
+        """
+        s = float(self.imgsz)
+        fx = s / (self.scale * self.frame_w)
+        fy = s / (self.scale * self.frame_h)
+        ox = self.pad_x / (self.scale * self.frame_w)
+        oy = self.pad_y / (self.scale * self.frame_h)
+
+        if len(overlay.boxes):
+            overlay.boxes[:, 0::2] = np.clip(overlay.boxes[:, 0::2] * fx - ox, 0.0, 1.0)
+            overlay.boxes[:, 1::2] = np.clip(overlay.boxes[:, 1::2] * fy - oy, 0.0, 1.0)
+        if overlay.keypoints is not None and len(overlay.keypoints):
+            overlay.keypoints[..., 0] = overlay.keypoints[..., 0] * fx - ox
+            overlay.keypoints[..., 1] = overlay.keypoints[..., 1] * fy - oy
+        return overlay
+
+
+class Preprocessor:
+    """
+    Letterbox + normalize a BGR frame once, producing the BCHW float tensor
+    that every attached model consumes (ultralytics skips its own
+    preprocessing for tensor input).
+
+    The letterbox canvas is reused between frames; its padding is only
+    repainted when the frame geometry changes.
+    """
+
+    def __init__(self, imgsz=640, device=None):
+        import torch
+
+        self.imgsz = int(imgsz)
+        if device is None:
+            device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+        self._canvas = np.full((self.imgsz, self.imgsz, 3), LETTERBOX_FILL, dtype=np.uint8)
+        self._geometry = None
+        self._batch_buffer = None
+
+    def letterbox(self, frame, canvas=None):
+        if canvas is None:
+            canvas = self._canvas
+        h, w = frame.shape[:2]
+        s = self.imgsz
+        scale = min(s / h, s / w)
+        nw, nh = int(round(w * scale)), int(round(h * scale))
+        pad_x, pad_y = (s - nw) // 2, (s - nh) // 2
+
+        if canvas is not self._canvas or self._geometry != (w, h):
+            canvas.fill(LETTERBOX_FILL)
+            if canvas is self._canvas:
+                self._geometry = (w, h)
+
+        interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        canvas[pad_y:pad_y + nh, pad_x:pad_x + nw] = cv2.resize(frame, (nw, nh), interpolation=interp)
+        return canvas, Letterbox(s, scale, pad_x, pad_y, w, h)
+
+    def __call__(self, frame):
+        import torch
+
+        canvas, geometry = self.letterbox(frame)
+        # HWC uint8 BGR -> 1x3xHxW float RGB in [0, 1]; the transfer happens as uint8
+        tensor = torch.from_numpy(canvas).to(self.device, non_blocking=True)
+        tensor = tensor.permute(2, 0, 1).flip(0).unsqueeze(0).float().div_(255.0).contiguous()
+        return tensor, geometry
+
+    def batch(self, frames):
+        """
+        Letterboxes a list of frames into one Bx3xHxW tensor.
+        Returns (tensor, [Letterbox, ...]).
+        """
+        import torch
+
+        n = len(frames)
+        if self._batch_buffer is None or self._batch_buffer.shape[0] < n:
+            self._batch_buffer = np.empty((n, self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        buffer = self._batch_buffer[:n]
+
+        geometries = [self.letterbox(frame, canvas=buffer[i])[1] for i, frame in enumerate(frames)]
+        tensor = torch.from_numpy(buffer).to(self.device, non_blocking=True)
+        tensor = tensor.permute(0, 3, 1, 2).flip(1).float().div_(255.0).contiguous()
+        return tensor, geometries
@@ -0,0 +1,55 @@
+"""
+Process CPU / RSS / thread count, read from /proc (Linux, what the boxes
+run) with a getrusage fallback elsewhere. Cheap enough to poll a few
+times per second from the GUI thread.
+"""
+import os
+import resource
+import threading
+import time
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = resource.getpagesize()
+
+
+def _cpu_and_threads():
+    """(user + system CPU seconds, OS thread count)."""
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            fields = f.read().rsplit(b")", 1)[1].split()
+        # after "(comm)": state is fields[0], utime/stime 11/12, num_threads 17
+        return (int(fields[11]) + int(fields[12])) / _CLK_TCK, int(fields[17])
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime, threading.active_count()
+
+
+def rss_bytes():
+    """Current resident set size (peak RSS where /proc is not available)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class ProcessSampler:
+    """`sample()` returns CPU % since the previous call (100 = one core), RSS and OS threads."""
+
+    def __init__(self):
+        self._t = time.monotonic()
+        self._cpu = _cpu_and_threads()[0]
+
+    def sample(self):
+        now = time.monotonic()
+        cpu, threads = _cpu_and_threads()
+        elapsed = now - self._t
+        percent = (cpu - self._cpu) / elapsed * 100.0 if elapsed > 0 else 0.0
+        self._t, self._cpu = now, cpu
+        return {
+            "cpu_percent": max(0.0, percent),
+            "rss_mb": rss_bytes() / (1024 * 1024),
+            "threads": threads,
+        }
@@ -0,0 +1,147 @@
+"""
+Sampling profiler for a running process: no restart, no tracing hooks.
+
+A background thread reads `sys._current_frames()` every `interval`
+seconds for `duration` seconds and counts each thread's stack. Results
+are written as collapsed stacks (one "thread;outer;...;leaf count" line
+per stack, for flamegraph.pl / speedscope) and as a pstats file built
+from the samples (self time = leaf samples, cumulative = samples the
+function was on the stack).
+"""
+import collections
+import os
+import pstats
+import sys
+import threading
+import time
+
+
+def _frame_key(code):
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _label(key):
+    filename, line, name = key
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class SamplingProfiler:
+    def __init__(self, duration=10.0, interval=0.005, thread_names=None):
+        """
+        :param thread_names: only sample threads whose name starts with one of these (None = all)
+        """
+        self.duration = duration
+        self.interval = interval
+        self.thread_names = tuple(thread_names) if thread_names else None
+        self.samples = 0
+        self.stacks = collections.Counter()  # (thread name, (key, ...) outer->leaf) -> count
+        self._stop = threading.Event()
+        self._thread = None
+        self.started = None
+        self.elapsed = 0.0
+
+    def start(self, on_done=None):
+        """Samples on a daemon thread; `on_done(profiler)` runs there when finished."""
+        self._thread = threading.Thread(target=self._run, args=(on_done,), name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self, on_done):
+        own = threading.get_ident()
+        self.started = time.time()
+        t0 = time.perf_counter()
+        deadline = t0 + self.duration
+        while not self._stop.is_set() and time.perf_counter() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                name = names.get(ident, f"thread-{ident}")
+                if self.thread_names and not name.startswith(self.thread_names):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_key(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                self.stacks[(name, tuple(stack))] += 1
+            self.samples += 1
+            self._stop.wait(self.interval)
+        self.elapsed = time.perf_counter() - t0
+        if on_done is not None:
+            on_done(self)
+
+    # ---------- Output ----------
+    def collapsed(self):
+        lines = []
+        for (thread, stack), count in self.stacks.most_common():
+            frames = ";".join(_label(k) for k in stack)
+            lines.append(f"{thread};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def create_stats(self):
+        """pstats protocol: fills self.stats {func: (cc, nc, tt, ct, callers)} from the samples."""
+        per_sample = self.elapsed / self.samples if self.samples else self.interval
+        calls = collections.Counter()
+        self_time = collections.Counter()
+        cumulative = collections.Counter()
+        callers = collections.defaultdict(collections.Counter)
+
+        for (_thread, stack), count in self.stacks.items():
+            if not stack:
+                continue
+            self_time[stack[-1]] += count
+            for key in set(stack):
+                cumulative[key] += count
+            for caller, callee in zip(stack, stack[1:]):
+                callers[callee][caller] += count
+            for key in stack:
+                calls[key] += count
+
+        self.stats = {}
+        for key, ct in cumulative.items():
+            n = calls[key]
+            self.stats[key] = (
+                n, n,
+                self_time[key] * per_sample,
+                ct * per_sample,
+                {c: (k, k, 0.0, k * per_sample) for c, k in callers[key].items()},
+            )
+
+    def top(self, n=10):
+        """
+        [(label, self fraction)] of the hottest leaf functions. A `<module>`
+        leaf is a thread waiting in native code at top level (the Qt event
+        loop in app.exec()), so it is left out.
+        """
+        leaf = collections.Counter()
+        for (_thread, stack), count in self.stacks.items():
+            if stack and stack[-1][2] != "<module>":
+                leaf[stack[-1]] += count
+        total = sum(leaf.values()) or 1
+        return [(_label(k), c / total) for k, c in leaf.most_common(n)]
+
+    def write(self, prefix):
+        """Writes <prefix>.collapsed and <prefix>.pstats; returns both paths."""
+        collapsed_path = f"{prefix}.collapsed"
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        pstats_path = None
+        if self.stacks:
+            pstats_path = f"{prefix}.pstats"
+            pstats.Stats(self).dump_stats(pstats_path)
+        return collapsed_path, pstats_path
+
+
+def default_output_prefix():
+    directory = os.getenv("JMODEL_TRACE_DIR") or os.getcwd()
+    return os.path.join(directory, time.strftime("jmodel_profile_%Y%m%d_%H%M%S"))
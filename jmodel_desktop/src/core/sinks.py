@@ -0,0 +1,54 @@
+"""
+Outputs for inference results. A sink has write(frame, overlay) and close();
+it is called from the inference thread, so write() must not block for long.
+"""
+import json
+import sys
+
+import cv2
+
+from .overlay import overlay_to_dict, render_overlay
+
+
+class VideoFileSink:
+    """Annotated video at the inference rate, opened on the first frame."""
+
+    def __init__(self, path, fps=6.0, fourcc="mp4v"):
+        self.path = path
+        self.fps = fps
+        self.fourcc = fourcc
+        self._writer = None
+
+    def write(self, frame, overlay):
+        if self._writer is None:
+            h, w = frame.shape[:2]
+            self._writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (w, h))
+            if not self._writer.isOpened():
+                raise RuntimeError(f"Could not open video writer: {self.path}")
+        # Other sinks see the same frame, so draw on a copy
+        self._writer.write(render_overlay(frame.copy(), overlay))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+
+class JsonlSink:
+    """One JSON line per inferred frame (see overlay_to_dict)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = None
+
+    def write(self, frame, overlay):
+        if self._fh is None:
+            self._fh = sys.stdout if self.path == "-" else open(self.path, "w", encoding="utf-8")
+        h, w = frame.shape[:2]
+        self._fh.write(json.dumps(overlay_to_dict(overlay, w, h)))
+        self._fh.write("\n")
+
+    def close(self):
+        if self._fh is not None and self._fh is not sys.stdout:
+            self._fh.close()
+        self._fh = None
@@ -0,0 +1,321 @@
+"""
+Frame sources that stand in for a camera, with deterministic pacing.
+
+They implement the part of cv2.VideoCapture that CaptureLoop uses
+(isOpened/read/grab/retrieve/get/release), so anything that takes a
+device string (the broker, sessions, Pipeline, jmodel-run) also takes:
+
+    synthetic://[WxH][@FPS][?count=N&pool=P&fast=1]
+    replay://PATH[?fps=F&fast=1&loop=1]
+    images://DIR[?fps=F&fast=1&loop=1&cache=1]
+    archive://NAME[?fast=1&loop=1&start=EPOCH&offset=S]   (core.frame_archive)
+
+Frame i is due at t0 + i / fps. A consumer that falls more than one
+frame behind resets the schedule instead of getting a burst, like a
+camera would. `fast=1` skips pacing entirely (as fast as possible).
+Several sources can share one URI pattern by adding any other query key
+(e.g. `&id=3`), since the broker opens one capture per distinct string.
+"""
+import os
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import cv2
+import numpy as np
+
+SCHEMES = ("synthetic", "replay", "images", "archive")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+
+
+def synthetic_frame(index, width=1280, height=720):
+    """Frame `index` of the synthetic pattern: moving gradient + bright square, the same on every run."""
+    row = np.empty((width, 3), dtype=np.uint8)
+    row[:, 0] = row[:, 2] = (np.arange(width) + index * 4) % 256
+    row[:, 1] = index * 3 % 256
+    frame = np.broadcast_to(row, (height, width, 3)).copy()
+    size = height // 6
+    left = (index * 8) % max(1, width - size)
+    top = (index * 5) % max(1, height - size)
+    frame[top:top + size, left:left + size] = 255
+    return frame
+
+
+class FrameSource:
+    """
+    Base class: subclasses implement `_next_frame()` (None at the end) and
+    set `fps`, `width`, `height`.
+    """
+
+    def __init__(self, fps=30.0, realtime=True):
+        self.fps = float(fps) if fps else 30.0
+        self.realtime = realtime
+        self.width = 0
+        self.height = 0
+        self.index = 0  # frames delivered so far
+        self._t0 = None
+        self._pending = None
+        self._opened = True
+
+    def isOpened(self):
+        return self._opened
+
+    def _offset(self):
+        """Seconds from the first frame to the one about to be delivered."""
+        return self.index / self.fps
+
+    def _pace(self):
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self._t0 is None:
+            self._t0 = now - self._offset()
+        due = self._t0 + self._offset()
+        if now < due:
+            time.sleep(due - now)
+        elif now - due > 1.0 / self.fps:
+            self._t0 = now - self._offset()  # fell behind: no burst
+
+    def grab(self):
+        if not self._opened:
+            return False
+        self._pace()
+        self._pending = self._next_frame()
+        if self._pending is None:
+            return False
+        self.index += 1
+        return True
+
+    def retrieve(self):
+        frame, self._pending = self._pending, None
+        return frame is not None, frame
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.index / self.fps * 1000.0  # source time, not wall time
+        return 0.0
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        self._opened = False
+
+    def _next_frame(self):
+        raise NotImplementedError
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames; `count=None` never ends. The first `pool` frames are
+    kept and then repeated, so steady state costs no CPU per frame (frames
+    are shared read-only downstream, so buffers are never rewritten).
+    """
+
+    def __init__(self, width=1280, height=720, fps=30.0, count=None, realtime=True, pool=8):
+        super().__init__(fps, realtime)
+        self.width, self.height = int(width), int(height)
+        self.count = count
+        self._frames = [None] * max(1, int(pool))
+
+    def _next_frame(self):
+        if self.count is not None and self.index >= self.count:
+            return None
+        i = self.index % len(self._frames)
+        frame = self._frames[i]
+        if frame is None:
+            frame = self._frames[i] = synthetic_frame(i, self.width, self.height)
+        return frame
+
+
+class FileReplaySource(FrameSource):
+    """
+    A video file paced at its own frame rate (or `fps`), or as fast as it
+    decodes. With `loop` it starts over at the end.
+    """
+
+    def __init__(self, path, fps=None, realtime=True, loop=False):
+        self.path = path
+        self.loop = loop
+        self._cap = cv2.VideoCapture(path)
+        file_fps = self._cap.get(cv2.CAP_PROP_FPS) if self._cap.isOpened() else 0.0
+        super().__init__(fps or file_fps or 30.0, realtime)
+        self._opened = self._cap.isOpened()
+        self.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def _next_frame(self):
+        ok, frame = self._cap.read()
+        if not ok and self.loop and self.index:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._cap.read()
+        return frame if ok else None
+
+    def release(self):
+        super().release()
+        self._cap.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """
+    The images of a directory in name order. `cache` decodes them all up
+    front, so load tests measure the pipeline rather than imread.
+    """
+
+    def __init__(self, directory, fps=10.0, realtime=True, loop=False, cache=False):
+        super().__init__(fps, realtime)
+        self.directory = directory
+        self.loop = loop
+        try:
+            names = sorted(n for n in os.listdir(directory) if n.lower().endswith(IMAGE_EXTENSIONS))
+        except OSError:
+            names = []
+        self.paths = [os.path.join(directory, n) for n in names]
+        self._opened = bool(self.paths)
+        self._cache = [cv2.imread(p) for p in self.paths] if cache else None
+        first = self._cache[0] if cache and self.paths else (cv2.imread(self.paths[0]) if self.paths else None)
+        if first is not None:
+            self.height, self.width = first.shape[:2]
+
+    def _next_frame(self):
+        if not self.paths:
+            return None
+        if self.index >= len(self.paths) and not self.loop:
+            return None
+        i = self.index % len(self.paths)
+        return self._cache[i] if self._cache is not None else cv2.imread(self.paths[i])
+
+
+class ArchiveSource(FrameSource):
+    """
+    Replays a raw frame archive (core.frame_archive) at the pace it was
+    recorded, or as fast as possible. Frames are read-only views of the
+    memory map: no decode and no copy. Seek with `seek(t)` (wall-clock
+    time of the recording) or set(CAP_PROP_POS_MSEC / CAP_PROP_POS_FRAMES).
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        from .frame_archive import FrameArchiveReader
+
+        self.reader = FrameArchiveReader(path)
+        ts = self.reader.timestamps
+        period = float(np.median(np.diff(ts))) if len(ts) > 1 else 0.0
+        super().__init__(1.0 / period if period > 0 else 30.0, realtime)
+        self.loop = loop
+        self.pos = 0  # next archive record
+        self._elapsed = 0.0
+        self._opened = len(self.reader) > 0
+        if self._opened:
+            first = self.reader.index[0]
+            self.width, self.height = int(first["width"]), int(first["height"])
+
+    def _offset(self):
+        return self._elapsed
+
+    def seek_frame(self, pos):
+        self.pos = min(max(0, int(pos)), len(self.reader))
+        self._t0 = None  # pacing restarts from here
+
+    def seek(self, t):
+        self.seek_frame(self.reader.seek_time(t))
+
+    def _next_frame(self):
+        n = len(self.reader)
+        if self.pos >= n:
+            if not self.loop or not n:
+                return None
+            self.pos = 0
+        frame = self.reader.frame(self.pos)
+        ts = self.reader.timestamps
+        # Gap to the next recorded frame (clock steps backwards count as 0)
+        self._elapsed += max(0.0, float(ts[self.pos + 1] - ts[self.pos])) if self.pos + 1 < n else 1.0 / self.fps
+        self.pos += 1
+        return frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_MSEC and len(self.reader):
+            i = min(self.pos, len(self.reader) - 1)
+            return float(self.reader.timestamps[i] - self.reader.timestamps[0]) * 1000.0
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.reader))
+        return super().get(prop)
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.seek_frame(value)
+            return True
+        if prop == cv2.CAP_PROP_POS_MSEC and len(self.reader):
+            self.seek(self.reader.timestamps[0] + value / 1000.0)
+            return True
+        return False
+
+    def release(self):
+        super().release()
+        self.reader.close()
+
+
+def is_source_uri(source):
+    return isinstance(source, str) and source.split("://", 1)[0] in SCHEMES and "://" in source
+
+
+def _parse(uri):
+    parts = urlsplit(uri)
+    query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+    return parts.scheme, parts.netloc + parts.path, query
+
+
+def _flag(query, key):
+    return query.get(key, "0").lower() in ("1", "true", "yes")
+
+
+def source_is_live(uri):
+    """Sources that never end on their own (read failures are stalls, not EOF)."""
+    scheme, _, query = _parse(uri)
+    if scheme == "synthetic":
+        return "count" not in query
+    return _flag(query, "loop")
+
+
+def open_source(uri, width=1280, height=720, fps=30):
+    """
+    Builds the FrameSource for a URI. `width`/`height`/`fps` are the
+    capture parameters the caller asked for; synthetic sources use them
+    unless the URI says otherwise.
+    """
+    scheme, target, query = _parse(uri)
+    realtime = not _flag(query, "fast")
+    if scheme == "synthetic":
+        m = re.match(r"^(?:(\d+)x(\d+))?(?:@([\d.]+))?$", target)
+        if m is None:
+            raise ValueError(f"Bad synthetic source: {uri} (expected synthetic://WxH@FPS)")
+        w, h, f = m.groups()
+        count = int(query["count"]) if "count" in query else None
+        return SyntheticSource(int(w or width), int(h or height), float(f or fps), count=count,
+                               realtime=realtime, pool=int(query.get("pool", 8)))
+    if scheme == "replay":
+        return FileReplaySource(target, fps=float(query["fps"]) if "fps" in query else None,
+                                realtime=realtime, loop=_flag(query, "loop"))
+    if scheme == "images":
+        return ImageDirectorySource(target, fps=float(query.get("fps", 10.0)), realtime=realtime,
+                                    loop=_flag(query, "loop"), cache=_flag(query, "cache"))
+    if scheme == "archive":
+        source = ArchiveSource(target, realtime=realtime, loop=_flag(query, "loop"))
+        if "start" in query:
+            source.seek(float(query["start"]))
+        elif "offset" in query:
+            source.set(cv2.CAP_PROP_POS_MSEC, float(query["offset"]) * 1000.0)
+        return source
+    raise ValueError(f"Unknown source scheme: {uri}")
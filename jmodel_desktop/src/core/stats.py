@@ -0,0 +1,145 @@
+"""
+Rolling per-stage statistics (fps, p50/p95 latency, drops).
+
+Recording is O(1) into fixed-size rings and safe to call from any thread;
+the work (sorting for percentiles) happens in snapshot(), which the UI
+calls at a low rate.
+"""
+import threading
+import time
+
+from .frame_trace import LatencyHistogram
+
+
+class StageStats:
+    """
+    Last `capacity` events of one stage. `record(latency_s)` marks an event
+    (latency optional, e.g. capture only has a rate); `drop(n)` counts
+    frames the stage lost, `skip(n)` frames it passed over on purpose (a
+    rate limit). Latencies also go into a cumulative histogram for the
+    metrics endpoint.
+    """
+
+    def __init__(self, name, capacity=256, window_s=2.0):
+        self.name = name
+        self.window_s = window_s
+        self._times = [0.0] * capacity
+        self._latencies = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self.total = 0
+        self.drops = 0
+        self.skipped = 0
+        self.histogram = LatencyHistogram()
+
+    def record(self, latency_s=None, t=None):
+        i = self._next
+        self._times[i] = time.monotonic() if t is None else t
+        self._latencies[i] = latency_s
+        self._next = (i + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+        self.total += 1
+        if latency_s is not None:
+            self.histogram.add(latency_s)
+
+    def drop(self, n=1):
+        self.drops += n
+
+    def skip(self, n=1):
+        self.skipped += n
+
+    def histogram_snapshot(self):
+        """(bin counts, sum, count) since start; bins follow frame_trace.BIN_EDGES."""
+        h = self.histogram
+        return list(h.counts), h.sum, h.total
+
+    def snapshot(self, now=None):
+        now = time.monotonic() if now is None else now
+        count = self._count
+        times = list(self._times[:count])
+        latencies = list(self._latencies[:count])
+
+        # fps over the recent window (or what the ring still covers)
+        recent = [t for t in times if now - t <= self.window_s]
+        fps = 0.0
+        if len(recent) >= 2:
+            span = max(now - min(recent), 1e-6)
+            fps = len(recent) / span
+
+        values = sorted(v for t, v in zip(times, latencies) if v is not None and now - t <= self.window_s)
+        return {
+            "fps": fps,
+            "p50_ms": _percentile(values, 0.50) * 1000.0 if values else None,
+            "p95_ms": _percentile(values, 0.95) * 1000.0 if values else None,
+            "drops": self.drops,
+            "skipped": self.skipped,
+            "total": self.total,
+        }
+
+
+def _percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class StatsAggregator:
+    """Named StageStats created on first use; one aggregator per session/runner."""
+
+    def __init__(self, capacity=256, window_s=2.0):
+        self.capacity = capacity
+        self.window_s = window_s
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        stage = self._stages.get(name)
+        if stage is None:
+            with self._lock:
+                stage = self._stages.get(name)
+                if stage is None:
+                    stage = StageStats(name, self.capacity, self.window_s)
+                    self._stages[name] = stage
+        return stage
+
+    def stages(self):
+        with self._lock:
+            return list(self._stages.values())
+
+    def snapshot(self):
+        now = time.monotonic()
+        return {s.name: s.snapshot(now) for s in self.stages()}
+
+    def format_line(self, snapshot=None):
+        """One line for a status bar: 'capture 30.0 fps | infer 6.0 fps p50 41 ms p95 58 ms drops 3'."""
+        snapshot = self.snapshot() if snapshot is None else snapshot
+        parts = []
+        for name, s in snapshot.items():
+            text = f"{name} {s['fps']:.1f} fps"
+            if s["p50_ms"] is not None:
+                text += f" p50 {s['p50_ms']:.0f} ms p95 {s['p95_ms']:.0f} ms"
+            if s["drops"]:
+                text += f" drops {s['drops']}"
+            parts.append(text)
+        return " | ".join(parts)
+
+
+class History:
+    """Fixed-size ring of sampled values (oldest first from values()), e.g. for sparklines."""
+
+    def __init__(self, capacity=120):
+        self._values = [None] * capacity
+        self._next = 0
+        self._count = 0
+
+    def push(self, value):
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def values(self):
+        if self._count < len(self._values):
+            return self._values[:self._count]
+        return self._values[self._next:] + self._values[:self._next]
+
+    def last(self):
+        return self._values[self._next - 1] if self._count else None
@@ -0,0 +1,125 @@
+"""
+Opt-in span tracer: which thread ran what, and when, dumped as Chrome
+trace JSON (open in https://ui.perfetto.dev or chrome://tracing).
+
+Spans go into a preallocated ring (the newest `capacity` survive), so
+recording never allocates per event beyond the tuple it stores.
+Instrumented code reads the module-level `active` once and does nothing
+when it is None:
+
+    tr = tracing.active
+    t0 = time.perf_counter() if tr is not None else 0.0
+    ...
+    if tr is not None:
+        tr.add("infer", t0)
+"""
+import itertools
+import json
+import os
+import signal
+import threading
+import time
+
+DEFAULT_CAPACITY = 200_000
+
+active = None  # the running SpanTracer, or None when tracing is off
+_lock = threading.Lock()
+
+
+class SpanTracer:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._spans = [None] * capacity  # (name, tid, start, end, args)
+        self._counter = itertools.count()  # next() is atomic under the GIL
+        self._thread_names = {}
+        self.t0 = time.perf_counter()
+        self.wall_t0 = time.time()
+
+    def add(self, name, start, end=None, args=None):
+        """Records a complete span on the calling thread (perf_counter seconds)."""
+        if end is None:
+            end = time.perf_counter()
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        self._spans[next(self._counter) % self.capacity] = (name, tid, start, end, args)
+
+    def name_thread(self, name):
+        """For threads Python did not start (QThreads show up as Dummy-N)."""
+        self._thread_names[threading.get_ident()] = name
+
+    def spans(self):
+        return sorted((s for s in self._spans if s is not None), key=lambda s: s[2])
+
+    def to_chrome(self):
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._thread_names.items()
+        ]
+        for name, tid, start, end, args in self.spans():
+            event = {
+                "name": name,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": (start - self.t0) * 1e6,
+                "dur": max(0.0, end - start) * 1e6,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"started": self.wall_t0}}
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f)
+        return path
+
+
+def start(capacity=None):
+    """Starts recording (no-op if already running); returns the tracer."""
+    global active
+    with _lock:
+        if active is None:
+            capacity = capacity or int(os.getenv("JMODEL_TRACE_SPANS", DEFAULT_CAPACITY))
+            active = SpanTracer(capacity)
+            active.name_thread(threading.current_thread().name)
+        return active
+
+
+def stop():
+    global active
+    with _lock:
+        tracer, active = active, None
+    return tracer
+
+
+def default_dump_path():
+    directory = os.getenv("JMODEL_TRACE_DIR") or os.getcwd()
+    return os.path.join(directory, time.strftime("jmodel_trace_%Y%m%d_%H%M%S.json"))
+
+
+def dump(path=None):
+    """Writes the current buffer (recording continues); None if tracing is off."""
+    tracer = active
+    if tracer is None:
+        return None
+    return tracer.dump(path or default_dump_path())
+
+
+def _on_sigusr2(signum, frame):
+    # First signal starts recording, the next ones dump what was recorded
+    if active is None:
+        start()
+        print("[trace] recording started (send SIGUSR2 again to dump)")
+    else:
+        print(f"[trace] written {dump()}")
+
+
+def install_signal_handler():
+    """SIGUSR2 toggles start/dump. Must be called from the main thread; POSIX only."""
+    if not hasattr(signal, "SIGUSR2"):
+        return False
+    signal.signal(signal.SIGUSR2, _on_sigusr2)
+    return True
@@ -1,3 +1,5 @@
+from .utils.startup_timing import startup
+
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -8,21 +10,30 @@ from .ui.theme import apply_theme, load_theme_name
 
 from PySide6.QtWidgets import QApplication
 from .resources import views_rc
-from .utils.load_windows import load_ui
+from .utils.load_windows import create_window
+from .utils.warmup import FirstPaintWatcher, warm_imports_async
+from .utils.diagnostics import install_process_hooks
 
 from .controllers.run_model_controller import RunModelController 
 
+startup.mark("imports")
+
 
 def main():
     app = QApplication(sys.argv)
+    install_process_hooks(app)
 
-    window = load_ui(":/views/run_model_window.ui")
+    window = create_window("run_model_window")
 
     _controller = RunModelController(window)
+    startup.mark("window_built")
+
+    # cv2/ultralytics are imported only after the window is on screen
+    _first_paint = FirstPaintWatcher(app, window, callback=warm_imports_async)
 
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,6 @@
+# Generated by jmodel_desktop.src.utils.build_ui -- do not edit.
+# view name -> (module in resources, Ui class, base widget class)
+UI_CLASSES = {
+    'run_model_window': ('ui_run_model_window', 'Ui_MainWindow', 'QMainWindow'),
+    'video_inference_window': ('ui_video_inference_window', 'Ui_video_inference_window', 'QMainWindow'),
+}
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'run_model_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QComboBox, QFrame,
+    QHBoxLayout, QLabel, QMainWindow, QMenuBar,
+    QPushButton, QRadioButton, QSizePolicy, QStatusBar,
+    QTextEdit, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(801, 611)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.frame = QFrame(self.centralwidget)
+        self.frame.setObjectName(u"frame")
+        self.frame.setGeometry(QRect(0, 0, 781, 561))
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.frame.sizePolicy().hasHeightForWidth())
+        self.frame.setSizePolicy(sizePolicy1)
+        self.frame.setFrameShape(QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QFrame.Shadow.Raised)
+        self.horizontalLayoutWidget = QWidget(self.frame)
+        self.horizontalLayoutWidget.setObjectName(u"horizontalLayoutWidget")
+        self.horizontalLayoutWidget.setGeometry(QRect(40, 60, 371, 80))
+        self.horizontalLayout = QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.radioButton_local = QRadioButton(self.horizontalLayoutWidget)
+        self.button_group_source_video = QButtonGroup(MainWindow)
+        self.button_group_source_video.setObjectName(u"button_group_source_video")
+        self.button_group_source_video.addButton(self.radioButton_local)
+        self.radioButton_local.setObjectName(u"radioButton_local")
+
+        self.horizontalLayout.addWidget(self.radioButton_local)
+
+        self.radioButton_remote = QRadioButton(self.horizontalLayoutWidget)
+        self.button_group_source_video.addButton(self.radioButton_remote)
+        self.radioButton_remote.setObjectName(u"radioButton_remote")
+
+        self.horizontalLayout.addWidget(self.radioButton_remote)
+
+        self.horizontalLayoutWidget_2 = QWidget(self.frame)
+        self.horizontalLayoutWidget_2.setObjectName(u"horizontalLayoutWidget_2")
+        self.horizontalLayoutWidget_2.setGeometry(QRect(30, 420, 731, 80))
+        self.horizontalLayout_2 = QHBoxLayout(self.horizontalLayoutWidget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.pushButton_gstream = QPushButton(self.horizontalLayoutWidget_2)
+        self.pushButton_gstream.setObjectName(u"pushButton_gstream")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_gstream)
+
+        self.pushButton_utralytics = QPushButton(self.horizontalLayoutWidget_2)
+        self.pushButton_utralytics.setObjectName(u"pushButton_utralytics")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_utralytics)
+
+        self.pushButton_opencv = QPushButton(self.horizontalLayoutWidget_2)
+        self.pushButton_opencv.setObjectName(u"pushButton_opencv")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_opencv)
+
+        self.verticalLayoutWidget = QWidget(self.frame)
+        self.verticalLayoutWidget.setObjectName(u"verticalLayoutWidget")
+        self.verticalLayoutWidget.setGeometry(QRect(30, 170, 711, 31))
+        self.vbox_url = QVBoxLayout(self.verticalLayoutWidget)
+        self.vbox_url.setObjectName(u"vbox_url")
+        self.vbox_url.setContentsMargins(0, 0, 0, 0)
+        self.textEdit_url = QTextEdit(self.verticalLayoutWidget)
+        self.textEdit_url.setObjectName(u"textEdit_url")
+        sizePolicy.setHeightForWidth(self.textEdit_url.sizePolicy().hasHeightForWidth())
+        self.textEdit_url.setSizePolicy(sizePolicy)
+
+        self.vbox_url.addWidget(self.textEdit_url)
+
+        self.comboBox_select_model = QComboBox(self.frame)
+        self.comboBox_select_model.setObjectName(u"comboBox_select_model")
+        self.comboBox_select_model.setGeometry(QRect(30, 250, 301, 26))
+        self.comboBox_2 = QComboBox(self.frame)
+        self.comboBox_2.setObjectName(u"comboBox_2")
+        self.comboBox_2.setGeometry(QRect(30, 350, 301, 26))
+        self.label_select_model = QLabel(self.frame)
+        self.label_select_model.setObjectName(u"label_select_model")
+        self.label_select_model.setGeometry(QRect(30, 220, 141, 18))
+        self.label_input_device = QLabel(self.frame)
+        self.label_input_device.setObjectName(u"label_input_device")
+        self.label_input_device.setGeometry(QRect(30, 330, 141, 18))
+        sizePolicy.setHeightForWidth(self.label_input_device.sizePolicy().hasHeightForWidth())
+        self.label_input_device.setSizePolicy(sizePolicy)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 801, 23))
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
+        self.radioButton_local.setText(QCoreApplication.translate("MainWindow", u"Local", None))
+        self.radioButton_remote.setText(QCoreApplication.translate("MainWindow", u"Remote", None))
+        self.pushButton_gstream.setText(QCoreApplication.translate("MainWindow", u"GStream", None))
+        self.pushButton_utralytics.setText(QCoreApplication.translate("MainWindow", u"Ultralytics", None))
+        self.pushButton_opencv.setText(QCoreApplication.translate("MainWindow", u"OpenCV", None))
+        self.label_select_model.setText(QCoreApplication.translate("MainWindow", u"Select model", None))
+        self.label_input_device.setText(QCoreApplication.translate("MainWindow", u"Select device", None))
+    # retranslateUi
+
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'video_inference_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QLabel, QMainWindow, QMenuBar,
+    QSizePolicy, QStatusBar, QWidget)
+
+class Ui_video_inference_window(object):
+    def setupUi(self, video_inference_window):
+        if not video_inference_window.objectName():
+            video_inference_window.setObjectName(u"video_inference_window")
+        video_inference_window.resize(935, 604)
+        self.centralwidget = QWidget(video_inference_window)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.label_video = QLabel(self.centralwidget)
+        self.label_video.setObjectName(u"label_video")
+        self.label_video.setGeometry(QRect(20, 80, 391, 341))
+        self.label_inference = QLabel(self.centralwidget)
+        self.label_inference.setObjectName(u"label_inference")
+        self.label_inference.setGeometry(QRect(480, 80, 391, 341))
+        video_inference_window.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(video_inference_window)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 935, 23))
+        video_inference_window.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(video_inference_window)
+        self.statusbar.setObjectName(u"statusbar")
+        video_inference_window.setStatusBar(self.statusbar)
+
+        self.retranslateUi(video_inference_window)
+
+        QMetaObject.connectSlotsByName(video_inference_window)
+    # setupUi
+
+    def retranslateUi(self, video_inference_window):
+        video_inference_window.setWindowTitle(QCoreApplication.translate("video_inference_window", u"Video inference", None))
+        self.label_video.setText(QCoreApplication.translate("video_inference_window", u"TextLabel", None))
+        self.label_inference.setText(QCoreApplication.translate("video_inference_window", u"TextLabel", None))
+    # retranslateUi
+
@@ -1,7 +1,6 @@
+import os
 from pathlib import Path
 
-from PySide6.QtMultimedia import QMediaDevices
-
 
 def list_v4l2_devices_linux():
     results = []
@@ -14,4 +13,13 @@ def list_v4l2_devices_linux():
         name_file = entry / "name"
         label = name_file.read_text(errors="ignore").strip() if name_file.exists() else dev
         results.append((f"/dev/{dev}", label))
-    return results
\ No newline at end of file
+    return results
+
+def list_test_sources():
+    """
+    Extra sources from JMODEL_TEST_SOURCES (";"-separated core.sources URIs,
+    e.g. "synthetic://1280x720@30;replay:///data/clip.mp4?loop=1"), so the
+    app can run on machines without cameras.
+    """
+    env = os.getenv("JMODEL_TEST_SOURCES", "")
+    return [(uri.strip(), uri.strip()) for uri in env.split(";") if uri.strip()]
@@ -15,4 +15,49 @@ def listar_modelos_desde_env():
         if os.path.isfile(os.path.join(ruta_base, archivo))
     }
 
-    return modelos_dict
\ No newline at end of file
+    return modelos_dict
+
+
+def classifier_model_from_env():
+    """
+    Optional crop classifier (second stage). Returns None when not configured.
+    """
+    ruta = os.getenv('ABSOLUTE_PATH_CLASSIFIER')
+    if not ruta:
+        return None
+    if not os.path.isfile(ruta):
+        print(f"Error: El clasificador '{ruta}' no es un archivo válido.")
+        return None
+    return ruta
+
+def guess_task(model_path):
+    """
+    Task from the ultralytics naming convention (yolo11n-seg.pt, yolo11n-pose.engine, ...).
+    Exported engines do not carry the task, so the file name is the only hint.
+    """
+    name = os.path.basename(model_path or "").lower()
+    if "-seg" in name:
+        return "segment"
+    if "-pose" in name:
+        return "pose"
+    return "detect"
+
+def extra_models_from_env():
+    """
+    Extra models that run on the same frames as the selected one, e.g. a pose
+    model next to a detector. ABSOLUTE_PATH_EXTRA_MODELS is a list of paths
+    separated by os.pathsep. Returns [(path, task), ...].
+    """
+    valor = os.getenv('ABSOLUTE_PATH_EXTRA_MODELS')
+    if not valor:
+        return []
+    modelos = []
+    for ruta in valor.split(os.pathsep):
+        ruta = ruta.strip()
+        if not ruta:
+            continue
+        if not os.path.isfile(ruta):
+            print(f"Error: El modelo extra '{ruta}' no es un archivo válido.")
+            continue
+        modelos.append((ruta, guess_task(ruta)))
+    return modelos
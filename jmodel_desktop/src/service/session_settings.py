@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+
+from PySide6.QtCore import QSettings
+
+DEFAULT_GRACE_S = 30.0
+DEFAULT_BACKGROUND_INFER_FPS = 1.0
+DEFAULT_METRICS_PORT = 9464
+DEFAULT_AUTOTUNE_LATENCY_MS = 150.0
+
+
+def load_grace_seconds():
+    """Seconds an unwatched inference session stays warm (env overrides QSettings)."""
+    env = os.getenv("JMODEL_SESSION_GRACE_S")
+    if env:
+        return float(env)
+    return float(QSettings().value("session_grace_s", DEFAULT_GRACE_S))
+
+
+def save_grace_seconds(seconds):
+    QSettings().setValue("session_grace_s", float(seconds))
+
+
+def load_background_infer_fps():
+    """Inference rate while no view of a session is visible; 0 pauses it (env overrides QSettings)."""
+    env = os.getenv("JMODEL_BACKGROUND_INFER_FPS")
+    if env:
+        return float(env)
+    return float(QSettings().value("background_infer_fps", DEFAULT_BACKGROUND_INFER_FPS))
+
+
+def save_background_infer_fps(fps):
+    QSettings().setValue("background_infer_fps", float(fps))
+
+
+def load_sync_overlay():
+    """Synchronised mode: the live view is delayed to match the inference view."""
+    return QSettings().value("sync_overlay", False, bool)
+
+
+def save_sync_overlay(enabled):
+    QSettings().setValue("sync_overlay", bool(enabled))
+
+
+def load_sync_delay_ms():
+    """Fixed delay for synchronised mode; 0 follows the measured inference latency."""
+    return float(QSettings().value("sync_delay_ms", 0.0))
+
+
+def save_sync_delay_ms(ms):
+    QSettings().setValue("sync_delay_ms", float(ms))
+
+
+def load_frame_trace():
+    """Per-frame stage timing in the video window (env JMODEL_FRAME_TRACE=1 overrides QSettings)."""
+    env = os.getenv("JMODEL_FRAME_TRACE")
+    if env:
+        return env not in ("0", "false", "no")
+    return QSettings().value("frame_trace", False, bool)
+
+
+def save_frame_trace(enabled):
+    QSettings().setValue("frame_trace", bool(enabled))
+
+
+def load_metrics_enabled():
+    """OpenMetrics endpoint on/off (env JMODEL_METRICS=1 overrides QSettings)."""
+    env = os.getenv("JMODEL_METRICS")
+    if env:
+        return env not in ("0", "false", "no")
+    return QSettings().value("metrics/enabled", False, bool)
+
+
+def save_metrics_enabled(enabled):
+    QSettings().setValue("metrics/enabled", bool(enabled))
+
+
+def load_metrics_mode():
+    """Bind mode: "local" is 127.0.0.1, "external" the configured host (all interfaces if empty)."""
+    return str(QSettings().value("metrics/mode", "local"))
+
+
+def save_metrics_mode(mode):
+    QSettings().setValue("metrics/mode", str(mode))
+
+
+def load_metrics_host():
+    return str(QSettings().value("metrics/host", ""))
+
+
+def save_metrics_host(host):
+    QSettings().setValue("metrics/host", str(host).strip())
+
+
+def load_metrics_port():
+    """Port of the metrics endpoint (env JMODEL_METRICS_PORT overrides QSettings)."""
+    env = os.getenv("JMODEL_METRICS_PORT")
+    if env:
+        return int(env)
+    return int(QSettings().value("metrics/port", DEFAULT_METRICS_PORT))
+
+
+def save_metrics_port(port):
+    QSettings().setValue("metrics/port", int(port))
+
+
+def load_autotune_latency_ms():
+    """p95 capture -> result latency the auto-tuner must stay within (env JMODEL_AUTOTUNE_LATENCY_MS overrides QSettings)."""
+    env = os.getenv("JMODEL_AUTOTUNE_LATENCY_MS")
+    if env:
+        return float(env)
+    return float(QSettings().value("autotune/latency_target_ms", DEFAULT_AUTOTUNE_LATENCY_MS))
+
+
+def save_autotune_latency_ms(ms):
+    QSettings().setValue("autotune/latency_target_ms", float(ms))
+
+
+def _tuned_key(device_path, model_path):
+    # Device paths and model paths contain "/", which QSettings treats as groups
+    digest = hashlib.sha1(f"{device_path}|{model_path}".encode("utf-8")).hexdigest()[:16]
+    return f"autotune/settings/{digest}"
+
+
+def load_tuned_settings(device_path, model_path):
+    """Settings the auto-tuner picked for (device, model): width/height/fps/infer_fps/ui_fps/imgsz, or None."""
+    raw = QSettings().value(_tuned_key(device_path, model_path), "")
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+    return data.get("settings")
+
+
+def save_tuned_settings(device_path, model_path, settings, extra=None):
+    data = {"device": device_path, "model": model_path, "settings": dict(settings), **(extra or {})}
+    QSettings().setValue(_tuned_key(device_path, model_path), json.dumps(data))
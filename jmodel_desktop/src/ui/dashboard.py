@@ -0,0 +1,225 @@
+from PySide6.QtCore import Qt, QPointF, QTimer
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QFrame,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+)
+
+from ..core.broker import capture_broker
+from ..core.process_stats import ProcessSampler
+from ..core.stats import History
+
+REFRESH_MS = 500
+HISTORY = 120  # samples per sparkline (one minute at 2 Hz)
+
+
+class Sparkline(QWidget):
+    """Line chart of a History, scaled to its own min/max. Painting only, no axes."""
+
+    def __init__(self, color="#60a5fa", parent=None):
+        super().__init__(parent)
+        self._values = []
+        self._color = QColor(color)
+        self.setMinimumSize(80, 24)
+
+    def set_values(self, values):
+        self._values = [v for v in values if v is not None]
+        self.update()
+
+    def paintEvent(self, event):
+        values = self._values
+        if len(values) < 2:
+            return
+        lo, hi = min(values), max(values)
+        span = (hi - lo) or 1.0
+        w, h = self.width() - 2, self.height() - 2
+        step = w / (len(values) - 1)
+        line = QPolygonF([
+            QPointF(1 + i * step, 1 + h - (v - lo) / span * h)
+            for i, v in enumerate(values)
+        ])
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self._color, 1.5))
+        painter.drawPolyline(line)
+
+
+class _Metric(QFrame):
+    """Value label + sparkline for one process metric."""
+
+    def __init__(self, title, fmt, color):
+        super().__init__()
+        self.setObjectName("Card")
+        self.fmt = fmt
+        self.history = History(HISTORY)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 8, 10, 8)
+        caption = QLabel(title)
+        caption.setStyleSheet("color: #9ca3af;")
+        self.value = QLabel("-")
+        self.value.setStyleSheet("font-size: 18px; font-weight: 700;")
+        self.spark = Sparkline(color)
+        layout.addWidget(caption)
+        layout.addWidget(self.value)
+        layout.addWidget(self.spark)
+
+    def push(self, value):
+        self.history.push(value)
+        self.value.setText(self.fmt.format(value))
+        self.spark.set_values(self.history.values())
+
+
+def _latency(stage):
+    if not stage or stage["p50_ms"] is None:
+        return "-"
+    return f"{stage['p50_ms']:.0f} / {stage['p95_ms']:.0f}"
+
+
+class DashboardPage(QWidget):
+    """
+    Live performance of the running sessions, the shared capture devices and
+    the process. Everything is read from snapshots (stats rings, broker
+    counters, /proc) twice a second while the page is visible, so the video
+    threads are never waited on.
+    """
+    SESSION_COLUMNS = ("Session", "Capture fps", "Infer fps", "Infer p50/p95 ms", "Result p50/p95 ms",
+                       "Preview p50/p95 ms", "Infer backlog", "Drops", "Infer fps (1 min)")
+    DEVICE_COLUMNS = ("Device", "Frames", "Subscriber", "Delivered", "Pending", "Dropped", "Skipped")
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        title = QLabel("Performance")
+        title.setObjectName("TitleLabel")
+
+        self._process = ProcessSampler()
+        self.cpu = _Metric("CPU", "{:.0f} %", "#f59e0b")
+        self.rss = _Metric("RSS", "{:.0f} MB", "#a78bfa")
+        self.threads = _Metric("Threads", "{:d}", "#34d399")
+        cards = QHBoxLayout()
+        for card in (self.cpu, self.rss, self.threads):
+            cards.addWidget(card, 1)
+
+        self.sessions = self._table(self.SESSION_COLUMNS)
+        self.devices = self._table(self.DEVICE_COLUMNS)
+        spark_column = len(self.SESSION_COLUMNS) - 1
+        self.sessions.horizontalHeader().setSectionResizeMode(spark_column, QHeaderView.Fixed)
+        self.sessions.setColumnWidth(spark_column, 160)
+        self._session_history = {}  # InferenceSession -> History of infer fps
+
+        layout.addWidget(title)
+        layout.addLayout(cards)
+        layout.addWidget(QLabel("Sessions"))
+        layout.addWidget(self.sessions, 2)
+        layout.addWidget(QLabel("Capture devices"))
+        layout.addWidget(self.devices, 1)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    @staticmethod
+    def _table(columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    # ---------- Refresh ----------
+    def refresh(self):
+        proc = self._process.sample()
+        self.cpu.push(proc["cpu_percent"])
+        self.rss.push(proc["rss_mb"])
+        self.threads.push(proc["threads"])
+        self._refresh_sessions()
+        self._refresh_devices()
+
+    def _refresh_sessions(self):
+        from ..controllers.session_manager import session_manager
+
+        sessions = [s for s in session_manager().sessions() if s.is_running()]
+        for gone in set(self._session_history) - set(sessions):
+            del self._session_history[gone]
+
+        table = self.sessions
+        table.setRowCount(len(sessions))
+        for row, session in enumerate(sessions):
+            m = session.metrics()
+            stages = m["stages"]
+            infer = stages.get("infer")
+            history = self._session_history.setdefault(session, History(HISTORY))
+            history.push(infer["fps"] if infer else 0.0)
+
+            drops = sum(s["drops"] for s in stages.values())
+            cells = (
+                m["label"],
+                f"{stages['capture']['fps']:.1f}" if "capture" in stages else "-",
+                f"{infer['fps']:.1f}" if infer else "-",
+                _latency(infer),
+                _latency(stages.get("result")),
+                _latency(stages.get("preview")),
+                str(m["queues"]["infer"]),
+                str(drops),
+            )
+            for col, text in enumerate(cells):
+                self._set_cell(table, row, col, text, numeric=col > 0)
+            spark = table.cellWidget(row, len(cells))
+            if not isinstance(spark, Sparkline):
+                spark = Sparkline()
+                table.setCellWidget(row, len(cells), spark)
+            spark.set_values(history.values())
+
+    def _refresh_devices(self):
+        rows = []
+        for device, info in capture_broker().devices().items():
+            subscribers = info["subscribers"] or [None]
+            for i, sub in enumerate(subscribers):
+                first = i == 0
+                rows.append((
+                    str(device) if first else "",
+                    str(info["frames"]) if first else "",
+                    sub["name"] if sub else "-",
+                    str(sub["delivered"]) if sub else "-",
+                    str(sub["pending"]) if sub else "-",
+                    str(sub["dropped"]) if sub else "-",
+                    str(sub["skipped"]) if sub else "-",
+                ))
+        table = self.devices
+        table.setRowCount(len(rows))
+        for row, cells in enumerate(rows):
+            for col, text in enumerate(cells):
+                self._set_cell(table, row, col, text, numeric=col not in (0, 2))
+
+    @staticmethod
+    def _set_cell(table, row, col, text, numeric):
+        item = table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem()
+            if numeric:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, col, item)
+        if item.text() != text:
+            item.setText(text)
@@ -1,4 +1,4 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -13,10 +13,9 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 
-from .pages import HomePage, ToolsPage, SettingsPage
-from .video.camara_page import CameraPage
-from .video.run_model_page import RunModelPage
+from .pages import HomePage, SettingsPage
 from .theme import apply_theme, load_theme_name, save_theme_name
+from ..utils.diagnostics import add_profiler_actions, add_trace_actions
 
 
 class MainWindow(QMainWindow):
@@ -61,9 +60,10 @@ class MainWindow(QMainWindow):
 
         self.nav = QListWidget()
         self.nav.addItem("Home")
-        self.nav.addItem("Tools")
+        self.nav.addItem("Performance")
         self.nav.addItem("Camera")
         self.nav.addItem("Run Model")
+        self.nav.addItem("Grid")
         self.nav.addItem("Settings")
         self.nav.setCurrentRow(0)
         self.nav.currentRowChanged.connect(self._on_nav_changed)
@@ -72,12 +72,27 @@ class MainWindow(QMainWindow):
         sidebar_layout.addWidget(subtitle)
         sidebar_layout.addWidget(self.nav, 1)
 
+        # Pages are built the first time they are shown (or prefetched when idle);
+        # until then the stack holds empty placeholders.
+        self._page_factories = [
+            HomePage,
+            self._create_dashboard_page,
+            self._create_camera_page,
+            self._create_run_model_page,
+            self._create_grid_page,
+            SettingsPage,
+        ]
+        self._pages = {}
         self.stack = QStackedWidget()
-        self.stack.addWidget(HomePage())
-        self.stack.addWidget(ToolsPage())
-        self.stack.addWidget(CameraPage())
-        self.stack.addWidget(RunModelPage(parent_main_window=self))
-        self.stack.addWidget(SettingsPage())
+        for _ in self._page_factories:
+            self.stack.addWidget(QWidget())
+        self._ensure_page(0)
+
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(150)
+        self._prefetch_timer.timeout.connect(self._prefetch_next_page)
+        self._prefetch_timer.start()
 
         root_layout.addWidget(sidebar)
         root_layout.addWidget(self.stack, 1)
@@ -98,8 +113,56 @@ class MainWindow(QMainWindow):
         about_button.clicked.connect(self._about)
         tb.addWidget(about_button)
 
+        tb.addSeparator()
+        add_trace_actions(tb, self)
+        add_profiler_actions(tb, self)
+
+    # ---------- Lazy pages ----------
+    def _create_dashboard_page(self):
+        from .dashboard import DashboardPage
+        return DashboardPage()
+
+    def _create_camera_page(self):
+        from .video.camara_page import CameraPage
+        return CameraPage()
+
+    def _create_run_model_page(self):
+        from .video.run_model_page import RunModelPage
+        page = RunModelPage(parent_main_window=self)
+        self.run_model_page = page
+        return page
+
+    def _create_grid_page(self):
+        from .video.grid_view import GridPage
+        page = GridPage()
+        self.grid_page = page
+        return page
+
+    def _ensure_page(self, index):
+        page = self._pages.get(index)
+        if page is not None:
+            return page
+
+        page = self._page_factories[index]()
+        placeholder = self.stack.widget(index)
+        current = self.stack.currentIndex()
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.setCurrentIndex(current)
+        self._pages[index] = page
+        return page
+
+    def _prefetch_next_page(self):
+        # Most navigation goes to the next entry of the sidebar
+        index = self.nav.currentRow() + 1
+        if index < len(self._page_factories) and index not in self._pages:
+            self._ensure_page(index)
+
     def _on_nav_changed(self, index):
+        self._ensure_page(index)
         self.stack.setCurrentIndex(index)
+        self._prefetch_timer.start()
 
     def _toggle_theme(self):
         self._theme_name = "light" if self._theme_name == "dark" else "dark"
@@ -117,5 +180,7 @@ class MainWindow(QMainWindow):
         try:
             if hasattr(self, "run_model_page"):
                 self.run_model_page.stop_and_wait()
+            if hasattr(self, "grid_page"):
+                self.grid_page.stop_and_wait()
         finally:
             super().closeEvent(event)
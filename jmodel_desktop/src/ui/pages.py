@@ -3,12 +3,28 @@ from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QHBoxLayout,
     QLineEdit,
-    QPushButton,
-    QTextEdit,
     QFormLayout,
     QComboBox,
+    QDoubleSpinBox,
+    QCheckBox,
+)
+
+from ..service.session_settings import (
+    load_grace_seconds,
+    save_grace_seconds,
+    load_background_infer_fps,
+    save_background_infer_fps,
+    load_sync_delay_ms,
+    save_sync_delay_ms,
+    load_metrics_enabled,
+    save_metrics_enabled,
+    load_metrics_mode,
+    save_metrics_mode,
+    load_metrics_host,
+    save_metrics_host,
+    load_metrics_port,
+    save_metrics_port,
 )
 
 
@@ -30,41 +46,6 @@ class HomePage(QWidget):
         layout.addStretch(1)
 
 
-class ToolsPage(QWidget):
-    def __init__(self):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        layout.setSpacing(12)
-
-        title = QLabel("Tools")
-        title.setObjectName("TitleLabel")
-
-        row = QHBoxLayout()
-        self.input_edit = QLineEdit()
-        self.input_edit.setPlaceholderText("Type something...")
-        self.run_button = QPushButton("Run")
-        self.run_button.clicked.connect(self._run)
-
-        row.addWidget(self.input_edit, 1)
-        row.addWidget(self.run_button)
-
-        self.output = QTextEdit()
-        self.output.setReadOnly(True)
-        self.output.setPlaceholderText("Logs...")
-
-        layout.addWidget(title)
-        layout.addLayout(row)
-        layout.addWidget(self.output, 1)
-
-    def _run(self):
-        text = self.input_edit.text().strip()
-        if not text:
-            self.output.append("[warn] Empty input")
-            return
-        self.output.append(f"[ok] You typed: {text}")
-        self.input_edit.clear()
-
-
 class SettingsPage(QWidget):
     def __init__(self):
         super().__init__()
@@ -77,18 +58,61 @@ class SettingsPage(QWidget):
         form = QFormLayout()
         form.setLabelAlignment(Qt.AlignLeft)
 
+        # Metrics endpoint (OpenMetrics text for Prometheus scrapes)
+        self.metrics_enabled = QCheckBox("Serve /metrics")
+        self.metrics_enabled.setChecked(load_metrics_enabled())
         self.mode = QComboBox()
         self.mode.addItems(["Local (127.0.0.1)", "External"])
-        self.host = QLineEdit()
-        self.host.setPlaceholderText("e.g. 192.168.0.10")
-        self.port = QLineEdit()
-        self.port.setPlaceholderText("e.g. 8000 (optional)")
-
+        self.mode.setCurrentIndex(1 if load_metrics_mode() == "external" else 0)
+        self.host = QLineEdit(load_metrics_host())
+        self.host.setPlaceholderText("e.g. 192.168.0.10 (empty = all interfaces)")
+        self.port = QLineEdit(str(load_metrics_port()))
+        self.port.setPlaceholderText("e.g. 9464")
+        self.metrics_status = QLabel()
+        self.metrics_status.setStyleSheet("color: #9ca3af;")
+
+        self.metrics_enabled.toggled.connect(self._on_metrics_changed)
+        self.mode.currentIndexChanged.connect(self._on_metrics_changed)
+        self.host.editingFinished.connect(self._on_metrics_changed)
+        self.port.editingFinished.connect(self._on_metrics_changed)
+
+        self.session_grace = QDoubleSpinBox()
+        self.session_grace.setRange(0.0, 3600.0)
+        self.session_grace.setDecimals(0)
+        self.session_grace.setSuffix(" s")
+        self.session_grace.setValue(load_grace_seconds())
+        self.session_grace.setToolTip("How long capture and model stay warm after the video window closes.")
+        self.session_grace.valueChanged.connect(save_grace_seconds)
+
+        self.background_fps = QDoubleSpinBox()
+        self.background_fps.setRange(0.0, 30.0)
+        self.background_fps.setDecimals(1)
+        self.background_fps.setSingleStep(0.5)
+        self.background_fps.setSuffix(" fps")
+        self.background_fps.setValue(load_background_infer_fps())
+        self.background_fps.setToolTip("Inference rate while the video window is hidden or minimized (0 = pause).")
+        self.background_fps.valueChanged.connect(save_background_infer_fps)
+
+        self.sync_delay = QDoubleSpinBox()
+        self.sync_delay.setRange(0.0, 2000.0)
+        self.sync_delay.setDecimals(0)
+        self.sync_delay.setSingleStep(10.0)
+        self.sync_delay.setSuffix(" ms")
+        self.sync_delay.setSpecialValueText("Auto (measured latency)")
+        self.sync_delay.setValue(load_sync_delay_ms())
+        self.sync_delay.setToolTip("Live view delay in synchronised overlay mode.")
+        self.sync_delay.valueChanged.connect(save_sync_delay_ms)
+
+        form.addRow("Metrics", self.metrics_enabled)
         form.addRow("Mode", self.mode)
         form.addRow("Host", self.host)
         form.addRow("Port", self.port)
+        form.addRow("", self.metrics_status)
+        form.addRow("Session grace", self.session_grace)
+        form.addRow("Background inference", self.background_fps)
+        form.addRow("Sync delay", self.sync_delay)
 
-        hint = QLabel("Tip: persist these later using QSettings (same idea as theme).")
+        hint = QLabel("Settings are saved as you change them (QSettings).")
         hint.setWordWrap(True)
         hint.setStyleSheet("color: #9ca3af;")
 
@@ -96,3 +120,26 @@ class SettingsPage(QWidget):
         layout.addLayout(form)
         layout.addWidget(hint)
         layout.addStretch(1)
+
+        self._show_metrics_status()
+
+    def _on_metrics_changed(self, *_):
+        port = self.port.text().strip()
+        if not port.isdigit() or not 0 < int(port) < 65536:
+            self.metrics_status.setText("Port must be a number between 1 and 65535")
+            return
+        save_metrics_enabled(self.metrics_enabled.isChecked())
+        save_metrics_mode("external" if self.mode.currentIndex() == 1 else "local")
+        save_metrics_host(self.host.text())
+        save_metrics_port(int(port))
+
+        from ..controllers.metrics_endpoint import metrics_endpoint
+        metrics_endpoint().apply_settings()
+        self._show_metrics_status()
+
+    def _show_metrics_status(self):
+        if not load_metrics_enabled():
+            self.metrics_status.setText("Metrics endpoint off")
+            return
+        from ..controllers.metrics_endpoint import metrics_endpoint
+        self.metrics_status.setText(metrics_endpoint().status)
@@ -61,6 +61,7 @@ def _qss_dark():
     QWidget { font-size: 13px; }
     QLabel#TitleLabel { font-size: 18px; font-weight: 700; }
     QFrame#Sidebar { background: #0b1220; border-right: 1px solid #1f2a44; }
+    QFrame#Card { background: #0b1220; border: 1px solid #1f2a44; border-radius: 10px; }
     QListWidget { background: transparent; border: none; padding: 8px; }
     QListWidget::item { padding: 10px 12px; border-radius: 10px; color: #e5e7eb; }
     QListWidget::item:selected { background: #111c33; }
@@ -84,6 +85,7 @@ def _qss_light():
     QWidget { font-size: 13px; }
     QLabel#TitleLabel { font-size: 18px; font-weight: 700; }
     QFrame#Sidebar { background: #ffffff; border-right: 1px solid #e2e8f0; }
+    QFrame#Card { background: #ffffff; border: 1px solid #e2e8f0; border-radius: 10px; }
     QListWidget { background: transparent; border: none; padding: 8px; }
     QListWidget::item { padding: 10px 12px; border-radius: 10px; color: #0f172a; }
     QListWidget::item:selected { background: #f1f5f9; }
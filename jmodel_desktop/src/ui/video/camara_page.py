@@ -13,8 +13,7 @@ from PySide6.QtWidgets import (
     QFormLayout,
     QComboBox,
 )
-from ...service.devices import list_v4l2_devices_linux
-from PySide6.QtMultimedia import QMediaDevices
+from .device_scan import scan_devices_async
 
 class CameraPage(QWidget):
     def __init__(self):
@@ -44,13 +43,25 @@ class CameraPage(QWidget):
         layout.addLayout(row)
         layout.addWidget(self.details, 1)
 
+        self._scan_task = None
         self._refresh_devices()
 
     def _refresh_devices(self):
+        # Enumeration runs on a worker; the page is usable right away
+        if self._scan_task is not None:
+            return
+        self.refresh_button.setEnabled(False)
+        self.details.setPlainText("Scanning cameras...")
+        self._scan_task = scan_devices_async(self._on_devices_scanned, include_qt=True)
+
+    def _on_devices_scanned(self, result):
+        self._scan_task = None
+        self.refresh_button.setEnabled(True)
+
         self.camera_combo.blockSignals(True)
         self.camera_combo.clear()
 
-        qt_devices = QMediaDevices.videoInputs()
+        qt_devices = result["qt"]
         if qt_devices:
             for dev in qt_devices:
                 self.camera_combo.addItem(dev.description(), dev)
@@ -70,7 +81,7 @@ class CameraPage(QWidget):
 
         self.details.append("\n== Linux /dev/video* (v4l2 sysfs) ==")
         if sys.platform.startswith("linux"):
-            v4l2 = list_v4l2_devices_linux()
+            v4l2 = result["v4l2"]
             if v4l2:
                 for path, label in v4l2:
                     self.details.append(f"- {path}: {label}")
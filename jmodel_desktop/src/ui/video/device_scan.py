@@ -0,0 +1,58 @@
+import sys
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ...service.devices import list_test_sources, list_v4l2_devices_linux
+
+
+class _ScanSignals(QObject):
+    finished = Signal(object)  # dict: {"v4l2": [(path, label)], "test": [(uri, label)], "qt": None}
+
+
+class DeviceScanTask(QRunnable):
+    """
+    Enumerates cameras off the GUI thread (sysfs can take a noticeable time
+    on the first call). The Qt multimedia backend is not thread-safe, so
+    its cameras are listed afterwards on the GUI thread, see
+    scan_devices_async().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _ScanSignals()
+
+    def run(self):
+        result = {"v4l2": [], "test": list_test_sources(), "qt": None}
+        if sys.platform.startswith("linux"):
+            result["v4l2"] = list_v4l2_devices_linux()
+        self.signals.finished.emit(result)
+
+
+def _qt_video_inputs():
+    """Qt multimedia cameras; GUI thread only."""
+    try:
+        from PySide6.QtMultimedia import QMediaDevices
+        return list(QMediaDevices.videoInputs())
+    except Exception as e:
+        print(f"[devices] Qt multimedia not available: {e}")
+        return []
+
+
+def scan_devices_async(callback, include_qt=False):
+    """
+    Starts a scan on the global thread pool; `callback(result)` runs on the
+    thread that called this (the GUI thread), after the Qt cameras were
+    added there when `include_qt`. Keep the returned task alive until the
+    callback fires.
+    """
+    task = DeviceScanTask()
+    task.setAutoDelete(False)
+
+    def on_finished(result):
+        if include_qt:
+            result["qt"] = _qt_video_inputs()
+        callback(result)
+
+    task.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(task)
+    return task
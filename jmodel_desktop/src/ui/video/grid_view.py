@@ -0,0 +1,259 @@
+import math
+import time
+
+from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QPushButton,
+    QSpinBox,
+)
+
+from ...controllers.inference_session import bgr_to_qimage
+from ...core import tracing
+from ...core.broker import capture_broker
+from ...core.frames import resize_to_fit
+from .device_scan import scan_devices_async
+
+
+class _Tile:
+    """One stream of the grid. `image`/`size` are swapped atomically across threads."""
+
+    def __init__(self, source):
+        self.source = source
+        self.sub = None
+        self.size = (0, 0)     # target (w, h), set by the GUI thread
+        self.image = None      # latest QImage, already at tile size
+        self.error = None
+        self.frames = 0        # since the last fps sample
+        self.fps = 0.0
+
+
+class StreamGrid(QWidget):
+    """
+    Shows several streams in one widget. Frames are scaled to their tile in
+    the capture thread, and all tiles are painted together in a single
+    paintEvent at most once per tick.
+    """
+    GAP = 2
+
+    def __init__(self, max_fps=15, tick_ms=16, parent=None):
+        super().__init__(parent)
+        self.max_fps = max_fps
+        self._tiles = []
+        self._dirty = False
+        self._shown = False  # no conversions while the page is hidden
+        self._fps_t0 = time.monotonic()
+
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setMinimumSize(320, 180)
+
+        # Coalesce: frames only mark the grid dirty, the tick repaints once
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.PreciseTimer)
+        self._tick.setInterval(tick_ms)
+        self._tick.timeout.connect(self._on_tick)
+
+    def set_max_fps(self, max_fps):
+        self.max_fps = max_fps
+        for tile in self._tiles:
+            tile.sub.set_max_fps(max_fps)
+
+    def sources(self):
+        return [t.source for t in self._tiles]
+
+    def add_stream(self, source, width=1280, height=720, fps=30):
+        if source in self.sources():
+            return
+        tile = _Tile(source)
+        self._tiles.append(tile)
+        self._layout_tiles()
+        tile.sub = capture_broker().subscribe(
+            source,
+            name="grid",
+            max_fps=self.max_fps,
+            on_frame=lambda seq, frame, t=tile: self._on_frame(t, frame),
+            on_error=lambda msg, t=tile: self._on_error(t, msg),
+            width=width, height=height, fps=fps,
+        )
+        if not self._tick.isActive():
+            self._tick.start()
+
+    def remove_stream(self, source):
+        for tile in list(self._tiles):
+            if tile.source == source:
+                self._tiles.remove(tile)
+                capture_broker().unsubscribe(tile.sub)
+        self._layout_tiles()
+        self.update()
+
+    def clear(self):
+        for source in self.sources():
+            self.remove_stream(source)
+        self._tick.stop()
+
+    # ---------- Capture threads ----------
+    def _on_frame(self, tile, frame):
+        tw, th = tile.size
+        if not self._shown or tw <= 0 or th <= 0:
+            return
+        tile.image = bgr_to_qimage(resize_to_fit(frame, tile.size))
+        tile.frames += 1
+        self._dirty = True
+
+    def _on_error(self, tile, msg):
+        tile.error = msg
+        self._dirty = True
+
+    # ---------- GUI thread ----------
+    def _on_tick(self):
+        now = time.monotonic()
+        if now - self._fps_t0 >= 1.0:
+            elapsed = now - self._fps_t0
+            for tile in self._tiles:
+                tile.fps, tile.frames = tile.frames / elapsed, 0
+            self._fps_t0 = now
+            self._dirty = True
+        if self._dirty:
+            self._dirty = False
+            self.update()
+
+    def _grid_shape(self):
+        n = len(self._tiles)
+        cols = max(1, math.ceil(math.sqrt(n)))
+        rows = max(1, math.ceil(n / cols))
+        return cols, rows
+
+    def _tile_rect(self, index):
+        cols, rows = self._grid_shape()
+        w = (self.width() - self.GAP * (cols - 1)) // cols
+        h = (self.height() - self.GAP * (rows - 1)) // rows
+        r, c = divmod(index, cols)
+        return QRect(c * (w + self.GAP), r * (h + self.GAP), w, h)
+
+    def _layout_tiles(self):
+        for i, tile in enumerate(self._tiles):
+            rect = self._tile_rect(i)
+            tile.size = (rect.width(), rect.height())
+
+    def resizeEvent(self, event):
+        self._layout_tiles()
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        self._shown = True
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._shown = False
+        super().hideEvent(event)
+
+    def paintEvent(self, event):
+        tr = tracing.active
+        t0 = time.perf_counter() if tr is not None else 0.0
+        p = QPainter(self)
+        p.fillRect(self.rect(), QColor(16, 16, 16))
+        p.setPen(QColor(230, 230, 230))
+        for i, tile in enumerate(self._tiles):
+            rect = self._tile_rect(i)
+            image = tile.image
+            if image is not None:
+                # Centered, no scaling: the capture thread already sized it
+                x = rect.x() + (rect.width() - image.width()) // 2
+                y = rect.y() + (rect.height() - image.height()) // 2
+                p.drawImage(x, y, image)
+            label = f"{tile.source}  {tile.fps:.1f} fps"
+            if tile.error:
+                label += f"  [{tile.error}]"
+            p.drawText(rect.adjusted(6, 4, -6, -4), Qt.AlignLeft | Qt.AlignTop, label)
+        p.end()
+        if tr is not None:
+            tr.add("grid.paint", t0, args={"tiles": len(self._tiles)})
+
+
+class GridPage(QWidget):
+    """Multi-camera monitor built on StreamGrid."""
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        title = QLabel("Camera grid")
+        title.setObjectName("TitleLabel")
+
+        row = QHBoxLayout()
+        self.source_combo = QComboBox()
+        self.source_combo.setEditable(True)
+        self.source_combo.setPlaceholderText("/dev/video0, index or file...")
+        self.refresh_button = QPushButton("Refresh")
+        self.add_button = QPushButton("Add")
+        self.add_all_button = QPushButton("Add all")
+        self.clear_button = QPushButton("Clear")
+        self.fps_spin = QSpinBox()
+        self.fps_spin.setRange(1, 60)
+        self.fps_spin.setValue(15)
+        self.fps_spin.setSuffix(" fps")
+
+        row.addWidget(self.source_combo, 1)
+        row.addWidget(self.fps_spin)
+        row.addWidget(self.refresh_button)
+        row.addWidget(self.add_button)
+        row.addWidget(self.add_all_button)
+        row.addWidget(self.clear_button)
+
+        self.grid = StreamGrid(max_fps=self.fps_spin.value())
+
+        layout.addWidget(title)
+        layout.addLayout(row)
+        layout.addWidget(self.grid, 1)
+
+        self.refresh_button.clicked.connect(self._refresh_devices)
+        self.add_button.clicked.connect(self._add_selected)
+        self.add_all_button.clicked.connect(self._add_all)
+        self.clear_button.clicked.connect(self.grid.clear)
+        self.fps_spin.valueChanged.connect(self._on_fps_changed)
+
+        self._scan_task = None
+        self._refresh_devices()
+
+    def _refresh_devices(self):
+        if self._scan_task is not None:
+            return
+        self.refresh_button.setEnabled(False)
+        self._scan_task = scan_devices_async(self._on_devices_scanned)
+
+    def _on_devices_scanned(self, result):
+        self._scan_task = None
+        self.refresh_button.setEnabled(True)
+        self.source_combo.clear()
+        for path, label in result["v4l2"]:
+            self.source_combo.addItem(f"{path} - {label}", path)
+        for uri, _label in result["test"]:
+            self.source_combo.addItem(uri, uri)
+
+    def _selected_source(self):
+        index = self.source_combo.currentIndex()
+        text = self.source_combo.currentText().strip()
+        if index >= 0 and self.source_combo.itemText(index) == text:
+            return self.source_combo.itemData(index)
+        return text or None
+
+    def _add_selected(self):
+        source = self._selected_source()
+        if source:
+            self.grid.add_stream(source)
+
+    def _add_all(self):
+        for i in range(self.source_combo.count()):
+            self.grid.add_stream(self.source_combo.itemData(i))
+
+    def _on_fps_changed(self, value):
+        self.grid.set_max_fps(value)
+
+    def stop_and_wait(self):
+        self.grid.clear()
@@ -4,9 +4,9 @@ from PySide6.QtCore import QSettings
 from PySide6.QtWidgets import QFileDialog, QLineEdit
 from PySide6.QtCore import Qt, QObject, QThread, Signal, Slot
 from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox, QSizePolicy
 
-from ...service.devices import list_v4l2_devices_linux
+from .device_scan import scan_devices_async
 
 
 class VideoWorker(QObject):
@@ -17,12 +17,15 @@ class VideoWorker(QObject):
     def __init__(self, device_path):
         super().__init__()
         self.device_path = device_path
+        self.view_size = None  # (w, h) reported by the preview window
         self._running = False
 
     @Slot()
     def run(self):
         try:
             import cv2
+            from ...core.frames import resize_to_fit
+            from ...core.sources import is_source_uri, open_source
         except Exception as e:
             self.error.emit(f"OpenCV (cv2) not available: {e}")
             self.finished.emit()
@@ -32,7 +35,15 @@ class VideoWorker(QObject):
 
         # Simple pipeline (you can replace with your Jetson-friendly pipeline later)
         # If you already have a known-good gst pipeline string, use that instead.
-        cap = cv2.VideoCapture(self.device_path)
+        if is_source_uri(self.device_path):
+            try:
+                cap = open_source(self.device_path)  # synthetic/replay sources (no camera needed)
+            except (OSError, ValueError) as e:
+                self.error.emit(f"Could not open frame source: {e}")
+                self.finished.emit()
+                return
+        else:
+            cap = cv2.VideoCapture(self.device_path)
         if not cap.isOpened():
             self.error.emit(f"Could not open camera: {self.device_path}")
             self.finished.emit()
@@ -47,6 +58,8 @@ class VideoWorker(QObject):
             # TODO: Run Ultralytics here (later)
             # Example placeholder: keep raw frame
 
+            # Scale once here, to exactly the preview size
+            frame = resize_to_fit(frame, self.view_size)
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             h, w, ch = rgb.shape
             bytes_per_line = ch * w
@@ -61,6 +74,8 @@ class VideoWorker(QObject):
 
 
 class VideoPreviewWindow(QWidget):
+    view_resized = Signal(object)  # (w, h) of the video label
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Model Output")
@@ -70,10 +85,18 @@ class VideoPreviewWindow(QWidget):
         layout = QVBoxLayout(self)
         self.video_label = QLabel("Waiting for video...")
         self.video_label.setAlignment(Qt.AlignCenter)
-        self.video_label.setScaledContents(True)
+        # Frames arrive at label size; Ignored keeps the pixmap from driving the layout
+        self.video_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
 
         layout.addWidget(self.video_label, 1)
 
+    def view_size(self):
+        return self.video_label.width(), self.video_label.height()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.view_resized.emit(self.view_size())
+
     @Slot(QImage)
     def on_frame(self, image):
         self.video_label.setPixmap(QPixmap.fromImage(image))
@@ -87,6 +110,7 @@ class RunModelPage(QWidget):
         self._thread = None
         self._worker = None
         self._preview = None
+        self._scan_task = None
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -143,9 +167,15 @@ class RunModelPage(QWidget):
 
     def _load_cameras(self):
         self.camera_combo.clear()
+        self.camera_combo.addItem("Scanning cameras...", None)
+        self._scan_task = scan_devices_async(self._on_cameras_scanned)
+
+    def _on_cameras_scanned(self, result):
+        self._scan_task = None
+        self.camera_combo.clear()
 
         if sys.platform.startswith("linux"):
-            devices = list_v4l2_devices_linux()  # [("/dev/video0", "Name"), ...]
+            devices = result["v4l2"] + result["test"]  # [("/dev/video0", "Name"), ...]
             if not devices:
                 self.camera_combo.addItem("No cameras found", None)
                 return
@@ -162,6 +192,7 @@ class RunModelPage(QWidget):
         # Make it a child of the main window so it closes when main closes
         self._preview = VideoPreviewWindow(parent=self._parent_main_window)
         self._preview.setWindowFlag(Qt.Window, True)
+        self._preview.view_resized.connect(self._on_preview_resized)
         self._preview.show()
 
     def _start(self):
@@ -183,6 +214,7 @@ class RunModelPage(QWidget):
 
         self._thread = QThread()
         self._worker = VideoWorker(device_path)
+        self._worker.view_size = self._preview.view_size()
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
@@ -208,6 +240,10 @@ class RunModelPage(QWidget):
             self._worker.stop()
         self.status.setText("Stopping...")
 
+    def _on_preview_resized(self, size):
+        if self._worker is not None:
+            self._worker.view_size = size
+
     def _on_error(self, message):
         self.status.setText(f"Error: {message}")
 
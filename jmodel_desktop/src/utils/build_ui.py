@@ -0,0 +1,51 @@
+"""
+Build step: compiles views/*.ui into Python classes under resources/.
+
+    poetry run python -m jmodel_desktop.src.utils.build_ui
+
+For every views/<name>.ui it writes resources/ui_<name>.py (pyside6-uic)
+and records the generated class and its base widget in
+resources/ui_registry.py, which load_windows.create_window reads.
+"""
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+VIEWS_DIR = SRC_DIR / "views"
+OUT_DIR = SRC_DIR / "resources"
+REGISTRY = OUT_DIR / "ui_registry.py"
+
+
+def _root_widget(ui_path):
+    root = ET.parse(ui_path).getroot()
+    widget = root.find("widget")
+    if widget is None:
+        raise RuntimeError(f"No top-level widget in {ui_path}")
+    return widget.get("class"), widget.get("name")
+
+
+def build(uic="pyside6-uic"):
+    entries = {}
+    for ui_path in sorted(VIEWS_DIR.glob("*.ui")):
+        name = ui_path.stem
+        base_class, object_name = _root_widget(ui_path)
+        out_path = OUT_DIR / f"ui_{name}.py"
+        subprocess.run([uic, str(ui_path), "-o", str(out_path)], check=True)
+        entries[name] = (f"ui_{name}", f"Ui_{object_name}", base_class)
+        print(f"{ui_path.relative_to(SRC_DIR)} -> {out_path.relative_to(SRC_DIR)}")
+
+    lines = [
+        "# Generated by jmodel_desktop.src.utils.build_ui -- do not edit.",
+        "# view name -> (module in resources, Ui class, base widget class)",
+        "UI_CLASSES = {",
+    ]
+    lines += [f"    {name!r}: {entry!r}," for name, entry in entries.items()]
+    lines.append("}")
+    REGISTRY.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"registry -> {REGISTRY.relative_to(SRC_DIR)}")
+
+
+if __name__ == "__main__":
+    build(*sys.argv[1:])
@@ -0,0 +1,129 @@
+"""
+Diagnostics actions shared by the windows (menus/toolbars) and the
+process-level hooks (env vars, POSIX signals).
+"""
+import os
+
+import shiboken6
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtWidgets import QFileDialog
+
+from ..core import tracing
+from ..core.sampling_profiler import SamplingProfiler, default_output_prefix
+from ..service.session_settings import load_metrics_enabled
+
+PROFILE_SHORTCUT = "Ctrl+Shift+P"
+
+
+def install_process_hooks(app):
+    """
+    JMODEL_TRACE=1 starts the span tracer at launch; SIGUSR2 starts it /
+    dumps it. Python only runs signal handlers when it gets control, so a
+    cheap timer wakes the interpreter while Qt's loop is idle. The metrics
+    endpoint starts here when enabled in the settings.
+    """
+    if os.getenv("JMODEL_TRACE") not in (None, "", "0"):
+        tracing.start()
+    if load_metrics_enabled():
+        # Imported only when needed: it pulls in the broker (and cv2)
+        from ..controllers.metrics_endpoint import metrics_endpoint
+        metrics_endpoint().apply_settings()
+    if tracing.install_signal_handler():
+        timer = QTimer(app)
+        timer.setInterval(250)
+        timer.timeout.connect(lambda: None)
+        timer.start()
+        app._signal_wakeup = timer
+
+
+def add_trace_actions(container, parent):
+    """
+    Adds "Record trace" (checkable) and "Dump trace..." to a QMenu or
+    QToolBar. The dump is Chrome trace JSON, for Perfetto.
+    """
+    record = QAction("Record trace", parent)
+    record.setCheckable(True)
+    record.setChecked(tracing.active is not None)
+    record.setToolTip("Record thread activity and lock waits into a ring buffer")
+
+    dump = QAction("Dump trace...", parent)
+    dump.setEnabled(tracing.active is not None)
+
+    def on_record(enabled):
+        if enabled:
+            tracing.start()
+        else:
+            tracing.stop()
+        dump.setEnabled(enabled)
+
+    def on_dump():
+        if tracing.active is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(parent, "Dump trace", tracing.default_dump_path(), "Chrome trace (*.json)")
+        if path:
+            tracing.dump(path)
+            _status(parent, f"Trace written to {path} (open it in ui.perfetto.dev)")
+
+    record.toggled.connect(on_record)
+    dump.triggered.connect(on_dump)
+    container.addAction(record)
+    container.addAction(dump)
+    return record, dump
+
+
+class _ProfileRun(QObject):
+    done = Signal(object)  # emitted from the profiler thread, delivered on the GUI thread
+
+
+_profile = {"profiler": None, "run": None}  # one profile at a time for the whole app
+
+
+def add_profiler_actions(container, parent):
+    """
+    Adds "Profile N s" (Ctrl+Shift+P) to a QMenu or QToolBar. Pressing it
+    again stops early. Output goes to JMODEL_TRACE_DIR (or the cwd) as
+    .collapsed + .pstats; the hottest function is shown in the status bar.
+    """
+    seconds = float(os.getenv("JMODEL_PROFILE_SECONDS", "10"))
+    action = QAction(f"Profile {seconds:g} s", parent)
+    action.setShortcut(QKeySequence(PROFILE_SHORTCUT))
+    action.setToolTip("Sample the stacks of every thread (capture, inference, GUI) and write flame-graph stacks + pstats")
+
+    def on_done(profiler):
+        prefix = default_output_prefix()
+        collapsed, pstats_path = profiler.write(prefix)
+        _profile["profiler"] = None
+        hottest = profiler.top(1)
+        hot = f"; hottest {hottest[0][0]} ({hottest[0][1]:.0%})" if hottest else ""
+        _status(parent, f"Profile: {profiler.samples} samples -> {collapsed}{hot}")
+        print(f"[profile] {collapsed} {pstats_path or ''}")
+
+    def on_trigger():
+        running = _profile["profiler"]
+        if running is not None:
+            running.stop()
+            return
+        run = _profile["run"] = _ProfileRun()
+        run.done.connect(on_done)
+        profiler = _profile["profiler"] = SamplingProfiler(duration=seconds)
+        profiler.start(on_done=run.done.emit)
+        _status(parent, f"Profiling for {seconds:g} s ({PROFILE_SHORTCUT} again to stop)...")
+
+    action.triggered.connect(on_trigger)
+    container.addAction(action)
+    if parent is not container:
+        parent.addAction(action)  # keeps the shortcut active even from a toolbar
+    return action
+
+
+def _status(parent, text):
+    # A profile outlives the window that started it (WA_DeleteOnClose)
+    if not shiboken6.isValid(parent):
+        print(text)
+        return
+    window = parent.window()
+    if hasattr(window, "statusBar"):
+        window.statusBar().showMessage(text)
+    else:
+        print(text)
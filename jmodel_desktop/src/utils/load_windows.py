@@ -1,4 +1,8 @@
-from PySide6.QtCore import QFile, QIODevice
+import importlib
+import os
+
+from PySide6 import QtWidgets
+from PySide6.QtCore import QFile, QIODevice, QObject
 from PySide6.QtUiTools import QUiLoader
 
 from ..resources import views_rc
@@ -15,4 +19,58 @@ def load_ui(ui_ref: str, parent=None):
     if widget is None:
         raise RuntimeError(f"Failed to load UI: {ui_ref}")
 
-    return widget
\ No newline at end of file
+    return widget
+
+
+class FindChildUi:
+    """
+    Same attribute access as a compiled Ui_* object, for windows loaded at
+    runtime: ui.label_video -> window.findChild(QObject, "label_video").
+    """
+
+    def __init__(self, window):
+        self._window = window
+
+    def __getattr__(self, object_name):
+        if object_name.startswith("_"):
+            raise AttributeError(object_name)
+        widget = self._window.findChild(QObject, object_name)
+        if widget is None:
+            raise RuntimeError(f"Widget not found: {object_name}")
+        setattr(self, object_name, widget)
+        return widget
+
+
+def _compiled_ui_class(name):
+    if os.getenv("JMODEL_RUNTIME_UI"):
+        return None
+    try:
+        from ..resources.ui_registry import UI_CLASSES
+        module_name, class_name, base_name = UI_CLASSES[name]
+        module = importlib.import_module(f"..resources.{module_name}", __package__)
+        return getattr(module, class_name), getattr(QtWidgets, base_name)
+    except (ImportError, KeyError, AttributeError):
+        return None
+
+
+def create_window(name: str, parent=None):
+    """
+    Creates the window for views/<name>.ui and exposes its widgets as typed
+    attributes on `window.ui`.
+
+    Uses the classes generated by utils/build_ui.py; falls back to parsing
+    the .ui from the Qt resources when they are missing (or when
+    JMODEL_RUNTIME_UI is set, handy while editing in Designer).
+    """
+    compiled = _compiled_ui_class(name)
+    if compiled is not None:
+        ui_class, base_class = compiled
+        window = base_class(parent)
+        ui = ui_class()
+        ui.setupUi(window)
+    else:
+        window = load_ui(f":/views/{name}.ui", parent)
+        ui = FindChildUi(window)
+
+    window.ui = ui
+    return window
@@ -0,0 +1,58 @@
+"""
+Startup timing (no Qt, no heavy imports: this is the first thing main.py loads).
+
+Marks are milliseconds since this module was imported. When the
+JMODEL_STARTUP_LOG environment variable is set the report is appended
+as one JSON line to that file ("-" = stderr), so releases can be compared.
+"""
+import json
+import os
+import sys
+import time
+
+_T0 = time.perf_counter()
+
+
+def _process_age_ms():
+    """Time the process had been running when this module was imported (Linux only)."""
+    try:
+        with open("/proc/self/stat", "r") as fh:
+            # Field 22 (starttime) is after the parenthesised command name
+            fields = fh.read().rsplit(")", 1)[1].split()
+        start_ticks = float(fields[19])
+        with open("/proc/uptime", "r") as fh:
+            uptime = float(fh.read().split()[0])
+        return round(max(0.0, (uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000.0), 1)
+    except Exception:
+        return None
+
+
+class StartupTimer:
+    def __init__(self):
+        self.t0 = _T0
+        self.process_age_ms = _process_age_ms()
+        self.marks = {}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = round((time.perf_counter() - self.t0) * 1000.0, 1)
+        return self.marks[name]
+
+    def report(self):
+        data = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python_startup_ms": self.process_age_ms}
+        data.update(self.marks)
+        return data
+
+    def write(self):
+        target = os.getenv("JMODEL_STARTUP_LOG")
+        if not target:
+            return
+        line = json.dumps(self.report())
+        if target == "-":
+            print(f"[startup] {line}", file=sys.stderr)
+            return
+        with open(target, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+startup = StartupTimer()
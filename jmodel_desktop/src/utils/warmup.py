@@ -0,0 +1,61 @@
+import importlib
+import os
+import threading
+
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QWidget
+
+from .startup_timing import startup
+
+# Imported in the background once the first window is on screen, so the
+# first session does not pay for them (ultralytics pulls in torch).
+WARM_MODULES = (
+    "numpy",
+    "cv2",
+    "jmodel_desktop.src.controllers.video_inference_controller",
+    "ultralytics",
+)
+
+
+def warm_imports_async(modules=WARM_MODULES):
+    if os.getenv("JMODEL_NO_WARMUP"):
+        startup.write()
+        return None
+
+    def _warm():
+        startup.mark("warmup_start")
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"[warmup] could not import {name}: {e}")
+            startup.mark(f"warm_{name}")
+        startup.mark("warmup_done")
+        startup.write()
+
+    thread = threading.Thread(target=_warm, name="import-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+class FirstPaintWatcher(QObject):
+    """
+    Records the first Paint event of `window` (or any of its children) and
+    then runs `callback` from the event loop. Installed on the application
+    because the paint may land on a child widget first.
+    """
+
+    def __init__(self, app, window, callback=None):
+        super().__init__(app)
+        self._app = app
+        self._window = window
+        self._callback = callback
+        app.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and isinstance(watched, QWidget) and watched.window() is self._window:
+            self._app.removeEventFilter(self)
+            startup.mark("first_paint")
+            if self._callback is not None:
+                QTimer.singleShot(0, self._callback)
+        return False
@@ -2,12 +2,15 @@ import sys
 import time
 import cv2
 
-from PySide6.QtCore import Qt, Signal, QObject, QThread
+from PySide6.QtCore import Qt, Signal, QObject, QThread, QTimer
 from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QApplication, QLabel, QMainWindow
+from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QSizePolicy
 
 from ultralytics import YOLO
 
+from jmodel_desktop.src.core.frames import resize_to_fit
+from jmodel_desktop.src.core.stats import StatsAggregator
+
 
 # ===== Constantes =====
 OUR_MODEL_ENGINE = "path/a/tu_modelo.engine"  # <-- cambia esto
@@ -17,16 +20,19 @@ WIDTH = 640
 HEIGHT = 480
 
 
-def bgr_to_qpixmap(frame_bgr):
+def bgr_to_qimage(frame_bgr, view_size=None):
+    # Escala una sola vez (INTER_AREA) al tamano del label; el hilo GUI solo pinta
+    frame_bgr = resize_to_fit(frame_bgr, view_size)
+
     frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
     h, w, ch = frame_rgb.shape
     bytes_per_line = ch * w
     qimg = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-    return QPixmap.fromImage(qimg.copy())
+    return qimg.copy()  # copy() para evitar referencias a memoria temporal
 
 
 class CameraWorker(QObject):
-    frame_ready = Signal(QPixmap, float)
+    frame_ready = Signal(QImage)
     error = Signal(str)
     finished = Signal()
 
@@ -36,6 +42,8 @@ class CameraWorker(QObject):
         self.cam_index = cam_index
         self.width = width
         self.height = height
+        self.view_size = None  # (w, h) del label, lo reporta la ventana
+        self.stats = StatsAggregator()  # fps / p50 / p95 por etapa, la ventana lo lee
         self._running = True
 
     def stop(self):
@@ -53,33 +61,25 @@ class CameraWorker(QObject):
 
         try:
             model = YOLO(self.engine_path)
-            prev_time = 0.0
 
             while self._running:
+                t0 = time.perf_counter()
                 ret, frame = cap.read()
                 if not ret:
                     self.error.emit("No se pudo leer frame de la camara")
                     break
 
+                t1 = time.perf_counter()
+                self.stats.stage("capture").record(t1 - t0)
+
                 results = model(frame, verbose=False)[0]
                 annotated = results.plot()
+                t2 = time.perf_counter()
+                self.stats.stage("infer").record(t2 - t1)
 
-                now = time.time()
-                fps = 1.0 / (now - prev_time) if prev_time else 0.0
-                prev_time = now
-
-                cv2.putText(
-                    annotated,
-                    f"FPS: {fps:.1f}",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1.0,
-                    (0, 255, 0),
-                    2,
-                )
-
-                pixmap = bgr_to_qpixmap(annotated)
-                self.frame_ready.emit(pixmap, fps)
+                image = bgr_to_qimage(annotated, self.view_size)
+                self.stats.stage("convert").record(time.perf_counter() - t2)
+                self.frame_ready.emit(image)
 
         except Exception as e:
             self.error.emit(str(e))
@@ -95,6 +95,8 @@ class MainWindow(QMainWindow):
 
         self.label = QLabel("Iniciando cámara...")
         self.label.setAlignment(Qt.AlignCenter)
+        # El pixmap llega ya escalado; Ignored evita que su tamano empuje el layout
+        self.label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.setCentralWidget(self.label)
 
         self._last_pixmap = None
@@ -106,6 +108,7 @@ class MainWindow(QMainWindow):
             width=WIDTH,
             height=HEIGHT,
         )
+        self.worker.view_size = (self.label.width(), self.label.height())
         self.worker.moveToThread(self.thread)
 
         self.thread.started.connect(self.worker.run)
@@ -115,26 +118,30 @@ class MainWindow(QMainWindow):
         self.worker.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(500)
+        self._stats_timer.timeout.connect(self._show_stats)
+        self._stats_timer.start()
+
         self.thread.start()
 
-    def on_frame(self, pixmap: QPixmap, fps: float):
-        self._last_pixmap = pixmap
+    def on_frame(self, image: QImage):
+        self._last_pixmap = QPixmap.fromImage(image)
         self._render()
-        self.setWindowTitle(f"YOLO - PySide6 (OpenCV) | FPS: {fps:.1f}")
+
+    def _show_stats(self):
+        # Barra de estado a ritmo fijo (2 Hz), nada se dibuja sobre el frame
+        self.statusBar().showMessage(self.worker.stats.format_line())
 
     def _render(self):
         if not self._last_pixmap:
             return
-        scaled = self._last_pixmap.scaled(
-            self.label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
-        )
-        self.label.setPixmap(scaled)
+        self.label.setPixmap(self._last_pixmap)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._render()
+        # El worker escala los siguientes frames a este tamano
+        self.worker.view_size = (self.label.width(), self.label.height())
 
     def on_error(self, msg: str):
         self.label.setText(f"Error:\n{msg}")
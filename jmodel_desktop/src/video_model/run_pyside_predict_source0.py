@@ -1,12 +1,15 @@
 import sys
 import time
 
-from PySide6.QtCore import Qt, Signal, QObject, QThread
+from PySide6.QtCore import Qt, Signal, QObject, QThread, QTimer
 from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QApplication, QLabel, QMainWindow
+from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QSizePolicy
 
 from ultralytics import YOLO
 
+from jmodel_desktop.src.core.frames import resize_to_fit
+from jmodel_desktop.src.core.stats import StatsAggregator
+
 
 # ===== Constantes (antes las importabas de constant) =====
 OUR_MODEL_ENGINE = "path/a/tu_modelo.engine"   # <-- cambia esto
@@ -15,20 +18,21 @@ IMGSZ = 640
 SOURCE = 0  # webcam: 0, 1, 2...
 
 
-def bgr_to_qpixmap(frame_bgr):
-    # Ultralytics/plot devuelve BGR (tipo OpenCV)
-    # Qt necesita RGB
+def bgr_to_qimage(frame_bgr, view_size=None):
+    # Escala una sola vez (INTER_AREA) al tamano del label; el hilo GUI solo pinta
     import cv2  # import local para que este archivo funcione aunque no uses cv2 directo arriba
 
+    frame_bgr = resize_to_fit(frame_bgr, view_size)
+
     frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
     h, w, ch = frame_rgb.shape
     bytes_per_line = ch * w
     qimg = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-    return QPixmap.fromImage(qimg.copy())  # copy() para evitar referencias a memoria temporal
+    return qimg.copy()  # copy() para evitar referencias a memoria temporal
 
 
 class PredictWorker(QObject):
-    frame_ready = Signal(QPixmap, float)  # pixmap, fps
+    frame_ready = Signal(QImage)
     error = Signal(str)
     finished = Signal()
 
@@ -38,6 +42,8 @@ class PredictWorker(QObject):
         self.source = source
         self.imgsz = imgsz
         self.conf = conf
+        self.view_size = None  # (w, h) del label, lo reporta la ventana
+        self.stats = StatsAggregator()  # fps / p50 / p95 por etapa, la ventana lo lee
         self._running = True
 
     def stop(self):
@@ -56,21 +62,21 @@ class PredictWorker(QObject):
                 verbose=False,
             )
 
-            prev_time = 0.0
-
+            t_wait = time.perf_counter()
             for results in stream:
                 if not self._running:
                     break
+                # predict(stream=True) lee, preprocesa e infiere junto
+                self.stats.stage("predict").record(time.perf_counter() - t_wait)
 
                 # results es un objeto Results (para 1 frame)
                 annotated = results.plot()  # numpy BGR
 
-                now = time.time()
-                fps = 1.0 / (now - prev_time) if prev_time else 0.0
-                prev_time = now
-
-                pixmap = bgr_to_qpixmap(annotated)
-                self.frame_ready.emit(pixmap, fps)
+                t0 = time.perf_counter()
+                image = bgr_to_qimage(annotated, self.view_size)
+                self.stats.stage("convert").record(time.perf_counter() - t0)
+                self.frame_ready.emit(image)
+                t_wait = time.perf_counter()
 
         except Exception as e:
             self.error.emit(str(e))
@@ -85,6 +91,8 @@ class MainWindow(QMainWindow):
 
         self.label = QLabel("Iniciando...")
         self.label.setAlignment(Qt.AlignCenter)
+        # El pixmap llega ya escalado; Ignored evita que su tamano empuje el layout
+        self.label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.setCentralWidget(self.label)
 
         self._last_pixmap = None
@@ -96,6 +104,7 @@ class MainWindow(QMainWindow):
             imgsz=IMGSZ,
             conf=CONF,
         )
+        self.worker.view_size = (self.label.width(), self.label.height())
         self.worker.moveToThread(self.thread)
 
         self.thread.started.connect(self.worker.run)
@@ -105,28 +114,30 @@ class MainWindow(QMainWindow):
         self.worker.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(500)
+        self._stats_timer.timeout.connect(self._show_stats)
+        self._stats_timer.start()
+
         self.thread.start()
 
-    def on_frame(self, pixmap: QPixmap, fps: float):
-        self._last_pixmap = pixmap
+    def on_frame(self, image: QImage):
+        self._last_pixmap = QPixmap.fromImage(image)
         self._render()
 
-        # título con FPS
-        self.setWindowTitle(f"YOLO - PySide6 (predict) | FPS: {fps:.1f}")
+    def _show_stats(self):
+        # Barra de estado a ritmo fijo (2 Hz), nada se dibuja sobre el frame
+        self.statusBar().showMessage(self.worker.stats.format_line())
 
     def _render(self):
         if not self._last_pixmap:
             return
-        scaled = self._last_pixmap.scaled(
-            self.label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
-        )
-        self.label.setPixmap(scaled)
+        self.label.setPixmap(self._last_pixmap)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._render()
+        # El worker escala los siguientes frames a este tamano
+        self.worker.view_size = (self.label.width(), self.label.height())
 
     def on_error(self, msg: str):
         self.label.setText(f"Error:\n{msg}")